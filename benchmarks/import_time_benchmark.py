@@ -0,0 +1,67 @@
+"""Measure the cold import time of the sdk against a budget.
+
+Run with `PYTHONPATH=src python benchmarks/import_time_benchmark.py`. It
+exits with status 1 when the median import time exceeds the budget or when
+an extension package is imported before its first use.
+"""
+from argparse import ArgumentParser
+from statistics import median
+from subprocess import check_output  # noqa: S404
+from sys import executable, exit  # noqa: WPS433
+from typing import List, Tuple
+
+DEFAULT_RUNS = 10
+DEFAULT_BUDGET = 250  # in milliseconds
+IMPORT_SCRIPT = """
+import sys
+from time import perf_counter
+started_at = perf_counter()
+from blip_sdk import ClientBuilder
+elapsed = (perf_counter() - started_at) * 1000
+extensions = [
+    name for name in sys.modules
+    if name.startswith('blip_sdk.extensions.') and
+    name.count('.') == 2 and
+    name.rsplit('.', 1)[1] not in {
+        'extension_base', 'extension_loader', 'uri_templates'
+    }
+]
+print(elapsed, ','.join(extensions))
+"""
+
+
+def measure_import() -> Tuple[float, List[str]]:
+    """Import the sdk in a new interpreter.
+
+    Returns:
+        Tuple[float, List[str]]: the import time in milliseconds and the
+            extension packages imported
+    """
+    output = check_output([executable, '-c', IMPORT_SCRIPT], text=True)  # noqa: S603, E501
+    elapsed, extensions = output.strip().partition(' ')[::2]
+    return float(elapsed), [name for name in extensions.split(',') if name]
+
+
+def main() -> None:
+    """Print the import times and check them against the budget."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET)
+    arguments = parser.parse_args()
+
+    results = [measure_import() for _ in range(arguments.runs)]
+    times = [elapsed for elapsed, _ in results]
+    extensions = sorted({name for _, names in results for name in names})
+    print(
+        f'import blip_sdk: median {median(times):.1f} ms, ' +
+        f'min {min(times):.1f} ms, max {max(times):.1f} ms ' +
+        f'(budget {arguments.budget:.0f} ms)'
+    )
+    if extensions:
+        print(f'eagerly imported extensions: {", ".join(extensions)}')
+    if extensions or median(times) > arguments.budget:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Compare the available json codecs on realistic envelopes.
+
+Run with `PYTHONPATH=src python benchmarks/json_codec_benchmark.py`.
+"""
+from timeit import repeat
+from typing import Any, Callable, Dict
+
+from lime_python import Command, CommandStatus, Message
+
+from blip_sdk.serialization import JSON_CODECS, get_json_codec
+
+NUMBER = 1000
+REPEAT = 5
+THREAD_SIZE = 50
+COLLECTION_SIZE = 100
+
+
+def create_select_message() -> Dict[str, Any]:
+    """Create a document select message.
+
+    Returns:
+        Dict[str, Any]: the message json
+    """
+    return Message.from_json({
+        'id': 'a7c1d8e2-0f2b-4f6e-9c1f-6b8a3c2d1e0f',
+        'to': '5511999999999@wa.gw.msging.net',
+        'type': 'application/vnd.lime.document-select+json',
+        'content': {
+            'header': {
+                'type': 'text/plain',
+                'value': 'Olá! Como posso ajudar você hoje?'
+            },
+            'options': [
+                {
+                    'label': {'type': 'text/plain', 'value': label},
+                    'value': {'type': 'text/plain', 'value': str(index)}
+                }
+                for index, label in enumerate(
+                    ('Segunda via', 'Falar com atendente', 'Cancelar')
+                )
+            ]
+        },
+        'metadata': {'#stateName': 'menu', '#stateId': 'onboarding'}
+    }).to_json()
+
+
+def create_contacts_command() -> Dict[str, Any]:
+    """Create a contacts collection result command.
+
+    Returns:
+        Dict[str, Any]: the command json
+    """
+    return Command.from_json({
+        'id': 'b1e7f9a0-3c4d-4e5f-8a9b-0c1d2e3f4a5b',
+        'from': 'postmaster@crm.msging.net/#az-iris1',
+        'to': 'bot@msging.net/default',
+        'method': 'get',
+        'status': CommandStatus.SUCCESS,
+        'type': 'application/vnd.lime.collection+json',
+        'resource': {
+            'total': COLLECTION_SIZE,
+            'itemType': 'application/vnd.lime.contact+json',
+            'items': [
+                {
+                    'identity': f'55119{index:08d}@wa.gw.msging.net',
+                    'name': f'Contato {index}',
+                    'email': f'contato{index}@example.com',
+                    'lastMessageDate': '2021-03-01T12:34:56.789Z',
+                    'extras': {'plan': 'premium', 'city': 'Belo Horizonte'}
+                }
+                for index in range(COLLECTION_SIZE)
+            ]
+        }
+    }).to_json()
+
+
+def create_thread_command() -> Dict[str, Any]:
+    """Create a thread history result command.
+
+    Returns:
+        Dict[str, Any]: the command json
+    """
+    return Command.from_json({
+        'id': 'c2f8a0b1-4d5e-4f60-9b0c-1d2e3f4a5b6c',
+        'from': 'postmaster@msging.net/#az-iris2',
+        'to': 'bot@msging.net/default',
+        'method': 'get',
+        'status': CommandStatus.SUCCESS,
+        'type': 'application/vnd.lime.collection+json',
+        'resource': {
+            'total': THREAD_SIZE,
+            'itemType': 'application/vnd.iris.thread-message+json',
+            'items': [
+                {
+                    'id': f'message-{index}',
+                    'direction': 'sent' if index % 2 else 'received',
+                    'type': 'text/plain',
+                    'content': f'Mensagem número {index} da conversa',
+                    'date': '2021-03-01T12:34:56.789Z',
+                    'status': 'consumed',
+                    'metadata': {'#messageKind': 'Response'}
+                }
+                for index in range(THREAD_SIZE)
+            ]
+        }
+    }).to_json()
+
+
+def measure(action: Callable[[], Any]) -> float:
+    """Measure the best time of an action.
+
+    Args:
+        action (Callable[[], Any]): the action
+
+    Returns:
+        float: the best time per call in microseconds
+    """
+    return min(repeat(action, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    """Print the encode and decode time of each codec and payload."""
+    payloads = {
+        'select message': create_select_message(),
+        'contacts collection': create_contacts_command(),
+        'thread history': create_thread_command()
+    }
+    print(f'{"payload":<20} {"codec":<8} {"encode us":>10} {"decode us":>10}')
+    for payload_name, payload in payloads.items():
+        for codec_name in JSON_CODECS:
+            codec = get_json_codec(codec_name)
+            raw_payload = codec.encode(payload)
+            encode_time = measure(lambda: codec.encode(payload))
+            decode_time = measure(lambda: codec.decode(raw_payload))
+            print(
+                f'{payload_name:<20} {codec_name:<8} ' +
+                f'{encode_time:>10.1f} {decode_time:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Compare the Router text search loop to a single alternation search.
+
+The alternation time is a lower bound, it doesn't resolve the patterns
+matched out of registration order.
+
+Run with `PYTHONPATH=src python benchmarks/router_benchmark.py`.
+"""
+import re
+from timeit import repeat
+from typing import Any, Callable, List, Pattern
+
+from lime_python import Message
+
+from blip_sdk import Router
+
+NUMBER = 1000
+REPEAT = 5
+PATTERN_COUNTS = (10, 50)
+FILLER = 'Olá, eu gostaria de saber mais sobre o meu pedido de ontem. ' * 4
+
+
+def create_patterns(count: int) -> List[str]:
+    """Create keyword patterns like the ones of a menu bot.
+
+    Args:
+        count (int): the number of patterns
+
+    Returns:
+        List[str]: the patterns
+    """
+    return [f'\\b(?:opção|opcao) {index}\\b' for index in range(count)]
+
+
+def create_alternation(patterns: List[str]) -> Pattern:
+    """Join the patterns into a single alternation of named groups.
+
+    Args:
+        patterns (List[str]): the patterns
+
+    Returns:
+        Pattern: the alternation
+    """
+    return re.compile('|'.join(
+        f'(?P<p{index}>{pattern})' for index, pattern in enumerate(patterns)
+    ))
+
+
+def measure(action: Callable[[], Any]) -> float:
+    """Measure the best time of an action.
+
+    Args:
+        action (Callable[[], Any]): the action
+
+    Returns:
+        float: the best time per call in microseconds
+    """
+    return min(repeat(action, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    """Print the matching time of each pattern count and text."""
+    print(f'{"patterns":>8} {"text":<12} {"router us":>10} {"alter us":>10}')
+    for count in PATTERN_COUNTS:
+        patterns = create_patterns(count)
+        alternation = create_alternation(patterns)
+        router = Router()
+        for pattern in patterns:
+            router.text(pattern)(print)
+
+        texts = {
+            'no match': FILLER,
+            'first': f'{FILLER} opção 0',
+            'last': f'{FILLER} opção {count - 1}',
+            'out of order': f'opção {count - 1} {FILLER} opção 0'
+        }
+        for text_name, text in texts.items():
+            router_time = measure(
+                lambda: router.route(Message('text/plain', text))
+            )
+            alternation_time = measure(lambda: alternation.search(text))
+            print(
+                f'{count:>8} {text_name:<12} ' +
+                f'{router_time:>10.1f} {alternation_time:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
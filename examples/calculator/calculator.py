@@ -1,10 +1,9 @@
 import asyncio
-import re
 
 from lime_python import Command, Identity, Message
 from lime_transport_websocket import WebSocketTransport
 
-from blip_sdk import ClientBuilder, Receiver
+from blip_sdk import ClientBuilder, Router
 
 IDENTIFIER = 'botnotificacaoworkchat'
 ACCESS_KEY = 'aGlhYmVFd3VWRThXV1hzNWJxYW0='
@@ -13,29 +12,40 @@ CALCULUS_PATTERN = '^[0-9]+(\s)?(\/|\+|-|\*)(\s)?[0-9]+$'
 client = ClientBuilder() \
     .with_identifier(IDENTIFIER) \
     .with_access_key(ACCESS_KEY) \
+    .with_ordered_conversations(True) \
     .with_transport_factory(lambda: WebSocketTransport()) \
     .build()
 
 
+router = Router()
+
+
 async def main_async():
 
     await client.connect_async()
-    client.add_message_receiver(
-        Receiver(message_predicate, message_processor_async)
-    )
+    router.attach(client)
 
 
-def message_predicate(message: Message) -> bool:
-    return message.type_n != 'application/vnd.lime.chatstate+json'
+@router.type('application/vnd.lime.chatstate+json')
+def ignore_chatstate(message: Message) -> None:
+    pass
 
 
+@router.text(CALCULUS_PATTERN)
+async def calculator_async(message: Message) -> None:
+    user_id = Identity.parse_str(message.from_n)
+    try:
+        await calculates_response_async(message.content, user_id)
+    except:
+        unexpected_error(user_id)
+
+
+@router.default()
 async def message_processor_async(message: Message) -> None:
     user_id = Identity.parse_str(message.from_n)
     user_state = await get_context_async(user_id, 'user-state')
     try:
-        if is_in_pattern(message.content):
-            await calculates_response_async(message.content, user_id)
-        elif user_state in ['no_content', '0']:
+        if user_state in ['no_content', '0']:
             await calculator_menu_async(user_id)
         else:
             exception(user_id, message.content)
@@ -126,10 +136,6 @@ async def get_context_async(
     return 'no_content'
 
 
-def is_in_pattern(message_content: str) -> bool:
-    return re.search(CALCULUS_PATTERN, message_content)
-
-
 async def calculates_response_async(message_content: str, user_id: Identity) -> None:
     response = eval(message_content)
     send_message_with_composing(
@@ -24,6 +24,9 @@ setup(
         'sdk'
     ],
     install_requires=['lime-python'],
+    extras_require={
+        'websocket': ['lime-transport-websocket']
+    },
     long_description=long_description,
     long_description_content_type='text/markdown',
     classifiers=[
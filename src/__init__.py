@@ -1,5 +1,17 @@
 from .blip_sdk import (
     Application,
     AIExtension, AnalyticsExtension, ExtensionBase, ChatExtension,
-    ContextsExtension, MediaExtension, Client, ClientBuilder, Receiver
+    ContextsExtension, MediaExtension, Client, ClientBuilder, Receiver,
+    ReconnectionMetrics, ReconnectionSupervisor, DispatchTable,
+    OverflowPolicy, ReceiverWorkerPool, ConversationDispatcher,
+    AcknowledgementEngine, ConnectionLatency, ClientPool, ThreadedClient,
+    ExecutionMode, ShardedProcessRunner, WorkerClient, DrainProgress,
+    OutboundFlowControl, RateLimiter, RateLimiterStatistics, TokenBucket,
+    OutboundPriority, PriorityScheduler, DeduplicationStore,
+    LruDeduplicationStore, SqliteDeduplicationStore, RetryBudget,
+    RetryPolicy, RetryStatistics, UriTemplateMatcher, Circuit, CircuitBreaker,
+    CircuitOpenError, CircuitState, HedgingPolicy, HedgingStatistics,
+    OfflineOutbox, SingleFlight, ResponseCache, LazyMessage,
+    JsonCodec, OrjsonCodec, UjsonCodec, get_json_codec, Router,
+    CodecWebSocketTransport
 )
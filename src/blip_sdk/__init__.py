@@ -1,6 +1,30 @@
 from .application import Application
-from .extensions import (AnalyticsExtension, AIExtension, ContextsExtension,
-                         ExtensionBase, ChatExtension, MediaExtension)
+from .connection import (ConnectionLatency, DrainProgress, OfflineOutbox,
+                         ReconnectionMetrics, ReconnectionSupervisor)
+from .dispatching import (AcknowledgementEngine, ConversationDispatcher,
+                          DeduplicationStore, DispatchTable,
+                          LruDeduplicationStore, OverflowPolicy,
+                          ReceiverWorkerPool, Router,
+                          SqliteDeduplicationStore)
+from .extensions import EXTENSION_MODULES, ExtensionBase, load_extension
 from .client import Client
+from .client_pool import ClientPool
+from .commands import (Circuit, CircuitBreaker, CircuitOpenError,
+                       CircuitState, HedgingPolicy, HedgingStatistics,
+                       ResponseCache, RetryBudget, RetryPolicy,
+                       RetryStatistics, SingleFlight, UriTemplateMatcher)
+from .threaded_client import ThreadedClient
 from .client_builder import ClientBuilder
-from .receiver import Receiver
+from .outbound import (OutboundFlowControl, OutboundPriority,
+                       PriorityScheduler, RateLimiter, RateLimiterStatistics,
+                       TokenBucket)
+from .receiver import ExecutionMode, Receiver
+from .serialization import (CodecWebSocketTransport, JsonCodec, LazyMessage,
+                            OrjsonCodec, UjsonCodec, get_json_codec)
+from .sharding import ShardedProcessRunner, WorkerClient
+
+
+def __getattr__(name: str):
+    if name in EXTENSION_MODULES:
+        return load_extension(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,10 +1,15 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Set, Type
 from uuid import uuid4
 
 from lime_python import (Authentication, GuestAuthentication,
                          SessionCompression, SessionEncryption)
 
+from .commands import (CircuitBreaker, HedgingPolicy, ResponseCache,
+                       RetryPolicy)
+from .dispatching import DeduplicationStore, OverflowPolicy
+from .serialization import JsonCodec
+
 
 @dataclass
 class Application:
@@ -24,6 +29,37 @@ class Application:
             'routingRule': 'identity'
         }
     )
+    notify_received: bool = True
     notify_consumed: bool = True
     authentication: Authentication = GuestAuthentication()
     command_timeout: int = 6  # in seconds
+    command_retry_policy: RetryPolicy = None  # no retries by default
+    command_circuit_breaker: CircuitBreaker = None  # disabled by default
+    command_hedging_policy: HedgingPolicy = None  # disabled by default
+    coalesced_extensions: Set[Type] = field(default_factory=set)
+    response_cache: ResponseCache = None  # disabled by default
+    skip_unchanged_bootstrap: bool = False
+    drain_timeout: float = None  # in seconds, None to close without drain
+    outbound_high_water_envelopes: int = 1000  # 0 to disable
+    outbound_high_water_bytes: int = 0  # 0 to disable
+    outbound_write_buffer_high_water: int = 16384  # 0 to disable
+    outbound_priority_weights: Dict[str, int] = None
+    rate_limit_global: float = None  # in envelopes per second
+    rate_limit_per_destination: float = None
+    rate_limit_per_postmaster: float = None
+    rate_limit_burst: int = None  # the bucket rate by default
+    reconnection_base_delay: float = 0.1  # in seconds
+    reconnection_max_delay: float = 30  # in seconds
+    reconnection_jitter: float = 0.2  # fraction of the delay
+    offline_outbox_size: int = None  # disabled by default
+    offline_outbox_ttl: float = 30  # in seconds
+    offline_outbox_overflow_policy: str = OverflowPolicy.DROP_OLDEST
+    receiver_max_concurrency: int = None  # unbounded by default
+    receiver_queue_size: int = None  # unbounded by default
+    receiver_overflow_policy: str = OverflowPolicy.BLOCK
+    ordered_conversations: bool = False
+    lazy_envelopes: bool = False
+    json_codec: JsonCodec = None  # transport default
+    message_deduplication_store: DeduplicationStore = None  # disabled
+    receiver_thread_pool_size: int = None  # executor default size
+    receiver_process_pool_size: int = None  # executor default size
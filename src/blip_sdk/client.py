@@ -1,19 +1,45 @@
-from asyncio import Future, ensure_future, get_event_loop, iscoroutinefunction
-from time import sleep
-from typing import Any, Awaitable, Callable, Dict, List, Type
-
-from lime_python import (ClientChannel, Command, CommandMethod, Envelope,
-                         GuestAuthentication, KeyAuthentication, Message,
-                         Notification, NotificationEvent, PlainAuthentication,
-                         Reason, ReasonCode, Session, SessionState, Transport)
+from asyncio import (Future, QueueFull, gather, get_event_loop,
+                     iscoroutinefunction, isfuture, sleep)
+from collections import deque
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from copy import deepcopy
+from functools import partial
+from time import perf_counter
+from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict,
+                    List, Tuple)
+
+from lime_python import (ClientChannel, Command, CommandMethod,
+                         CommandStatus, Envelope, GuestAuthentication,
+                         KeyAuthentication, Message, Notification,
+                         NotificationEvent, PlainAuthentication, Session,
+                         SessionState, Transport)
 
 from .application import Application
-from .extensions import (AIExtension, AnalyticsExtension, ChatExtension,
-                         ContextsExtension, ExtensionBase, MediaExtension)
-from .receiver import Receiver
-from .utilities import ClassUtilities
+from .connection import (ConnectionLatency, DrainProgress, OfflineOutbox,
+                         ReconnectionMetrics, ReconnectionSupervisor)
+from .dispatching import (AcknowledgementEngine, ConversationDispatcher,
+                          DeduplicationStore, DispatchTable,
+                          ReceiverWorkerPool)
+from .outbound import OutboundFlowControl, OutboundPriority, RateLimiter
+from .extensions import ExtensionBase, load_extension
+from .receiver import ExecutionMode, Receiver
+from .serialization import LazyMessage
+from .utilities import ClassUtilities, EnvelopeUtilities
+
+if TYPE_CHECKING:
+    from .extensions import (AIExtension, AnalyticsExtension, ChatExtension,
+                             ContextsExtension, MediaExtension)
 
 MAX_CONNECTION_TRY_COUNT = 10
+DRAIN_POLLING_INTERVAL = 0.1  # in seconds
+RECEIPT_EVENTS = (
+    NotificationEvent.FAILED,
+    NotificationEvent.ACCEPTED,
+    NotificationEvent.DISPATCHED,
+    NotificationEvent.RECEIVED,
+    NotificationEvent.CONSUMED
+)
 
 
 class Client:
@@ -33,9 +59,49 @@ class Client:
         )
 
         self.session_future: Future = None
-        self.__message_receivers: List[Receiver] = []
-        self.__notification_receivers: List[Receiver] = []
-        self.__command_receivers: List[Receiver] = []
+        self.connection_latency = ConnectionLatency()
+        self.__message_receivers = DispatchTable()
+        self.__notification_receivers = DispatchTable()
+        self.__command_receivers = DispatchTable()
+        self.__receiver_pool = ReceiverWorkerPool(
+            self.application.receiver_max_concurrency,
+            self.application.receiver_queue_size,
+            self.application.receiver_overflow_policy
+        )
+        self.__receiver_pool.on_saturation_changed = \
+            self.__on_receivers_saturation_changed
+        self.__conversation_dispatcher = ConversationDispatcher(
+            self.__receiver_pool
+        )
+        self.__held_envelopes: Deque[Envelope] = deque()
+        self.__deduplicating: Dict[str, Future] = {}
+        self.__reading_paused = False
+        self.__executors: Dict[str, Executor] = {}
+        self.__outbound_flow_control = OutboundFlowControl(
+            self.application.outbound_high_water_envelopes,
+            self.application.outbound_high_water_bytes,
+            self.__get_transport_buffer_size,
+            self.application.outbound_priority_weights,
+            self.application.outbound_write_buffer_high_water
+        )
+        self.__offline_outbox: OfflineOutbox = None
+        if self.application.offline_outbox_size:
+            self.__offline_outbox = OfflineOutbox(
+                self.application.offline_outbox_size,
+                self.application.offline_outbox_ttl,
+                self.application.offline_outbox_overflow_policy
+            )
+        self.__rate_limiter = RateLimiter(
+            self.application.rate_limit_global,
+            self.application.rate_limit_per_destination,
+            self.application.rate_limit_per_postmaster,
+            self.application.rate_limit_burst
+        )
+        self.__acknowledgement_engine = AcknowledgementEngine(
+            self.__send_receipts,
+            self.application.notify_received,
+            self.application.notify_consumed
+        )
         self.__command_resolves: Dict[str, Callable] = {}
         self.__session_finished_handlers: List[Callable[[Session], None]] = []
         self.__session_failed_handlers: List[Callable[[Session], None]] = []
@@ -43,7 +109,19 @@ class Client:
         self.uri: str = uri
         self.__listening: bool = False
         self.__closing: bool = False
+        self.__draining: bool = False
+        self.__pending_commands: int = 0
         self.__connection_try_count: int = 0
+        self.__bootstrapped: Tuple[Any, ...] = None
+        self.__reconnection_supervisor = ReconnectionSupervisor(
+            self.__reconnect_async,
+            self.application.reconnection_base_delay,
+            self.application.reconnection_max_delay,
+            self.application.reconnection_jitter,
+            MAX_CONNECTION_TRY_COUNT
+        )
+        self.__reconnection_supervisor.on_failed = \
+            self.__on_reconnection_failed
 
         if isinstance(transport_factory, Transport):
             transport_factory = lambda: transport_factory
@@ -53,36 +131,67 @@ class Client:
 
         self.client_channel: ClientChannel = None
 
-        self.__extensions: Dict[Type, ExtensionBase] = {}
+        self.__extensions: Dict[str, ExtensionBase] = {}
 
         self.__initialize_client_channel()
 
     @property
-    def chat_extension(self) -> ChatExtension:  # noqa: D102
-        return self.__get_extension(ChatExtension)
+    def chat_extension(self) -> 'ChatExtension':  # noqa: D102
+        return self.__get_extension('ChatExtension')
 
     @property
-    def media_extension(self) -> MediaExtension:  # noqa: D102
-        return self.__get_extension(MediaExtension, self.application.domain)
+    def media_extension(self) -> 'MediaExtension':  # noqa: D102
+        return self.__get_extension(
+            'MediaExtension',
+            self.application.domain
+        )
 
     @property
-    def ai_extension(self) -> AIExtension:  # noqa: D102
-        return self.__get_extension(AIExtension, self.application.domain)
+    def ai_extension(self) -> 'AIExtension':  # noqa: D102
+        return self.__get_extension('AIExtension', self.application.domain)
 
     @property
-    def analytics_extension(self) -> AnalyticsExtension:  # noqa: D102
+    def analytics_extension(self) -> 'AnalyticsExtension':  # noqa: D102
         return self.__get_extension(
-            AnalyticsExtension,
+            'AnalyticsExtension',
             self.application.domain
         )
 
     @property
-    def context_extension(self) -> ContextsExtension:  # noqa: D102
+    def context_extension(self) -> 'ContextsExtension':  # noqa: D102
         return self.__get_extension(
-            ContextsExtension,
+            'ContextsExtension',
             self.application.domain
         )
 
+    @property
+    def reconnection_metrics(self) -> ReconnectionMetrics:  # noqa: D102
+        return self.__reconnection_supervisor.metrics
+
+    @property
+    def receiver_pool(self) -> ReceiverWorkerPool:  # noqa: D102
+        return self.__receiver_pool
+
+    @property
+    def conversation_dispatcher(self) -> ConversationDispatcher:  # noqa: D102, E501
+        return self.__conversation_dispatcher
+
+    @property
+    def acknowledgement_engine(self) -> AcknowledgementEngine:  # noqa: D102
+        return self.__acknowledgement_engine
+
+    @property
+    def outbound_flow_control(self) -> OutboundFlowControl:  # noqa: D102
+        return self.__outbound_flow_control
+
+    @property
+    def offline_outbox(self) -> OfflineOutbox:  # noqa: D102
+        return self.__offline_outbox
+
+    @property
+    def rate_limiter(self) -> RateLimiter:  # noqa: D102
+        return self.__rate_limiter
+
     @property
     def listening(self) -> bool:  # noqa: D102
         return self.__listening
@@ -188,9 +297,17 @@ class Client:
                 and refresh the page.')
 
         self.__connection_try_count += 1
+        session = await self.__open_session_async()
+        self.__connection_try_count = 0
+        return session
+
+    async def __open_session_async(self) -> Session:
         self.__closing = False
+        self.__draining = False
 
+        started_at = perf_counter()
         await self.transport.open_async(self.uri)
+        opened_at = perf_counter()
         session = await self.client_channel.establish_session_async(
             self.application.compression,
             self.application.encryption,
@@ -198,21 +315,71 @@ class Client:
             self.application.authentication,
             self.application.instance
         )
-        await self.__send_presence_command_async()
-        await self.__send_receipts_command_async()
+        established_at = perf_counter()
+        if self.__offline_outbox is not None:
+            self.__offline_outbox.flush(self.__send_envelope)
+        await self.__bootstrap_session_async()
+
+        self.connection_latency = ConnectionLatency(
+            opened_at - started_at,
+            established_at - opened_at,
+            perf_counter() - established_at
+        )
 
         self.listening = True
-        self.__connection_try_count = 0
-
         return session
 
-    async def close_async(self) -> Session:
+    async def drain_async(self, timeout: float = None) -> DrainProgress:
+        """Stop handling new envelopes and wait for the in-flight work.
+
+        The progress is reported to `on_drain_progress` while waiting.
+
+        Args:
+            timeout (float): max time to wait, in seconds
+
+        Returns:
+            DrainProgress: the work still in flight after draining
+        """
+        self.__draining = True
+        self.__held_envelopes.clear()
+        started_at = perf_counter()
+        progress = self.__get_drain_progress(0)
+        self.on_drain_progress(progress)
+
+        while progress.remaining and (
+            timeout is None or progress.elapsed < timeout
+        ):
+            await sleep(DRAIN_POLLING_INTERVAL)
+            progress = self.__get_drain_progress(perf_counter() - started_at)
+            self.on_drain_progress(progress)
+
+        self.__acknowledgement_engine.flush()
+        await self.__outbound_flow_control.join_async(
+            self.application.command_timeout
+        )
+        return progress
+
+    async def close_async(self, drain_timeout: float = None) -> Session:
         """Close the open connection.
 
+        Args:
+            drain_timeout (float): if set, drain the in-flight work for up to
+                this time before finishing the session
+
         Returns:
             Session: the closed session
         """
+        drain_timeout = drain_timeout if drain_timeout is not None \
+            else self.application.drain_timeout
+        if drain_timeout is not None and \
+                self.client_channel.state == SessionState.ESTABLISHED:
+            await self.drain_async(drain_timeout)
+
         self.__closing = True
+        self.__reconnection_supervisor.cancel()
+        self.__shutdown_executors()
+        if self.__offline_outbox is not None:
+            self.__offline_outbox.clear()
 
         if self.client_channel.state == SessionState.ESTABLISHED:
             return await self.client_channel.send_finishing_session_async()
@@ -246,6 +413,9 @@ class Client:
         Args:
             message (Message): Message to be sent
         """
+        if self.__is_offline():
+            self.__offline_outbox.add(message)
+            return
         self.client_channel.send_message(message)
 
     def send_notification(self, notification: Notification) -> None:
@@ -254,16 +424,85 @@ class Client:
         Args:
             notification (Notification): Notification to be sent
         """
+        if self.__is_offline():
+            self.__offline_outbox.add(notification)
+            return
         self.client_channel.send_notification(notification)
 
+    def send_notifications(self, notifications: List[Notification]) -> None:
+        """Send a batch of notifications in order, in the same tick.
+
+        Args:
+            notifications (List[Notification]): Notifications to be sent
+        """
+        for notification in notifications:
+            self.send_notification(notification)
+
     def send_command(self, command: Command) -> None:
         """Send a command.
 
         Args:
             command (Command): Command to be sent
         """
+        if self.__is_offline():
+            self.__offline_outbox.add(command)
+            return
         self.client_channel.send_command(command)
 
+    async def send_message_async(
+        self,
+        message: Message,
+        priority: str = None
+    ) -> None:
+        """Send a Message, waiting while the outbound queue is full.
+
+        Args:
+            message (Message): Message to be sent
+            priority (str): OutboundPriority class, INTERACTIVE by default
+        """
+        await self.__rate_limiter.acquire_async(message)
+        await self.__outbound_flow_control.send_async(
+            message,
+            self.send_message,
+            priority
+        )
+
+    async def send_notification_async(
+        self,
+        notification: Notification,
+        priority: str = None
+    ) -> None:
+        """Send a Notification, waiting while the outbound queue is full.
+
+        Args:
+            notification (Notification): Notification to be sent
+            priority (str): OutboundPriority class, NOTIFICATION by default
+        """
+        await self.__rate_limiter.acquire_async(notification)
+        await self.__outbound_flow_control.send_async(
+            notification,
+            self.send_notification,
+            priority
+        )
+
+    async def send_command_async(
+        self,
+        command: Command,
+        priority: str = None
+    ) -> None:
+        """Send a Command, waiting while the outbound queue is full.
+
+        Args:
+            command (Command): Command to be sent
+            priority (str): OutboundPriority class, COMMAND by default
+        """
+        await self.__rate_limiter.acquire_async(command)
+        await self.__outbound_flow_control.send_async(
+            command,
+            self.send_command,
+            priority
+        )
+
     async def process_command_async(
         self,
         command: Command,
@@ -279,10 +518,26 @@ class Client:
             Command: The result Command
         """
         timeout = timeout if timeout else self.application.command_timeout
-        return await self.client_channel.process_command_async(
-            command,
-            timeout
-        )
+        circuit_breaker = self.application.command_circuit_breaker
+        self.__pending_commands += 1
+        self.__update_reading()
+        try:
+            if circuit_breaker is None:
+                return await self.__process_command_with_retries_async(
+                    command,
+                    timeout
+                )
+            return await circuit_breaker.execute_async(
+                EnvelopeUtilities.get_identity(command.to),
+                command,
+                partial(
+                    self.__process_command_with_retries_async,
+                    timeout=timeout
+                )
+            )
+        finally:
+            self.__pending_commands -= 1
+            self.__update_reading()
 
     def process_command(
         self,
@@ -317,7 +572,7 @@ class Client:
 
     def clear_message_receivers(self) -> None:
         """Remove all message receivers."""
-        self.__message_receivers = []
+        self.__message_receivers = DispatchTable()
 
     def add_command_receiver(self, receiver: Receiver) -> Callable[[], None]:
         """Add a command receiver.
@@ -332,7 +587,7 @@ class Client:
 
     def clear_command_receivers(self) -> None:
         """Remove all command receivers."""
-        self.__command_receivers = []
+        self.__command_receivers = DispatchTable()
 
     def add_notification_receiver(
         self,
@@ -350,7 +605,7 @@ class Client:
 
     def clear_notification_receivers(self) -> None:
         """Remove all notification receivers."""
-        self.__notification_receivers = []
+        self.__notification_receivers = DispatchTable()
 
     def add_session_finished_handler(
         self,
@@ -398,6 +653,26 @@ class Client:
         """
         pass
 
+    def on_reconnection_failed(self, error: ConnectionError) -> None:
+        """Handle callback to the reconnection giving up.
+
+        This method can be overwrited.
+
+        Args:
+            error (ConnectionError): the reconnection error
+        """
+        pass
+
+    def on_drain_progress(self, progress: DrainProgress) -> None:
+        """Handle callback to drain progress changes.
+
+        This method can be overwrited.
+
+        Args:
+            progress (DrainProgress): the work still in flight
+        """
+        pass
+
     def __initialize_client_channel(self) -> None:
         """Initialize client channel listeners."""
         self.transport.on_close = self.__transport_on_close
@@ -410,6 +685,9 @@ class Client:
         self.client_channel.on_command = self.__client_channel_on_command
         self.client_channel.on_session_finished = self.__client_channel_on_session_finished  # noqa: E501
         self.client_channel.on_session_failed = self.__client_channel_on_session_failed  # noqa: E501
+        if self.application.lazy_envelopes:
+            self.transport.on_envelope = self.__transport_on_envelope
+        self.__set_transport_json_codec()
 
     def __add_handler(
         self,
@@ -422,11 +700,35 @@ class Client:
 
     def __add_receiver(
         self,
-        receiver_list: List[Receiver],
+        receiver_table: DispatchTable,
         receiver: Receiver
     ) -> Callable[[], None]:
-        receiver_list.append(receiver)
-        return lambda: receiver_list.remove(receiver)
+        receiver_table.add(receiver)
+        return lambda: receiver_table.remove(receiver)
+
+    async def __bootstrap_session_async(self) -> None:
+        bootstrap = self.__get_bootstrap()
+        if self.application.skip_unchanged_bootstrap and \
+                self.__bootstrapped == bootstrap:
+            return
+
+        results = await gather(
+            self.__send_presence_command_async(),
+            self.__send_receipts_command_async()
+        )
+        succeeded = all(
+            result is None or result.status == CommandStatus.SUCCESS
+            for result in results
+        )
+        self.__bootstrapped = bootstrap if succeeded else None
+
+    def __get_bootstrap(self) -> Tuple[Any, ...]:
+        return (
+            f'{self.application.identifier}@{self.application.domain}',
+            type(self.application.authentication),
+            deepcopy(self.application.presence),
+            RECEIPT_EVENTS
+        )
 
     async def __send_presence_command_async(self) -> Command:
         if isinstance(self.application.authentication, GuestAuthentication):
@@ -448,15 +750,7 @@ class Client:
             CommandMethod.SET,
             '/receipt',
             'application/vnd.lime.receipt+json',
-            {
-                'events': [
-                    NotificationEvent.FAILED,
-                    NotificationEvent.ACCEPTED,
-                    NotificationEvent.DISPATCHED,
-                    NotificationEvent.RECEIVED,
-                    NotificationEvent.CONSUMED
-                ]
-            }
+            {'events': list(RECEIPT_EVENTS)}
         )
         return await self.process_command_async(command)
 
@@ -484,104 +778,233 @@ class Client:
         resolve = resolve if resolve else self.__reflect
         resolve(command)
 
-        self.__notify_receivers(self.__command_receivers, command)
+        if not self.__draining:
+            self.__notify_receivers(self.__command_receivers, command)
 
     def __client_channel_on_notification(
         self,
         notification: Notification
     ) -> None:
-        self.__notify_receivers(self.__notification_receivers, notification)
+        if not self.__draining and not self.__hold(notification):
+            self.__notify_receivers(
+                self.__notification_receivers,
+                notification
+            )
 
     def __notify_receivers(
         self,
-        receiver_list: List[Receiver],
+        receiver_table: DispatchTable,
         envelope: Envelope
     ) -> None:
-        [  # noqa: WPS428
-            self.__ensure_run_action(receiver.callback, envelope)
-            for receiver in receiver_list
-            if receiver.predicate(envelope)
-        ]
+        for receiver in receiver_table.get_receivers(envelope):
+            try:
+                self.__run_receiver(receiver, envelope)
+            except QueueFull:
+                continue
 
     def __client_channel_on_message(self, message: Message) -> None:
-        should_notify = message.id and (
-            not message.to or
-            self.client_channel.local_node.lower().startswith(
-                message.to.lower()
-            )
+        if not self.__draining and not self.__hold(message):
+            self.__accept_message(message)
+
+    def __accept_message(self, message: Message) -> None:
+        store = self.application.message_deduplication_store
+        if store is None or not message.id:
+            self.__handle_message(message)
+            return
+        get_event_loop().create_task(
+            self.__deduplicate_message_async(store, message)
         )
 
+    async def __deduplicate_message_async(
+        self,
+        store: DeduplicationStore,
+        message: Message
+    ) -> None:
+        original = self.__deduplicating.get(message.id)
+        if original is not None:
+            store.duplicates += 1
+            await self.__acknowledge_duplicate_async(message, original)
+            return
+        if self.__draining:
+            return
+
+        completion = get_event_loop().create_future()
+        self.__deduplicating[message.id] = completion
+        try:
+            await self.__handle_unique_message_async(
+                store,
+                message,
+                completion
+            )
+        finally:
+            if not completion.done():
+                completion.set_result(None)
+            del self.__deduplicating[message.id]  # noqa: WPS420
+
+    async def __handle_unique_message_async(
+        self,
+        store: DeduplicationStore,
+        message: Message,
+        completion: Future
+    ) -> None:
+        is_duplicate = await store.is_duplicate_async(message.id)
+        if self.__draining:
+            if not is_duplicate:
+                await store.remove_async(message.id)
+            return
+        if is_duplicate:
+            # the receipts of the first delivery may have been lost
+            self.__acknowledge_duplicate(message)
+            return
+
+        self.__handle_message(message, completion)
+        if await completion is not None:
+            # the next delivery must be handled again
+            await store.remove_async(message.id)
+
+    async def __acknowledge_duplicate_async(
+        self,
+        message: Message,
+        original: Future
+    ) -> None:
+        error = await original
+        if not self.__draining:
+            self.__acknowledge_duplicate(message, error)
+
+    def __acknowledge_duplicate(
+        self,
+        message: Message,
+        error: BaseException = None
+    ) -> None:
+        if self.__should_notify(message):
+            self.__acknowledgement_engine.received(message)
+            self.__acknowledgement_engine.finished(message, error)
+
+    def __handle_message(
+        self,
+        message: Message,
+        completion: Future = None
+    ) -> None:
+        should_notify = self.__should_notify(message)
+
         if should_notify:
-            notification = Notification(NotificationEvent.RECEIVED)
-            notification.id = message.id
-            notification.to = message.pp if message.pp else message.from_n
-            notification.metadata = {
-                '#message.to': message.to
-            }
-            self.send_notification(notification)
+            self.__acknowledgement_engine.received(message)
 
         try:
-            self.__notify_message_receivers(message)
-            self.__notify(should_notify, message)
+            results = self.__notify_message_receivers(message)
         except Exception as error:
-            self.__notify(should_notify, message, error)
+            if should_notify:
+                self.__acknowledgement_engine.finished(message, error)
+            if completion is not None:
+                completion.set_result(error)
+            return
 
-    def __transport_on_close(self) -> None:
-        self.listening = False
-        if not self.__closing:
-            # Use an exponential backoff for the timeout in seconds
-            timeout = (100 * (2 ** self.__connection_try_count)) / 1000.0
-
-            # Try to reconnect after the timeout
-            sleep(timeout)
-            if not self.__closing:
-                self.transport = self.__transport_factory()
-                self.__initialize_client_channel()
-                ensure_future(self.connect_async())
-
-    def __notify_message_receivers(self, message: Message) -> None:
-        for receiver in self.__message_receivers:
-            result: bool = None
-            if receiver.predicate(message):
-                result = self.__ensure_run_action(receiver.callback, message)
-            if result is False:
-                raise ValueError
+        if should_notify:
+            self.__acknowledgement_engine.processed(message, results)
+        if completion is not None:
+            self.__complete_on_results(completion, results)
 
-    def __notify(
+    def __complete_on_results(
         self,
-        should_notify: bool,
-        message: Message,
-        error: Exception = None
+        completion: Future,
+        results: List[Any]
     ) -> None:
-        if not should_notify:
+        futures = [result for result in results if isfuture(result)]
+        if not futures:
+            completion.set_result(None)
             return
 
-        if error:
-            notification = Notification(
-                NotificationEvent.FAILED,
-                Reason(
-                    ReasonCode.APPLICATION_ERROR,
-                    str(error)
+        def on_done(done: Future) -> None:  # noqa: WPS430
+            errors = [
+                result
+                for result in done.result()
+                if isinstance(result, BaseException)
+            ]
+            completion.set_result(errors[0] if errors else None)
+
+        gather(*futures, return_exceptions=True).add_done_callback(on_done)
+
+    def __hold(self, envelope: Envelope) -> bool:
+        if not self.__receiver_pool.saturated and not self.__held_envelopes:
+            return False
+        self.__held_envelopes.append(envelope)
+        return True
+
+    def __release_held_envelopes(self) -> None:
+        while self.__held_envelopes and not self.__receiver_pool.saturated:
+            envelope = self.__held_envelopes.popleft()
+            if isinstance(envelope, Notification):
+                self.__notify_receivers(
+                    self.__notification_receivers,
+                    envelope
                 )
+            else:
+                self.__accept_message(envelope)
+
+    def __should_notify(self, message: Message) -> bool:
+        return bool(message.id) and (
+            not message.to or
+            self.client_channel.local_node.lower().startswith(
+                message.to.lower()
             )
-            notification.id = message.id
-            notification.from_n = message.from_n
-            self.send_notification(notification)
+        )
 
-        if self.application.notify_consumed:
-            notification = Notification(NotificationEvent.CONSUMED)
-            notification.id = message.id
-            notification.to = message.pp if message.pp else message.from_n
-            notification.metadata = {
-                '#message.to': message.to
-            }
-            self.send_notification(notification)
+    def __transport_on_envelope(self, envelope: dict) -> None:
+        if Envelope.is_message(envelope):
+            self.__client_channel_on_message(LazyMessage(envelope))
+            return
+        self.client_channel.on_envelope(envelope)
 
-    def __get_extension(self, type: Type, to: str = None) -> ExtensionBase:
-        extension = self.__extensions.get(type)
+    def __is_offline(self) -> bool:
+        return self.__offline_outbox is not None and \
+            self.__offline_outbox.offline
+
+    def __send_envelope(self, envelope: Envelope) -> None:
+        if isinstance(envelope, Message):
+            self.client_channel.send_message(envelope)
+        elif isinstance(envelope, Notification):
+            self.client_channel.send_notification(envelope)
+        elif isinstance(envelope, Command):
+            self.client_channel.send_command(envelope)
+
+    def __transport_on_close(self) -> None:
+        self.listening = False
+        if not self.__closing:
+            if self.__offline_outbox is not None:
+                self.__offline_outbox.go_offline()
+            self.__reconnection_supervisor.schedule()
+
+    async def __reconnect_async(self) -> Session:
+        if self.__closing:
+            return None
+        self.transport = self.__transport_factory()
+        self.__initialize_client_channel()
+        return await self.__open_session_async()
+
+    def __on_reconnection_failed(self, error: ConnectionError) -> None:
+        if self.__offline_outbox is not None:
+            self.__offline_outbox.fail(error)
+        self.on_reconnection_failed(error)
+
+    def __notify_message_receivers(self, message: Message) -> List[Any]:
+        results = []
+        conversation = self.__get_conversation(message)
+        for receiver in self.__message_receivers.get_receivers(message):
+            result = self.__run_receiver(receiver, message, conversation)
+            if result is False:
+                raise ValueError
+            results.append(result)
+        return results
+
+    def __get_extension(self, name: str, to: str = None) -> ExtensionBase:
+        extension = self.__extensions.get(name)
         if not extension:
-            extension = type(self, to)
-            self.__extensions[type] = extension
+            extension_type = load_extension(name)
+            extension = extension_type(self, to)
+            extension.coalesce_gets = \
+                extension_type in self.application.coalesced_extensions
+            extension.response_cache = self.application.response_cache
+            self.__extensions[name] = extension
         return extension
 
     def __reflect(self, any: Any) -> Any:
@@ -593,6 +1016,172 @@ class Client:
             return loop.create_task(action_async(*args))
         return action_async(*args)
 
+    async def __process_command_with_retries_async(
+        self,
+        command: Command,
+        timeout: float
+    ) -> Command:
+        retry_policy = self.application.command_retry_policy
+        if retry_policy is None:
+            return await self.__process_command_once_async(command, timeout)
+        return await retry_policy.execute_async(
+            command,
+            partial(self.__process_command_once_async, timeout=timeout)
+        )
+
+    async def __process_command_once_async(
+        self,
+        command: Command,
+        timeout: float
+    ) -> Command:
+        hedging_policy = self.application.command_hedging_policy
+        if hedging_policy is None:
+            return await self.__send_command_async(command, timeout)
+        return await hedging_policy.execute_async(
+            command,
+            partial(self.__send_command_async, timeout=timeout),
+            self.__abandon_command
+        )
+
+    async def __send_command_async(
+        self,
+        command: Command,
+        timeout: float
+    ) -> Command:
+        if self.__is_offline():
+            await self.__offline_outbox.wait_online_async()
+        await self.__rate_limiter.acquire_async(command)
+        await self.__outbound_flow_control.wait_turn_async(
+            command,
+            OutboundPriority.COMMAND
+        )
+        return await self.client_channel.process_command_async(
+            command,
+            timeout
+        )
+
+    def __abandon_command(self, command: Command) -> None:
+        # without its resolve, the channel doesn't report the cancelled
+        # command as timed out
+        self.client_channel.command_resolves.pop(command.id, None)
+
+    def __send_receipts(self, notifications: List[Notification]) -> None:
+        for notification in notifications:
+            self.__outbound_flow_control.send_nowait(
+                notification,
+                self.send_notification,
+                OutboundPriority.RECEIPT
+            )
+
+    def __set_transport_json_codec(self) -> None:
+        set_json_codec = getattr(self.transport, 'set_json_codec', None)
+        if self.application.json_codec is not None and set_json_codec:
+            set_json_codec(self.application.json_codec)
+
+    def __on_receivers_saturation_changed(self, saturated: bool) -> None:
+        if not saturated:
+            self.__release_held_envelopes()
+        self.__update_reading()
+
+    def __update_reading(self) -> None:
+        # command responses must still be read while receivers await them
+        paused = self.__receiver_pool.saturated and \
+            not self.__pending_commands
+        socket_transport = self.__get_socket_transport()
+        if socket_transport is None or paused == self.__reading_paused:
+            return
+        self.__reading_paused = paused
+        if paused:
+            socket_transport.pause_reading()
+        else:
+            socket_transport.resume_reading()
+
+    def __get_socket_transport(self) -> Any:
+        websocket = getattr(self.transport, 'websocket', None)
+        return getattr(websocket, 'transport', None)
+
+    def __get_transport_buffer_size(self) -> int:
+        socket_transport = self.__get_socket_transport()
+        get_write_buffer_size = getattr(
+            socket_transport,
+            'get_write_buffer_size',
+            None
+        )
+        buffer_size = get_write_buffer_size() \
+            if get_write_buffer_size else 0
+        return buffer_size if isinstance(buffer_size, int) else 0
+
+    def __get_drain_progress(self, elapsed: float) -> DrainProgress:
+        return DrainProgress(
+            self.__receiver_pool.in_flight,
+            self.__receiver_pool.queue_depth +
+            self.__conversation_dispatcher.queue_depth +
+            len(self.__held_envelopes),
+            self.__pending_commands,
+            elapsed
+        )
+
+    def __get_conversation(self, message: Message) -> str:
+        if not self.application.ordered_conversations:
+            return None
+        return EnvelopeUtilities.get_identity(
+            message.pp if message.pp else message.from_n
+        )
+
+    def __run_receiver(
+        self,
+        receiver: Receiver,
+        envelope: Envelope,
+        conversation: str = None
+    ) -> Any:
+        callback = receiver.callback
+        if not iscoroutinefunction(callback):
+            if receiver.execution_mode == ExecutionMode.INLINE:
+                return callback(envelope)
+            callback = partial(self.__run_in_executor_async, receiver)
+
+        if conversation:
+            return self.__conversation_dispatcher.submit(
+                conversation,
+                callback,
+                envelope
+            )
+        return self.__receiver_pool.submit(callback, envelope)
+
+    async def __run_in_executor_async(
+        self,
+        receiver: Receiver,
+        envelope: Envelope
+    ) -> Any:
+        result = await get_event_loop().run_in_executor(
+            self.__get_executor(receiver.execution_mode),
+            receiver.callback,
+            envelope
+        )
+        if result is False:
+            raise ValueError
+        return result
+
+    def __get_executor(self, execution_mode: str) -> Executor:
+        executor = self.__executors.get(execution_mode)
+        if not executor:
+            if execution_mode == ExecutionMode.PROCESS_POOL:
+                executor = ProcessPoolExecutor(
+                    self.application.receiver_process_pool_size
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    self.application.receiver_thread_pool_size,
+                    'blip-sdk-receiver'
+                )
+            self.__executors[execution_mode] = executor
+        return executor
+
+    def __shutdown_executors(self) -> None:
+        executors, self.__executors = self.__executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
+
     def __run_async_on_sync(self, action_async: Awaitable, *args) -> Any:
         loop = get_event_loop()
         if loop.is_running():
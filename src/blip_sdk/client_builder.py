@@ -1,10 +1,20 @@
-from typing import Callable
+from typing import Callable, Dict, Iterable, Type, Union
 
 from lime_python import (ExternalAuthentication, KeyAuthentication,
                          PlainAuthentication, Transport)
 
 from .application import Application
 from .client import Client
+from .client_pool import ClientPool
+from .commands import (CircuitBreaker, HedgingPolicy, ResponseCache,
+                       RetryBudget, RetryPolicy)
+from .commands.retry_policy import TRANSIENT_REASON_CODES
+from .extensions import ExtensionBase, get_uri_templates
+from .serialization import JsonCodec, get_json_codec
+from .serialization.json_codec import FASTEST
+from .threaded_client import ThreadedClient
+from .dispatching import (DeduplicationStore, LruDeduplicationStore,
+                          OverflowPolicy)
 
 
 class ClientBuilder:
@@ -90,6 +100,10 @@ class ClientBuilder:
         self.__application.presence['roundRobin'] = round_robin
         return self
 
+    def with_notify_received(self, notify_received: bool):
+        self.__application.notify_received = notify_received
+        return self
+
     def with_notify_consumed(self, notify_consumed: bool):
         self.__application.notify_consumed = notify_consumed
         return self
@@ -105,10 +119,195 @@ class ClientBuilder:
         self.__application.command_timeout = command_timeout
         return self
 
+    def with_command_retries(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2,
+        retryable_reason_codes: Iterable[int] = TRANSIENT_REASON_CODES,
+        budget_ratio: float = 0.1
+    ):
+        self.__application.command_retry_policy = RetryPolicy(
+            get_uri_templates(),
+            max_attempts,
+            base_delay,
+            max_delay,
+            retryable_reason_codes=retryable_reason_codes,
+            budget=RetryBudget(budget_ratio)
+        )
+        return self
+
+    def with_circuit_breaker(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1
+    ):
+        self.__application.command_circuit_breaker = CircuitBreaker(
+            failure_threshold,
+            reset_timeout,
+            half_open_max_calls
+        )
+        return self
+
+    def with_command_hedging(
+        self,
+        initial_delay: float = 0.1,
+        percentile: float = 0.95,
+        budget_ratio: float = 0.05
+    ):
+        self.__application.command_hedging_policy = HedgingPolicy(
+            get_uri_templates(),
+            initial_delay,
+            percentile,
+            budget_ratio=budget_ratio
+        )
+        return self
+
+    def with_offline_outbox(
+        self,
+        max_size: int = 1000,
+        ttl: float = 30,
+        overflow_policy: str = OverflowPolicy.DROP_OLDEST
+    ):
+        self.__application.offline_outbox_size = max_size
+        self.__application.offline_outbox_ttl = ttl
+        self.__application.offline_outbox_overflow_policy = overflow_policy
+        return self
+
+    def with_coalesced_gets(self, *extension_types: Type[ExtensionBase]):
+        self.__application.coalesced_extensions.update(extension_types)
+        return self
+
+    def with_response_cache(
+        self,
+        template_ttls: Dict[str, float],
+        max_entries: int = 1000
+    ):
+        self.__application.response_cache = ResponseCache(
+            template_ttls,
+            max_entries
+        )
+        return self
+
+    def with_outbound_high_water(
+        self,
+        envelopes: int,
+        bytes_n: int = 0,
+        write_buffer_bytes: int = 16384
+    ):
+        self.__application.outbound_high_water_envelopes = envelopes
+        self.__application.outbound_high_water_bytes = bytes_n
+        self.__application.outbound_write_buffer_high_water = \
+            write_buffer_bytes
+        return self
+
+    def with_outbound_priority_weights(self, weights: Dict[str, int]):
+        self.__application.outbound_priority_weights = weights
+        return self
+
+    def with_rate_limits(
+        self,
+        global_rate: float = None,
+        per_destination: float = None,
+        per_postmaster: float = None,
+        burst: int = None
+    ):
+        self.__application.rate_limit_global = global_rate
+        self.__application.rate_limit_per_destination = per_destination
+        self.__application.rate_limit_per_postmaster = per_postmaster
+        self.__application.rate_limit_burst = burst
+        return self
+
+    def with_drain_timeout(self, drain_timeout: float):
+        self.__application.drain_timeout = drain_timeout
+        return self
+
+    def with_skip_unchanged_bootstrap(self, skip_unchanged_bootstrap: bool):
+        self.__application.skip_unchanged_bootstrap = skip_unchanged_bootstrap
+        return self
+
+    def with_reconnection_backoff(
+        self,
+        base_delay: float,
+        max_delay: float,
+        jitter: float = 0.2
+    ):
+        self.__application.reconnection_base_delay = base_delay
+        self.__application.reconnection_max_delay = max_delay
+        self.__application.reconnection_jitter = jitter
+        return self
+
+    def with_receiver_concurrency(
+        self,
+        max_concurrency: int,
+        queue_size: int = None,
+        overflow_policy: str = OverflowPolicy.BLOCK
+    ):
+        self.__application.receiver_max_concurrency = max_concurrency
+        self.__application.receiver_queue_size = queue_size
+        self.__application.receiver_overflow_policy = overflow_policy
+        return self
+
+    def with_receiver_executors(
+        self,
+        thread_pool_size: int,
+        process_pool_size: int = None
+    ):
+        self.__application.receiver_thread_pool_size = thread_pool_size
+        self.__application.receiver_process_pool_size = process_pool_size
+        return self
+
+    def with_message_deduplication(
+        self,
+        ttl: float = 600,
+        max_size: int = 10000,
+        store: DeduplicationStore = None
+    ):
+        self.__application.message_deduplication_store = store or \
+            LruDeduplicationStore(max_size, ttl)
+        return self
+
+    def with_lazy_envelopes(self, lazy_envelopes: bool):
+        self.__application.lazy_envelopes = lazy_envelopes
+        return self
+
+    def with_json_codec(self, json_codec: Union[str, JsonCodec] = FASTEST):
+        if isinstance(json_codec, str):
+            json_codec = get_json_codec(json_codec)
+        self.__application.json_codec = json_codec
+        return self
+
+    def with_ordered_conversations(self, ordered_conversations: bool):
+        self.__application.ordered_conversations = ordered_conversations
+        return self
+
     def build(self) -> Client:
+        self.__ensure_transport_factory()
+        return Client(
+            self.__build_uri(),
+            self.__transport_factory,
+            self.__application
+        )
+
+    def build_pool(self, size: int) -> ClientPool:
+        self.__ensure_transport_factory()
+        return ClientPool(
+            self.__build_uri(),
+            self.__transport_factory,
+            self.__application,
+            size
+        )
+
+    def build_threaded(self) -> ThreadedClient:
+        self.__ensure_transport_factory()
+        return ThreadedClient(self.build)
+
+    def __build_uri(self) -> str:
+        return f'{self.__application.scheme}://{self.__application.hostname}:{self.__application.port}'  # noqa: E501, WPS221
+
+    def __ensure_transport_factory(self) -> None:
         if self.__transport_factory is None:
             raise ValueError(
                 'You must pass a Transport Factory using with_transport_factory before call build'  # noqa: E501
             )
-        uri = f'{self.__application.scheme}://{self.__application.hostname}:{self.__application.port}'  # noqa: E501, WPS221
-        return Client(uri, self.__transport_factory, self.__application)
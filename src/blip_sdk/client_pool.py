@@ -0,0 +1,313 @@
+from asyncio import Task, ensure_future, gather, sleep, wait_for
+from contextlib import suppress
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Dict, List, Tuple
+
+from lime_python import Command, Message, Notification, Session, Transport
+
+from .application import Application
+from .client import MAX_CONNECTION_TRY_COUNT, Client
+from .connection import ReconnectionSupervisor
+from .receiver import Receiver
+
+DRAIN_POLLING_INTERVAL = 0.1  # in seconds
+
+ReceiverEntry = Tuple[str, Receiver]
+
+
+class ClientPool:
+    """Pool of client sessions sharing the same receivers.
+
+    Each member is a Client connected with its own instance name. Commands
+    and envelopes are sent through the listening member with less commands
+    in flight and the registered receivers handle envelopes from all members.
+    A member with a failed session is drained and replaced by a new one with
+    the same instance name. If the replacement cannot connect, a
+    ReconnectionSupervisor keeps retrying it, so the pool gets back to its
+    size once the connection recovers.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        transport_factory: Callable[[], Transport],
+        application: Application,
+        size: int = 2,
+        drain_timeout: float = None
+    ) -> None:
+        if size < 1:
+            raise ValueError('size must be greater than 0')
+
+        self.uri = uri
+        self.application = application
+        self.drain_timeout = drain_timeout
+        self.__transport_factory = transport_factory
+        self.__receivers: List[ReceiverEntry] = []
+        self.__removers: Dict[ReceiverEntry, Dict[Client, Callable]] = {}
+        self.__in_flight: Dict[Client, int] = {}
+        self.__suffixes: Dict[Client, int] = {}
+        self.__restorers: Dict[int, ReconnectionSupervisor] = {}
+        self.members: List[Client] = [
+            self.__create_member(suffix) for suffix in range(size)
+        ]
+
+    @property
+    def in_flight(self) -> List[int]:  # noqa: D102
+        return [self.__in_flight.get(member, 0) for member in self.members]
+
+    async def connect_async(self) -> List[Session]:
+        """Connect all the pool members.
+
+        Returns:
+            List[Session]: the members sessions
+        """
+        return await gather(
+            *[member.connect_async() for member in self.members]
+        )
+
+    async def close_async(self) -> List[Session]:
+        """Close all the pool members.
+
+        Returns:
+            List[Session]: the members sessions
+        """
+        for restorer in self.__restorers.values():
+            restorer.cancel()
+        self.__restorers.clear()
+        return await gather(
+            *[member.close_async() for member in self.members]
+        )
+
+    def send_message(self, message: Message) -> None:
+        """Send a Message through the least busy member.
+
+        Args:
+            message (Message): Message to be sent
+        """
+        self.__get_member().send_message(message)
+
+    def send_notification(self, notification: Notification) -> None:
+        """Send a Notification through the least busy member.
+
+        Args:
+            notification (Notification): Notification to be sent
+        """
+        self.__get_member().send_notification(notification)
+
+    def send_command(self, command: Command) -> None:
+        """Send a Command through the least busy member.
+
+        Args:
+            command (Command): Command to be sent
+        """
+        self.__get_member().send_command(command)
+
+    async def process_command_async(
+        self,
+        command: Command,
+        timeout: float = None
+    ) -> Command:
+        """Process a Command through the least busy member.
+
+        Args:
+            command (Command): The Command to be processed
+            timeout (float): Timeout to process the Command
+
+        Returns:
+            Command: The result Command
+        """
+        member = self.__get_member()
+        self.__in_flight[member] += 1
+        try:
+            return await member.process_command_async(command, timeout)
+        finally:
+            if member in self.__in_flight:
+                self.__in_flight[member] -= 1
+
+    def add_message_receiver(self, receiver: Receiver) -> Callable[[], None]:
+        """Add a message receiver to all members.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver('add_message_receiver', receiver)
+
+    def add_notification_receiver(
+        self,
+        receiver: Receiver
+    ) -> Callable[[], None]:
+        """Add a notification receiver to all members.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver('add_notification_receiver', receiver)
+
+    def add_command_receiver(self, receiver: Receiver) -> Callable[[], None]:
+        """Add a command receiver to all members.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver('add_command_receiver', receiver)
+
+    async def replace_member_async(self, member: Client) -> Client:
+        """Drain a member and replace it by a new connected one.
+
+        The new member keeps the instance name of the old one and only
+        takes its place once connected. If it cannot connect, the old member
+        leaves the rotation while other members remain, the connection error
+        is raised and the replacement is retried with the reconnection
+        backoff of the application.
+
+        Args:
+            member (Client): the member to replace
+
+        Returns:
+            Client: the new member
+        """
+        waited = 0
+        while self.__in_flight[member] and (
+            self.drain_timeout is None or waited < self.drain_timeout
+        ):
+            await sleep(DRAIN_POLLING_INTERVAL)
+            waited += DRAIN_POLLING_INTERVAL
+
+        with suppress(Exception):
+            await wait_for(
+                member.close_async(),
+                self.application.command_timeout
+            )
+
+        try:
+            return await self.__connect_replacement_async(member)
+        except Exception:
+            if len(self.members) > 1:
+                self.members.remove(member)
+            self.__schedule_restore(member)
+            raise
+
+    def on_member_replace_failed(
+        self,
+        member: Client,
+        error: Exception
+    ) -> None:
+        """Handle callback to a member replacement giving up.
+
+        This method can be overwrited.
+
+        Args:
+            member (Client): the failed member
+            error (Exception): the connection error
+        """
+        pass
+
+    async def __connect_replacement_async(self, member: Client) -> Client:
+        new_member = self.__create_member(self.__suffixes[member])
+        try:
+            await new_member.connect_async()
+        except Exception:
+            self.__discard_member(new_member)
+            raise
+
+        if member in self.members:
+            self.members[self.members.index(member)] = new_member
+        else:
+            self.members.append(new_member)
+        self.__discard_member(member)
+        return new_member
+
+    def __schedule_restore(self, member: Client) -> None:
+        suffix = self.__suffixes[member]
+        if suffix in self.__restorers:
+            return
+        restorer = ReconnectionSupervisor(
+            partial(self.__connect_replacement_async, member),
+            self.application.reconnection_base_delay,
+            self.application.reconnection_max_delay,
+            self.application.reconnection_jitter,
+            MAX_CONNECTION_TRY_COUNT
+        )
+        restorer.on_failed = partial(self.__on_restore_failed, member)
+        self.__restorers[suffix] = restorer
+        restorer.schedule().add_done_callback(
+            lambda _: self.__restorers.pop(suffix, None)
+        )
+
+    def __on_restore_failed(self, member: Client, error: Exception) -> None:
+        if member not in self.members:
+            self.__discard_member(member)
+        self.on_member_replace_failed(member, error)
+
+    def __create_member(self, suffix: int) -> Client:
+        application = replace(
+            self.application,
+            instance=f'{self.application.instance}-{suffix}'
+        )
+        member = Client(self.uri, self.__transport_factory, application)
+        self.__in_flight[member] = 0
+        self.__suffixes[member] = suffix
+        for entry in self.__receivers:
+            method_name, receiver = entry
+            self.__removers[entry][member] = getattr(member, method_name)(
+                receiver
+            )
+        member.add_session_failed_handler(
+            lambda _: self.__on_member_failed(member)
+        )
+        return member
+
+    def __discard_member(self, member: Client) -> None:
+        self.__in_flight.pop(member, None)
+        self.__suffixes.pop(member, None)
+        for removers in self.__removers.values():
+            removers.pop(member, None)
+
+    def __on_member_failed(self, member: Client) -> None:
+        if member in self.members:
+            ensure_future(self.replace_member_async(member)).add_done_callback(
+                self.__on_replace_done
+            )
+
+    def __on_replace_done(self, task: Task) -> None:
+        # the failed replacements are retried by the restorer
+        if not task.cancelled():
+            task.exception()
+
+    def __get_member(self) -> Client:
+        listening_members = [
+            member for member in self.members if member.listening
+        ]
+        return min(
+            listening_members or self.members,
+            key=self.__in_flight.__getitem__
+        )
+
+    def __add_receiver(
+        self,
+        method_name: str,
+        receiver: Receiver
+    ) -> Callable[[], None]:
+        entry = (method_name, receiver)
+        self.__receivers.append(entry)
+        self.__removers[entry] = {
+            member: getattr(member, method_name)(receiver)
+            for member in self.members
+        }
+
+        def remove() -> None:  # noqa: WPS430
+            self.__receivers.remove(entry)
+            for remover in self.__removers.pop(entry).values():
+                remover()
+
+        return remove
@@ -0,0 +1,7 @@
+from .uri_template_matcher import UriTemplateMatcher
+from .retry_policy import RetryBudget, RetryPolicy, RetryStatistics
+from .circuit_breaker import (Circuit, CircuitBreaker, CircuitOpenError,
+                              CircuitState)
+from .hedging_policy import HedgingPolicy, HedgingStatistics
+from .single_flight import SingleFlight
+from .response_cache import ResponseCache
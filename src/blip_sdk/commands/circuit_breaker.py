@@ -0,0 +1,164 @@
+from asyncio import TimeoutError as AsyncTimeoutError
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable
+
+from lime_python import Command, CommandStatus
+
+from ..utilities import EnvelopeUtilities
+from .retry_policy import TRANSIENT_REASON_CODES
+
+
+class CircuitState:
+    """States of a circuit breaker circuit."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(Exception):
+    """Raised when a command is rejected by an open circuit."""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f'The circuit of {key} is open')
+        self.key = key
+
+
+@dataclass
+class Circuit:
+    """State of the circuit of a command target."""
+
+    state: str = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """Fail fast the commands sent to a degraded target.
+
+    Each target, usually an extension `to` like `postmaster@ai.msging.net`,
+    has its own circuit. It opens after `failure_threshold` consecutive
+    timeouts or transient failures, rejecting the commands with
+    CircuitOpenError. After `reset_timeout` seconds it lets up to
+    `half_open_max_calls` probe commands through, closing again if they
+    succeed or reopening if they fail.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        failure_reason_codes: Iterable[int] = TRANSIENT_REASON_CODES
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_reason_codes = set(failure_reason_codes)
+        self.__circuits: Dict[str, Circuit] = {}
+
+    def get_state(self, key: str) -> str:
+        """Get the state of a target circuit.
+
+        Args:
+            key (str): the target identity
+
+        Returns:
+            str: the CircuitState
+        """
+        circuit = self.__circuits.get(key)
+        return circuit.state if circuit else CircuitState.CLOSED
+
+    async def execute_async(
+        self,
+        key: str,
+        command: Command,
+        process_async: Callable[[Command], Awaitable[Command]]
+    ) -> Command:
+        """Process a command through the circuit of its target.
+
+        Args:
+            key (str): the target identity, None to bypass the breaker
+            command (Command): the Command to be processed
+            process_async (Callable[[Command], Awaitable[Command]]):
+                processes the command
+
+        Raises:
+            CircuitOpenError: the circuit of the target is open
+
+        Returns:
+            Command: the result Command
+        """
+        if key is None:
+            return await process_async(command)
+
+        circuit = self.__circuits.setdefault(key, Circuit())
+        if not self.__try_acquire(key, circuit):
+            raise CircuitOpenError(key)
+
+        try:
+            result = await process_async(command)
+        except (AsyncTimeoutError, ConnectionError):
+            self.__record_failure(key, circuit)
+            raise
+        except BaseException:
+            self.__release(circuit)
+            raise
+
+        if result.status == CommandStatus.FAILURE and \
+                EnvelopeUtilities.get_reason_code(result) in \
+                self.failure_reason_codes:
+            self.__record_failure(key, circuit)
+        else:
+            self.__record_success(key, circuit)
+        return result
+
+    def on_state_changed(self, key: str, old_state: str, state: str) -> None:
+        """Handle callback to circuit state transitions.
+
+        This method can be overwrited.
+
+        Args:
+            key (str): the target identity
+            old_state (str): the previous CircuitState
+            state (str): the new CircuitState
+        """
+        pass
+
+    def __try_acquire(self, key: str, circuit: Circuit) -> bool:
+        if circuit.state == CircuitState.OPEN:
+            if monotonic() - circuit.opened_at < self.reset_timeout:
+                return False
+            self.__transition(key, circuit, CircuitState.HALF_OPEN)
+
+        if circuit.state == CircuitState.HALF_OPEN:
+            if circuit.probes >= self.half_open_max_calls:
+                return False
+            circuit.probes += 1
+        return True
+
+    def __release(self, circuit: Circuit) -> None:
+        if circuit.state == CircuitState.HALF_OPEN and circuit.probes:
+            circuit.probes -= 1
+
+    def __record_failure(self, key: str, circuit: Circuit) -> None:
+        circuit.failures += 1
+        if circuit.state == CircuitState.HALF_OPEN or \
+                circuit.failures >= self.failure_threshold:
+            circuit.opened_at = monotonic()
+            self.__transition(key, circuit, CircuitState.OPEN)
+
+    def __record_success(self, key: str, circuit: Circuit) -> None:
+        circuit.failures = 0
+        if circuit.state == CircuitState.HALF_OPEN:
+            self.__transition(key, circuit, CircuitState.CLOSED)
+
+    def __transition(self, key: str, circuit: Circuit, state: str) -> None:
+        old_state = circuit.state
+        if old_state == state:
+            return
+        circuit.state = state
+        circuit.probes = 0
+        self.on_state_changed(key, old_state, state)
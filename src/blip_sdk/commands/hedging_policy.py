@@ -0,0 +1,164 @@
+from asyncio import FIRST_COMPLETED, Task, ensure_future, get_event_loop, wait
+from collections import deque
+from dataclasses import dataclass
+from math import ceil
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Set
+from uuid import uuid4
+
+from lime_python import Command, CommandMethod
+
+from ..utilities import EnvelopeUtilities
+from .retry_policy import RetryBudget
+from .uri_template_matcher import UriTemplateMatcher
+
+
+@dataclass
+class HedgingStatistics:
+    """Hedge counters collected by the hedging policy."""
+
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+
+class HedgingPolicy:
+    """Send a duplicate of slow GET commands and take the first response.
+
+    When a GET to a known uri template takes longer than the `percentile`
+    of the latencies observed for that template (`initial_delay` until
+    `min_samples` are observed), a copy with a new id is sent. The first
+    response wins and the other pending command is abandoned and cancelled.
+    The hedges are limited by a budget of `budget_ratio` of the GET
+    commands.
+    """
+
+    def __init__(
+        self,
+        uri_templates: Iterable[str],
+        initial_delay: float = 0.1,
+        percentile: float = 0.95,
+        window_size: int = 100,
+        min_samples: int = 20,
+        budget_ratio: float = 0.05
+    ) -> None:
+        self.initial_delay = initial_delay
+        self.percentile = percentile
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.budget = RetryBudget(budget_ratio)
+        self.statistics = HedgingStatistics()
+        self.__matcher = UriTemplateMatcher(uri_templates)
+        self.__latencies: Dict[str, Deque[float]] = {}
+
+    def get_delay(self, template: str) -> float:
+        """Get the delay before hedging a command to an uri template.
+
+        Args:
+            template (str): the uri template
+
+        Returns:
+            float: the delay in seconds
+        """
+        latencies = self.__latencies.get(template)
+        if not latencies or len(latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(latencies)
+        index = max(ceil(self.percentile * len(ordered)) - 1, 0)
+        return ordered[index]
+
+    def record_latency(self, template: str, latency: float) -> None:
+        """Record the latency of a command to an uri template.
+
+        Args:
+            template (str): the uri template
+            latency (float): the latency in seconds
+        """
+        latencies = self.__latencies.setdefault(
+            template,
+            deque(maxlen=self.window_size)
+        )
+        latencies.append(latency)
+
+    async def execute_async(
+        self,
+        command: Command,
+        process_async: Callable[[Command], Awaitable[Command]],
+        abandon: Callable[[Command], None] = None
+    ) -> Command:
+        """Process a command, hedging it if it's slow.
+
+        Args:
+            command (Command): the Command to be processed
+            process_async (Callable[[Command], Awaitable[Command]]):
+                processes one copy of the command
+            abandon (Callable[[Command], None]): stops waiting for the
+                response of a copy before its processing is cancelled
+
+        Returns:
+            Command: the first result Command
+        """
+        template = self.__matcher.match(command.uri) \
+            if command.method == CommandMethod.GET else None
+        if template is None:
+            return await process_async(command)
+
+        self.budget.deposit()
+        loop = get_event_loop()
+        started_at = loop.time()
+        primary = ensure_future(process_async(command))
+        try:
+            done, _ = await wait({primary}, timeout=self.get_delay(template))
+        except BaseException:
+            self.__cancel(primary, command, abandon)
+            raise
+        if done:
+            self.record_latency(template, loop.time() - started_at)
+            return primary.result()
+
+        if not self.budget.withdraw():
+            self.statistics.budget_denied += 1
+            return await primary
+
+        self.statistics.hedged += 1
+        hedge_command = EnvelopeUtilities.copy(command, str(uuid4()))
+        hedge = ensure_future(process_async(hedge_command))
+        winner = await self.__wait_first_result(
+            {primary: command, hedge: hedge_command},
+            abandon
+        )
+        if winner is hedge:
+            self.statistics.hedge_wins += 1
+        self.record_latency(template, loop.time() - started_at)
+        return winner.result()
+
+    async def __wait_first_result(
+        self,
+        commands: Dict[Task, Command],
+        abandon: Callable[[Command], None]
+    ) -> Task:
+        pending: Set[Task] = set(commands)
+        try:
+            while True:  # noqa: WPS457
+                done, pending = await wait(
+                    pending,
+                    return_when=FIRST_COMPLETED
+                )
+                winner = next(
+                    (task for task in done if task.exception() is None),
+                    None
+                )
+                if winner is not None or not pending:
+                    return winner or done.pop()
+        finally:
+            for task in pending:
+                self.__cancel(task, commands[task], abandon)
+
+    def __cancel(
+        self,
+        task: Task,
+        command: Command,
+        abandon: Callable[[Command], None]
+    ) -> None:
+        if abandon is not None:
+            abandon(command)
+        task.cancel()
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from lime_python import Command, CommandMethod, CommandStatus
+
+from ..utilities import EnvelopeUtilities
+from .uri_template_matcher import UriTemplateMatcher
+
+CacheKey = Tuple[str, str]
+CacheEntry = Tuple[Command, float]
+
+INVALIDATING_METHODS = frozenset((
+    CommandMethod.SET,
+    CommandMethod.MERGE,
+    CommandMethod.DELETE
+))
+
+
+class ResponseCache:
+    """LRU cache of successful GET responses, keyed by `to` and `uri`.
+
+    Only the uris matching a template of `template_ttls`, like
+    '/intentions/{0}', are cached, each for the ttl of its template. SET,
+    MERGE and DELETE commands invalidate the entries of the same `to` whose
+    path is a prefix of the written path, or starts with it, so writing
+    '/intentions/1' drops '/intentions', '/intentions/1' and
+    '/intentions/1/answers'. The cache keeps its own copy of the responses
+    and returns a new copy on each hit, so the callers can change them.
+    """
+
+    def __init__(
+        self,
+        template_ttls: Dict[str, float],
+        max_entries: int = 1000
+    ) -> None:
+        self.template_ttls = template_ttls
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.version = 0
+        self.__matcher = UriTemplateMatcher(template_ttls.keys())
+        self.__entries: Dict[CacheKey, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, command: Command) -> Optional[Command]:
+        """Get the cached response of a GET command.
+
+        Args:
+            command (Command): the GET Command
+
+        Returns:
+            Optional[Command]: a copy of the cached response or None
+        """
+        key = (command.to, command.uri)
+        entry = self.__entries.get(key)
+        if entry is None or entry[1] <= monotonic():
+            if entry is not None:
+                del self.__entries[key]  # noqa: WPS420
+            self.misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return EnvelopeUtilities.copy(entry[0])
+
+    def set(
+        self,
+        command: Command,
+        response: Command,
+        version: int = None
+    ) -> None:
+        """Cache the response of a GET command if its uri is cacheable.
+
+        Args:
+            command (Command): the GET Command
+            response (Command): the response Command
+            version (int): the cache version when the command was sent, so
+                responses sent before a write are not cached after it
+        """
+        if response is None or response.status != CommandStatus.SUCCESS:
+            return
+        if version is not None and version != self.version:
+            return
+        template = self.__matcher.match(command.uri)
+        if template is None:
+            return
+
+        key = (command.to, command.uri)
+        self.__entries[key] = (
+            EnvelopeUtilities.copy(response),
+            monotonic() + self.template_ttls[template]
+        )
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, command: Command) -> None:
+        """Drop the entries affected by a write command.
+
+        Args:
+            command (Command): the SET, MERGE or DELETE Command
+        """
+        if command.method not in INVALIDATING_METHODS:
+            return
+        self.version += 1
+        path = self.__get_path(command.uri)
+        stale_keys = [
+            key for key in self.__entries
+            if key[0] == command.to and
+            self.__is_related(path, self.__get_path(key[1]))
+        ]
+        for key in stale_keys:
+            del self.__entries[key]  # noqa: WPS420
+        self.invalidations += len(stale_keys)
+
+    def __get_path(self, uri: str) -> str:
+        return (uri or '').split('?', 1)[0].rstrip('/')
+
+    def __is_related(self, path: str, cached_path: str) -> bool:
+        shorter, longer = sorted((path, cached_path), key=len)
+        return longer == shorter or longer.startswith(f'{shorter}/')
@@ -0,0 +1,186 @@
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import sleep
+from collections import defaultdict
+from dataclasses import dataclass, field
+from random import uniform
+from typing import Awaitable, Callable, Dict, Iterable
+from uuid import uuid4
+
+from lime_python import Command, CommandMethod, CommandStatus, ReasonCode
+
+from ..utilities import EnvelopeUtilities
+from .uri_template_matcher import UriTemplateMatcher
+
+DEFAULT_RETRYABLE_METHODS = (
+    CommandMethod.GET,
+    CommandMethod.SET,
+    CommandMethod.DELETE
+)
+TRANSIENT_REASON_CODES = (
+    ReasonCode.GENERAL_ERROR,
+    ReasonCode.ROUTING_ERROR,
+    ReasonCode.DISPATCH_ERROR,
+    ReasonCode.GATEWAY_ERROR
+)
+
+
+@dataclass
+class RetryStatistics:
+    """Retry counters collected by the retry policy."""
+
+    retries: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    exhausted: int = 0
+    budget_denied: int = 0
+
+
+class RetryBudget:
+    """Bound the retries to a ratio of the commands to avoid retry storms.
+
+    Each command deposits `ratio` tokens, up to `max_tokens`, and each retry
+    withdraws a whole token, so when most commands fail the retries are
+    limited to about `ratio` of the traffic.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        """Deposit the tokens of a new command."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Withdraw the token of a retry.
+
+        Returns:
+            bool: if there were tokens for the retry
+        """
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """Retry commands failing by timeout or by a transient reason.
+
+    Only commands with an idempotent method to an uri matching one of the
+    known templates are retried, with exponential backoff and jitter, and
+    the retry counts are grouped by uri template. Each retry sends a copy of
+    the command with a new id, so a late response to a previous attempt is
+    never taken as the response to the retry.
+    """
+
+    def __init__(
+        self,
+        uri_templates: Iterable[str],
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2,
+        jitter: float = 0.2,
+        retryable_methods: Iterable[str] = DEFAULT_RETRYABLE_METHODS,
+        retryable_reason_codes: Iterable[int] = TRANSIENT_REASON_CODES,
+        budget: RetryBudget = None
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retryable_methods = set(retryable_methods)
+        self.retryable_reason_codes = set(retryable_reason_codes)
+        self.budget = budget or RetryBudget()
+        self.statistics = RetryStatistics()
+        self.__matcher = UriTemplateMatcher(uri_templates)
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the backoff delay before retrying an attempt.
+
+        Args:
+            attempt (int): the zero based failed attempt number
+
+        Returns:
+            float: the delay in seconds
+        """
+        delay = min(self.base_delay * 2 ** attempt, self.max_delay)
+        return delay + uniform(0, delay * self.jitter)  # noqa: S311
+
+    def get_template(self, command: Command) -> str:
+        """Get the uri template of a retryable command.
+
+        Args:
+            command (Command): the Command
+
+        Returns:
+            str: the uri template or None if the command is not retryable
+        """
+        if command.method not in self.retryable_methods:
+            return None
+        return self.__matcher.match(command.uri)
+
+    def is_retryable_result(self, result: Command) -> bool:
+        """Check if a command result failed by a transient reason.
+
+        Args:
+            result (Command): the result Command
+
+        Returns:
+            bool: if the command should be retried
+        """
+        if result is None or result.status != CommandStatus.FAILURE:
+            return False
+        code = EnvelopeUtilities.get_reason_code(result)
+        return code in self.retryable_reason_codes
+
+    async def execute_async(
+        self,
+        command: Command,
+        process_async: Callable[[Command], Awaitable[Command]]
+    ) -> Command:
+        """Process a command, retrying it while allowed by the policy.
+
+        Args:
+            command (Command): the Command to be processed
+            process_async (Callable[[Command], Awaitable[Command]]): makes
+                one attempt to process the command
+
+        Raises:
+            TimeoutError: the last attempt timed out
+
+        Returns:
+            Command: the result Command of the last attempt
+        """
+        template = self.get_template(command)
+        if template is None:
+            return await process_async(command)
+
+        self.budget.deposit()
+        attempt = 0
+        attempt_command = command
+        while True:  # noqa: WPS457
+            result, error = None, None
+            try:
+                result = await process_async(attempt_command)
+            except AsyncTimeoutError as timeout_error:
+                error = timeout_error
+            if error is None and not self.is_retryable_result(result):
+                return result
+
+            attempt += 1
+            if not self.__can_retry(attempt):
+                if error is not None:
+                    raise error
+                return result
+
+            self.statistics.retries[template] += 1
+            await sleep(self.get_delay(attempt - 1))
+            attempt_command = EnvelopeUtilities.copy(command, str(uuid4()))
+
+    def __can_retry(self, attempt: int) -> bool:
+        if attempt >= self.max_attempts:
+            self.statistics.exhausted += 1
+            return False
+        if not self.budget.withdraw():
+            self.statistics.budget_denied += 1
+            return False
+        return True
@@ -0,0 +1,52 @@
+from asyncio import Future, ensure_future, shield
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Share one in-flight call between the concurrent calls with a key.
+
+    The first call with a key runs the action and the calls made with the
+    same key while it's running await its result, so identical concurrent
+    requests become a single round trip. The shared call is shielded, so
+    cancelling one of the callers doesn't cancel it for the others. Each
+    caller gets its own deep copy of the result, so changing it doesn't
+    affect the other callers.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self.__in_flight: Dict[Hashable, Future] = {}
+
+    @property
+    def in_flight(self) -> int:  # noqa: D102
+        return len(self.__in_flight)
+
+    async def execute_async(
+        self,
+        key: Hashable,
+        action_async: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run the action or join the in-flight call with the same key.
+
+        Args:
+            key (Hashable): the call key
+            action_async (Callable[[], Awaitable[Any]]): the action
+
+        Returns:
+            Any: a copy of the action result
+        """
+        self.calls += 1
+        future = self.__in_flight.get(key)
+        if future is None:
+            future = ensure_future(action_async())
+            self.__in_flight[key] = future
+            future.add_done_callback(lambda _: self.__complete(key, future))
+        else:
+            self.coalesced += 1
+        return deepcopy(await shield(future))
+
+    def __complete(self, key: Hashable, future: Future) -> None:
+        if self.__in_flight.get(key) is future:
+            del self.__in_flight[key]  # noqa: WPS420
@@ -0,0 +1,83 @@
+import re
+from typing import Iterable, List, Optional, Pattern
+
+PLACEHOLDER = re.compile(r'\{\d+\}')
+QUERY_PATTERN = '/?(?:\\?.*)?'
+SEGMENT_PATTERN = '[^/?]+'
+LIME_SCHEME = 'lime://'
+
+
+class UriTemplateMatcher:
+    """Find the uri template, like '/contexts/{0}', matching a command uri.
+
+    All the templates are compiled into a single regular expression, so a
+    uri is matched in one pass. Templates with fewer placeholders are
+    tried first, so '/models/summary' wins over '/models/{0}'. `match_all`
+    matches each template on its own, to find every template of a uri.
+    """
+
+    def __init__(self, templates: Iterable[str]) -> None:
+        self.templates = sorted(
+            set(templates),
+            key=lambda template: (
+                len(PLACEHOLDER.findall(template)),
+                -len(template)
+            )
+        )
+        alternatives = '|'.join(
+            f'(?P<t{index}>{self.__to_pattern(template)})'
+            for index, template in enumerate(self.templates)
+        )
+        self.__regex = re.compile(f'(?:{alternatives}){QUERY_PATTERN}')
+        self.__regexes: List[Pattern] = None
+
+    def match(self, uri: str) -> Optional[str]:
+        """Match a uri to its template.
+
+        Args:
+            uri (str): the command uri, with or without query and scheme
+
+        Returns:
+            Optional[str]: the template or None if no template matches
+        """
+        if not uri or not self.templates:
+            return None
+
+        match = self.__regex.fullmatch(self.__remove_scheme(uri))
+        if match is None:
+            return None
+        return self.templates[int(match.lastgroup[1:])]
+
+    def match_all(self, uri: str) -> List[str]:
+        """Match a uri to all its templates, in the `match` order.
+
+        Args:
+            uri (str): the command uri, with or without query and scheme
+
+        Returns:
+            List[str]: the templates matching the uri
+        """
+        if not uri:
+            return []
+        if self.__regexes is None:
+            self.__regexes = [
+                re.compile(f'{self.__to_pattern(template)}{QUERY_PATTERN}')
+                for template in self.templates
+            ]
+        path = self.__remove_scheme(uri)
+        return [
+            template
+            for template, regex in zip(self.templates, self.__regexes)
+            if regex.fullmatch(path)
+        ]
+
+    def __remove_scheme(self, uri: str) -> str:
+        if not uri.startswith(LIME_SCHEME):
+            return uri
+        path_start = uri.find('/', len(LIME_SCHEME))
+        return uri[path_start:] if path_start >= 0 else '/'
+
+    def __to_pattern(self, template: str) -> str:
+        return SEGMENT_PATTERN.join(
+            re.escape(part) for part in PLACEHOLDER.split(template)
+        )
@@ -0,0 +1,5 @@
+from .reconnection_supervisor import (ReconnectionMetrics,
+                                      ReconnectionSupervisor)
+from .connection_latency import ConnectionLatency
+from .drain_progress import DrainProgress
+from .offline_outbox import OfflineOutbox
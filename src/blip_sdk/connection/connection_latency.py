@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ConnectionLatency:
+    """Time spent in each connect phase, in seconds."""
+
+    transport_open: float = 0
+    session_establish: float = 0
+    bootstrap: float = 0
+
+    @property
+    def total(self) -> float:  # noqa: D102
+        return self.transport_open + self.session_establish + self.bootstrap
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DrainProgress:
+    """Work still in flight while a client is draining."""
+
+    running_receivers: int = 0
+    queued_receivers: int = 0
+    pending_commands: int = 0
+    elapsed: float = 0  # in seconds
+
+    @property
+    def remaining(self) -> int:  # noqa: D102
+        return self.running_receivers + self.queued_receivers + \
+            self.pending_commands
@@ -0,0 +1,129 @@
+from asyncio import Future, get_event_loop, wait_for
+from asyncio import TimeoutError as AsyncTimeoutError
+from collections import deque
+from time import monotonic
+from typing import Callable, Deque, List, Tuple
+
+from lime_python import Envelope
+
+from ..dispatching import OverflowPolicy
+
+OutboxItem = Tuple[Envelope, float]
+
+
+class OfflineOutbox:
+    """Hold the outbound envelopes while the session is being reestablished.
+
+    The envelopes are flushed in order once the new session is up, except
+    the ones waiting for longer than `ttl` seconds. When `max_size`
+    envelopes are held, the overflow policy drops the oldest envelope
+    (DROP_OLDEST) or rejects the new one (FAIL). If the session is not
+    reestablished, `fail` discards the envelopes and fails the waiting
+    commands.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 30,
+        overflow_policy: str = OverflowPolicy.DROP_OLDEST
+    ) -> None:
+        if overflow_policy == OverflowPolicy.BLOCK:
+            raise ValueError('The outbox cannot block sync sends')
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.overflow_policy = overflow_policy
+        self.offline = False
+        self.dropped = 0
+        self.expired = 0
+        self.flushed = 0
+        self.__items: Deque[OutboxItem] = deque()
+        self.__waiters: List[Future] = []
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def go_offline(self) -> None:
+        """Start holding the envelopes until the next flush."""
+        self.offline = True
+
+    def add(self, envelope: Envelope) -> None:
+        """Hold an envelope.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+
+        Raises:
+            ConnectionError: the outbox is full and the policy is FAIL
+        """
+        if len(self.__items) >= self.max_size:
+            if self.overflow_policy == OverflowPolicy.FAIL:
+                raise ConnectionError('The offline outbox is full')
+            self.__items.popleft()
+            self.dropped += 1
+        self.__items.append((envelope, monotonic() + self.ttl))
+
+    async def wait_online_async(self) -> None:
+        """Wait, for up to `ttl` seconds, until the outbox is flushed.
+
+        Raises:
+            ConnectionError: the session was not reestablished in time
+        """
+        if not self.offline:
+            return
+        waiter = get_event_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await wait_for(waiter, self.ttl)
+        except AsyncTimeoutError:
+            raise ConnectionError('The session was not reestablished')
+        finally:
+            if waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+
+    def flush(self, send: Callable[[Envelope], None]) -> None:
+        """Send the held envelopes in order and stop holding new ones.
+
+        If `send` raises, the envelope and the ones after it stay held and
+        the outbox stays offline until the next flush.
+
+        Args:
+            send (Callable[[Envelope], None]): sends an envelope
+        """
+        now = monotonic()
+        while self.__items:
+            envelope, expires_at = self.__items[0]
+            if expires_at >= now:
+                send(envelope)
+                self.flushed += 1
+            else:
+                self.expired += 1
+            self.__items.popleft()
+        self.offline = False
+        self.__release_waiters()
+
+    def fail(self, error: Exception) -> None:
+        """Discard the held envelopes and fail the waiting commands.
+
+        Args:
+            error (Exception): the error of the waiting commands
+        """
+        self.offline = False
+        self.dropped += len(self.__items)
+        self.__items.clear()
+        self.__release_waiters(error)
+
+    def clear(self) -> None:
+        """Discard the held envelopes and fail the waiting commands."""
+        self.fail(ConnectionError('The client was closed'))
+
+    def __release_waiters(self, error: Exception = None) -> None:
+        waiters, self.__waiters = self.__waiters, []
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
@@ -0,0 +1,103 @@
+from asyncio import CancelledError, Task, ensure_future, sleep
+from dataclasses import dataclass
+from random import uniform
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class ReconnectionMetrics:
+    """Reconnection counters collected by the supervisor."""
+
+    attempts: int = 0
+    reconnections: int = 0
+    failures: int = 0
+    last_delay: float = 0
+    last_error: Exception = None
+
+
+class ReconnectionSupervisor:
+    """Supervise transport reconnections without blocking the event loop."""
+
+    def __init__(
+        self,
+        reconnect_async: Callable[[], Awaitable[Any]],
+        base_delay: float = 0.1,
+        max_delay: float = 30,
+        jitter: float = 0.2,
+        max_attempts: int = 10
+    ) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.metrics = ReconnectionMetrics()
+        self.__reconnect_async = reconnect_async
+        self.__task: Task = None
+
+    @property
+    def reconnecting(self) -> bool:  # noqa: D102
+        return self.__task is not None and not self.__task.done()
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the backoff delay for an attempt.
+
+        The delay grows exponentially up to `max_delay` and a random jitter
+        of up to `jitter` times the delay is added to avoid reconnect storms.
+
+        Args:
+            attempt (int): the zero based attempt number
+
+        Returns:
+            float: the delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay + uniform(0, delay * self.jitter)  # noqa: S311
+
+    def schedule(self) -> Task:
+        """Schedule the reconnection task if it's not already running.
+
+        Returns:
+            Task: the reconnection task
+        """
+        if not self.reconnecting:
+            self.__task = ensure_future(self.__supervise_async())
+        return self.__task
+
+    def cancel(self) -> None:
+        """Cancel a running reconnection task."""
+        if self.reconnecting:
+            self.__task.cancel()
+
+    async def __supervise_async(self) -> Any:
+        for attempt in range(self.max_attempts):
+            delay = self.get_delay(attempt)
+            self.metrics.last_delay = delay
+            await sleep(delay)
+
+            self.metrics.attempts += 1
+            try:
+                result = await self.__reconnect_async()
+            except CancelledError:
+                raise
+            except Exception as error:
+                self.metrics.failures += 1
+                self.metrics.last_error = error
+                continue
+
+            self.metrics.reconnections += 1
+            return result
+
+        self.on_failed(ConnectionError(
+            f'Could not reconnect after {self.max_attempts} attempts'
+        ))
+        return None
+
+    def on_failed(self, error: ConnectionError) -> None:
+        """Handle callback to the reconnection giving up.
+
+        This method can be overwrited.
+
+        Args:
+            error (ConnectionError): the reconnection error
+        """
+        pass
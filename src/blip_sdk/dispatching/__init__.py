@@ -0,0 +1,7 @@
+from .dispatch_table import DispatchTable
+from .receiver_worker_pool import OverflowPolicy, ReceiverWorkerPool
+from .conversation_dispatcher import ConversationDispatcher
+from .acknowledgement_engine import AcknowledgementEngine
+from .deduplication_store import DeduplicationStore, LruDeduplicationStore
+from .sqlite_deduplication_store import SqliteDeduplicationStore
+from .router import Router
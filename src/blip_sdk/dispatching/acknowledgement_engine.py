@@ -0,0 +1,111 @@
+from asyncio import Future, gather, get_event_loop, isfuture
+from functools import partial
+from typing import Any, Callable, List
+
+from lime_python import (Message, Notification, NotificationEvent, Reason,
+                         ReasonCode)
+
+
+class AcknowledgementEngine:
+    """Send message receipts when the receivers really finish.
+
+    Receipts are buffered in order and handed to `send_notifications` as a
+    single batch once per event loop tick, so the receipts of the messages
+    handled in the same tick are written together.
+    """
+
+    def __init__(
+        self,
+        send_notifications: Callable[[List[Notification]], None],
+        notify_received: bool = True,
+        notify_consumed: bool = True
+    ) -> None:
+        self.notify_received = notify_received
+        self.notify_consumed = notify_consumed
+        self.__send_notifications = send_notifications
+        self.__pending: List[Notification] = []
+
+    @property
+    def pending(self) -> int:  # noqa: D102
+        return len(self.__pending)
+
+    def received(self, message: Message) -> None:
+        """Acknowledge that a message was received.
+
+        Args:
+            message (Message): the received Message
+        """
+        if self.notify_received:
+            self.__enqueue(
+                self.__create_notification(message, NotificationEvent.RECEIVED)
+            )
+
+    def processed(self, message: Message, results: List[Any]) -> None:
+        """Acknowledge a message once all its receivers results complete.
+
+        Args:
+            message (Message): the received Message
+            results (List[Any]): the receivers results, futures are awaited
+        """
+        futures = [result for result in results if isfuture(result)]
+        if not futures:
+            self.finished(message)
+            return
+
+        gather(*futures, return_exceptions=True).add_done_callback(
+            partial(self.__on_futures_done, message=message)
+        )
+
+    def finished(self, message: Message, error: BaseException = None) -> None:
+        """Acknowledge a message as CONSUMED or FAILED if there is an error.
+
+        Args:
+            message (Message): the received Message
+            error (BaseException): the receivers error
+        """
+        if error is not None:
+            notification = self.__create_notification(
+                message,
+                NotificationEvent.FAILED
+            )
+            notification.reason = Reason(
+                ReasonCode.APPLICATION_ERROR,
+                str(error)
+            )
+            self.__enqueue(notification)
+        elif self.notify_consumed:
+            self.__enqueue(
+                self.__create_notification(message, NotificationEvent.CONSUMED)
+            )
+
+    def flush(self) -> None:
+        """Send all the buffered receipts."""
+        pending, self.__pending = self.__pending, []
+        if pending:
+            self.__send_notifications(pending)
+
+    def __on_futures_done(self, future: Future, message: Message) -> None:
+        errors = [
+            result
+            for result in future.result()
+            if isinstance(result, BaseException)
+        ]
+        self.finished(message, errors[0] if errors else None)
+
+    def __enqueue(self, notification: Notification) -> None:
+        if not self.__pending:
+            get_event_loop().call_soon(self.flush)
+        self.__pending.append(notification)
+
+    def __create_notification(
+        self,
+        message: Message,
+        event: str
+    ) -> Notification:
+        notification = Notification(event)
+        notification.id = message.id
+        notification.to = message.pp if message.pp else message.from_n
+        notification.metadata = {
+            '#message.to': message.to
+        }
+        return notification
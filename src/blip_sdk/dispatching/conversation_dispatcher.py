@@ -0,0 +1,121 @@
+from asyncio import Future, get_event_loop
+from collections import deque
+from functools import partial
+from itertools import count
+from typing import Any, Awaitable, Callable, Deque, Dict, Tuple
+
+from .receiver_worker_pool import ReceiverWorkerPool, WorkItem, fail_dropped
+
+ShardItem = Tuple[int, WorkItem]
+
+
+class ConversationDispatcher:
+    """Run actions in order per conversation and in parallel across them.
+
+    Each conversation key owns a shard with the actions waiting for the
+    current one to finish. Actions are handed to the ReceiverWorkerPool one
+    at a time per shard and a shard is evicted as soon as it becomes idle,
+    so memory only grows with the number of conversations with pending
+    work. Each waiting action reserves a slot of the pool queue, so a
+    chatty conversation is bounded by the pool queue size and its overflow
+    policy, and DROP_OLDEST may drop the oldest waiting action of any
+    conversation.
+    """
+
+    def __init__(self, pool: ReceiverWorkerPool) -> None:
+        self.__pool = pool
+        self.__pool.on_drop_reserved = self.__drop_oldest
+        self.__shards: Dict[str, Deque[ShardItem]] = {}
+        self.__sequence = count()
+        self.__pending = 0
+
+    @property
+    def active_conversations(self) -> int:  # noqa: D102
+        return len(self.__shards)
+
+    @property
+    def queue_depth(self) -> int:  # noqa: D102
+        return self.__pending
+
+    def submit(
+        self,
+        key: str,
+        action_async: Callable[..., Awaitable[Any]],
+        *args
+    ) -> Future:
+        """Submit an action to run after the previous ones of a conversation.
+
+        Args:
+            key (str): the conversation key
+            action_async (Callable[..., Awaitable[Any]]): the coroutine function
+            args: the action arguments
+
+        Returns:
+            Future: resolved with the action result when it completes
+        """  # noqa: DAR401, E501
+        item: WorkItem = (action_async, args, get_event_loop().create_future())
+        shard = self.__shards.get(key)
+        if shard is not None:
+            self.__pool.reserve()
+            shard.append((next(self.__sequence), item))
+            self.__pending += 1
+            return item[2]
+
+        self.__shards[key] = deque()
+        try:
+            self.__start(key, item, self.__pool.submit)
+        except Exception:
+            del self.__shards[key]
+            raise
+        return item[2]
+
+    def __start(
+        self,
+        key: str,
+        item: WorkItem,
+        submit: Callable[..., Future]
+    ) -> None:
+        action_async, args, future = item
+        result = submit(action_async, *args)
+        result.add_done_callback(
+            partial(self.__on_done, key=key, future=future)
+        )
+
+    def __on_done(self, result: Future, key: str, future: Future) -> None:
+        if not future.done():
+            if result.cancelled():
+                future.cancel()
+            elif result.exception():
+                future.set_exception(result.exception())
+            else:
+                future.set_result(result.result())
+        self.__start_next(key)
+
+    def __start_next(self, key: str) -> None:
+        shard = self.__shards[key]
+        while shard:
+            self.__pending -= 1
+            _, item = shard.popleft()
+            try:
+                self.__start(key, item, self.__pool.submit_reserved)
+            except Exception as error:
+                item[2].set_exception(error)
+                continue
+            return
+        del self.__shards[key]
+
+    def __drop_oldest(self) -> None:
+        oldest = min(
+            (
+                (shard[0][0], key)
+                for key, shard in self.__shards.items()
+                if shard
+            ),
+            default=None
+        )
+        if oldest is None:
+            return
+        _, item = self.__shards[oldest[1]].popleft()
+        self.__pending -= 1
+        self.__pool.release()
+        fail_dropped(item[2])
@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict
+
+
+class DeduplicationStore(ABC):
+    """Class base to the stores of recently received message ids."""
+
+    def __init__(self, ttl: float = 600) -> None:
+        self.ttl = ttl
+        self.duplicates = 0
+
+    @abstractmethod
+    def add(self, message_id: str) -> bool:
+        """Add a message id to the store.
+
+        Args:
+            message_id (str): the message id
+
+        Returns:
+            bool: False if the id was added and is not expired yet
+        """
+
+    @abstractmethod
+    def remove(self, message_id: str) -> None:
+        """Remove a message id, so its next delivery is handled again.
+
+        Args:
+            message_id (str): the message id
+        """
+
+    def is_duplicate(self, message_id: str) -> bool:
+        """Check if a message was already received and mark it as received.
+
+        Args:
+            message_id (str): the message id
+
+        Returns:
+            bool: if the message was already received
+        """
+        if self.add(message_id):
+            return False
+        self.duplicates += 1
+        return True
+
+    async def is_duplicate_async(self, message_id: str) -> bool:
+        """Check if a message was already received without blocking the loop.
+
+        Stores doing blocking I/O must overwrite it to run off the loop.
+
+        Args:
+            message_id (str): the message id
+
+        Returns:
+            bool: if the message was already received
+        """
+        return self.is_duplicate(message_id)
+
+    async def remove_async(self, message_id: str) -> None:
+        """Remove a message id without blocking the loop.
+
+        Stores doing blocking I/O must overwrite it to run off the loop.
+
+        Args:
+            message_id (str): the message id
+        """
+        self.remove(message_id)
+
+
+class LruDeduplicationStore(DeduplicationStore):
+    """In memory store bounded by size and ttl.
+
+    The ids are kept in insertion order, which is also their expiration
+    order, so expired and least recent ids are evicted from the front in
+    O(1) and memory never grows beyond `max_size` ids.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 600) -> None:
+        super().__init__(ttl)
+        self.max_size = max_size
+        self.__expirations: Dict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__expirations)
+
+    def add(self, message_id: str) -> bool:  # noqa: D102
+        now = monotonic()
+        self.__evict(now)
+        if message_id in self.__expirations:
+            return False
+
+        self.__expirations[message_id] = now + self.ttl
+        if len(self.__expirations) > self.max_size:
+            self.__expirations.popitem(last=False)
+        return True
+
+    def remove(self, message_id: str) -> None:  # noqa: D102
+        self.__expirations.pop(message_id, None)
+
+    def __evict(self, now: float) -> None:
+        while self.__expirations:
+            message_id, expires_at = next(iter(self.__expirations.items()))
+            if expires_at > now:
+                return
+            del self.__expirations[message_id]  # noqa: WPS420
@@ -0,0 +1,109 @@
+from itertools import count
+from typing import Dict, Iterator, List
+
+from lime_python import Envelope
+
+from ..receiver import Receiver
+from ..utilities import EnvelopeUtilities
+
+
+class DispatchTable:
+    """Receivers indexed by their declarative filters.
+
+    Receivers with a `type_n`, `from_domain` or `to_node` are stored in hash
+    indexes, so only the receivers that may handle an envelope are checked.
+    Receivers without declarative filters are always checked.
+    """
+
+    def __init__(self) -> None:
+        self.__sequence = count()
+        self.__positions: Dict[Receiver, int] = {}
+        self.__by_type: Dict[str, List[Receiver]] = {}
+        self.__by_from_domain: Dict[str, List[Receiver]] = {}
+        self.__by_to_node: Dict[str, List[Receiver]] = {}
+        self.__fallback: List[Receiver] = []
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self.__positions)
+
+    def __iter__(self) -> Iterator[Receiver]:  # noqa: D105
+        return iter(self.__positions)
+
+    def add(self, receiver: Receiver) -> None:
+        """Add a receiver to the table.
+
+        Args:
+            receiver (Receiver): the Receiver
+        """
+        self.__positions[receiver] = next(self.__sequence)
+        self.__get_bucket(receiver, True).append(receiver)
+
+    def remove(self, receiver: Receiver) -> None:
+        """Remove a receiver from the table.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Raises:
+            ValueError: the receiver is not in the table
+        """
+        if receiver not in self.__positions:
+            raise ValueError('Receiver not found')
+        del self.__positions[receiver]
+        self.__get_bucket(receiver).remove(receiver)
+
+    def get_receivers(self, envelope: Envelope) -> List[Receiver]:
+        """Get the receivers matching an envelope in registration order.
+
+        Args:
+            envelope (Envelope): the received Envelope
+
+        Returns:
+            List[Receiver]: the matching receivers
+        """
+        candidates = self.__fallback.copy()
+        candidates.extend(
+            self.__by_type.get(getattr(envelope, 'type_n', None), ())
+        )
+        if self.__by_from_domain:
+            candidates.extend(
+                self.__by_from_domain.get(
+                    EnvelopeUtilities.get_domain(envelope.from_n), ()
+                )
+            )
+        if self.__by_to_node:
+            candidates.extend(
+                self.__by_to_node.get(
+                    EnvelopeUtilities.get_identity(envelope.to), ()
+                )
+            )
+
+        if len(candidates) > len(self.__fallback):
+            candidates.sort(key=self.__positions.get)
+
+        return [
+            receiver
+            for receiver in candidates
+            if receiver.matches(envelope)
+        ]
+
+    def __get_bucket(
+        self,
+        receiver: Receiver,
+        create: bool = False
+    ) -> List[Receiver]:
+        if receiver.type_n:
+            index, key = self.__by_type, receiver.type_n
+        elif receiver.from_domain:
+            index, key = self.__by_from_domain, receiver.from_domain
+        elif receiver.to_node:
+            index, key = self.__by_to_node, receiver.to_node
+        else:
+            return self.__fallback
+
+        if create:
+            return index.setdefault(key, [])
+        bucket = index[key]
+        if len(bucket) == 1:
+            del index[key]
+        return bucket
@@ -0,0 +1,210 @@
+from asyncio import Future, QueueFull, Task, ensure_future, get_event_loop
+from collections import deque
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Set, Tuple
+
+
+class OverflowPolicy:
+    """What to do with an envelope when the receivers queue is full."""
+
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    FAIL = 'fail'
+
+
+DROPPED_REASON = 'Dropped by the overflow policy'
+
+WorkItem = Tuple[Callable[..., Awaitable[Any]], tuple, Future]
+
+
+def fail_dropped(future: Future) -> None:
+    """Fail the future of an action dropped by the overflow policy.
+
+    Args:
+        future (Future): the action future
+    """
+    future.set_exception(QueueFull(DROPPED_REASON))
+    # the futures of fire and forget receivers are never awaited
+    future.add_done_callback(lambda dropped: dropped.exception())
+
+
+class ReceiverWorkerPool:
+    """Run coroutine receivers with a bounded concurrency.
+
+    Actions beyond `max_concurrency` wait in a queue of `max_queue_size`
+    items. When the queue is full the `overflow_policy` decides if the pool
+    pushes back on the intake (BLOCK), replaces the oldest queued action
+    (DROP_OLDEST) or rejects the new action with a QueueFull error (FAIL).
+
+    Actions waiting outside the pool, like the conversation backlogs of
+    the ConversationDispatcher, take a queue slot with `reserve` and are
+    handed over with `submit_reserved`, so they count toward the same bound
+    and policy. DROP_OLDEST drops the oldest queued action, or asks
+    `on_drop_reserved` to drop a reserved one when the queue is empty.
+
+    Under BLOCK the pool becomes saturated once the queue is full and
+    reports it to `on_saturation_changed`, so the client holds the inbound
+    messages and notifications until a slot frees. Dropped actions fail
+    with a QueueFull error, so their receipts carry the reason.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        max_queue_size: int = None,
+        overflow_policy: str = OverflowPolicy.BLOCK
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self.rejected = 0
+        self.saturated = False
+        self.__reserved = 0
+        self.__queue: Deque[WorkItem] = deque()
+        self.__tasks: Set[Task] = set()
+
+    @property
+    def queue_depth(self) -> int:  # noqa: D102
+        return len(self.__queue)
+
+    @property
+    def in_flight(self) -> int:  # noqa: D102
+        return len(self.__tasks)
+
+    @property
+    def reserved(self) -> int:  # noqa: D102
+        return self.__reserved
+
+    def submit(
+        self,
+        action_async: Callable[..., Awaitable[Any]],
+        *args
+    ) -> Future:
+        """Submit a coroutine function to run on the pool.
+
+        Args:
+            action_async (Callable[..., Awaitable[Any]]): the coroutine function
+            args: the action arguments
+
+        Raises:
+            QueueFull: the queue is full and the policy is FAIL
+
+        Returns:
+            Future: resolved with the action result when it completes
+        """  # noqa: E501
+        if not self.__has_free_worker() and self.__is_queue_full():
+            self.__make_room()
+        return self.__enqueue(action_async, args)
+
+    def reserve(self) -> None:
+        """Take a queue slot for an action waiting outside the pool.
+
+        Raises:
+            QueueFull: the queue is full and the policy is FAIL
+        """
+        if self.__is_queue_full():
+            self.__make_room()
+        self.__reserved += 1
+        self.__update_saturation()
+
+    def release(self) -> None:
+        """Give back a slot taken with `reserve` without submitting."""
+        self.__reserved -= 1
+        self.__update_saturation()
+
+    def submit_reserved(
+        self,
+        action_async: Callable[..., Awaitable[Any]],
+        *args
+    ) -> Future:
+        """Submit an action to the slot taken for it with `reserve`.
+
+        Args:
+            action_async (Callable[..., Awaitable[Any]]): the coroutine function
+            args: the action arguments
+
+        Returns:
+            Future: resolved with the action result when it completes
+        """  # noqa: E501
+        self.__reserved -= 1
+        return self.__enqueue(action_async, args)
+
+    def on_drop_reserved(self) -> None:
+        """Handle callback to drop the oldest reserved action.
+
+        This method can be overwrited.
+        """
+        pass
+
+    def on_saturation_changed(self, saturated: bool) -> None:
+        """Handle callback to the BLOCK queue filling up or freeing a slot.
+
+        This method can be overwrited.
+
+        Args:
+            saturated (bool): True if the intake should pause
+        """
+        pass
+
+    def __has_free_worker(self) -> bool:
+        return self.max_concurrency is None or \
+            len(self.__tasks) < self.max_concurrency
+
+    def __is_queue_full(self) -> bool:
+        return bool(self.max_queue_size) and \
+            len(self.__queue) + self.__reserved >= self.max_queue_size
+
+    def __make_room(self) -> None:
+        if self.overflow_policy == OverflowPolicy.FAIL:
+            self.rejected += 1
+            raise QueueFull('The receivers queue is full')
+        if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+            self.dropped += 1
+            if self.__queue:
+                self.__drop(self.__queue.popleft())
+            else:
+                self.on_drop_reserved()
+
+    def __enqueue(
+        self,
+        action_async: Callable[..., Awaitable[Any]],
+        args: tuple
+    ) -> Future:
+        item: WorkItem = (action_async, args, get_event_loop().create_future())
+        if self.__has_free_worker():
+            self.__start(item)
+        else:
+            self.__queue.append(item)
+            self.__update_saturation()
+        return item[2]
+
+    def __drop(self, item: WorkItem) -> None:
+        fail_dropped(item[2])
+
+    def __start(self, item: WorkItem) -> None:
+        action_async, args, future = item
+        task = ensure_future(action_async(*args))
+        self.__tasks.add(task)
+        task.add_done_callback(partial(self.__on_task_done, future=future))
+
+    def __on_task_done(self, task: Task, future: Future) -> None:
+        self.__tasks.discard(task)
+        if not future.done():
+            if task.cancelled():
+                future.cancel()
+            elif task.exception():
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        while self.__queue and self.__has_free_worker():
+            self.__start(self.__queue.popleft())
+        self.__update_saturation()
+
+    def __update_saturation(self) -> None:
+        saturated = self.overflow_policy == OverflowPolicy.BLOCK and \
+            self.__is_queue_full()
+        if self.saturated != saturated:
+            self.saturated = saturated
+            self.on_saturation_changed(saturated)
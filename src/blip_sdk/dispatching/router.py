@@ -0,0 +1,275 @@
+from __future__ import annotations
+import re
+from functools import partial
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional,
+                    Pattern, Tuple)
+
+from lime_python import Command, Envelope
+
+from ..commands import UriTemplateMatcher
+from ..receiver import ExecutionMode, Receiver
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+Handler = Callable[[Envelope], Any]
+CommandRoute = Tuple[Optional[str], Receiver]
+
+TEXT_PLAIN = 'text/plain'
+
+
+class Router:
+    """Route each received envelope to a single decorated handler.
+
+    The text patterns are compiled once and searched in registration order,
+    so the first registered pattern found in a 'text/plain' message wins.
+    They are not joined into one alternation: the re engine retries every
+    alternative at each position and loses the literal prefix search of
+    each pattern, so in `benchmarks/router_benchmark.py` the alternation is
+    only faster when a late pattern matches near the start of the text,
+    and up to 80 times slower when the first pattern matches. Messages not
+    matched by a pattern go to the handler of their type, then to the
+    default handler. Commands are routed by their uri template and method,
+    falling through to the other templates of the uri when a template has
+    no route for the method. Each route becomes a Receiver, so the handlers
+    keep the client execution modes and acknowledgements, and an envelope
+    is routed once for the predicates of all the route receivers.
+    """
+
+    def __init__(self) -> None:
+        self.__text_receivers: List[Receiver] = []
+        self.__type_receivers: Dict[str, Receiver] = {}
+        self.__default_receiver: Receiver = None
+        self.__command_routes: Dict[str, List[CommandRoute]] = {}
+        self.__text_regexes: List[Pattern] = []
+        self.__uri_matcher: UriTemplateMatcher = None
+        self.__last_envelope: Envelope = None
+        self.__last_receiver: Receiver = None
+
+    @property
+    def message_receivers(self) -> List[Receiver]:  # noqa: D102
+        receivers = self.__text_receivers + list(
+            self.__type_receivers.values()
+        )
+        if self.__default_receiver:
+            receivers.append(self.__default_receiver)
+        return receivers
+
+    @property
+    def command_receivers(self) -> List[Receiver]:  # noqa: D102
+        return [
+            receiver
+            for routes in self.__command_routes.values()
+            for _, receiver in routes
+        ]
+
+    def text(
+        self,
+        pattern: str,
+        flags: int = 0,
+        execution_mode: str = ExecutionMode.INLINE
+    ) -> Callable[[Handler], Handler]:
+        """Route the 'text/plain' messages containing a pattern.
+
+        Args:
+            pattern (str): the regular expression
+            flags (int): the re flags
+            execution_mode (str): the ExecutionMode of the handler
+
+        Returns:
+            Callable[[Handler], Handler]: the handler decorator
+        """
+        regex = re.compile(pattern, flags)
+
+        def decorator(handler: Handler) -> Handler:
+            self.__text_regexes.append(regex)
+            self.__text_receivers.append(
+                self.__create_receiver(handler, execution_mode, TEXT_PLAIN)
+            )
+            return handler
+        return decorator
+
+    def type(  # noqa: A003
+        self,
+        type_n: str,
+        execution_mode: str = ExecutionMode.INLINE
+    ) -> Callable[[Handler], Handler]:
+        """Route the messages of a type not matched by a text pattern.
+
+        Args:
+            type_n (str): the message type, like 'application/json'
+            execution_mode (str): the ExecutionMode of the handler
+
+        Raises:
+            ValueError: the type is already routed
+
+        Returns:
+            Callable[[Handler], Handler]: the handler decorator
+        """
+        if type_n in self.__type_receivers:
+            raise ValueError(f'The type {type_n} is already routed')
+
+        def decorator(handler: Handler) -> Handler:
+            self.__type_receivers[type_n] = self.__create_receiver(
+                handler,
+                execution_mode,
+                type_n
+            )
+            return handler
+        return decorator
+
+    def default(
+        self,
+        execution_mode: str = ExecutionMode.INLINE
+    ) -> Callable[[Handler], Handler]:
+        """Route the messages not matched by any other route.
+
+        Args:
+            execution_mode (str): the ExecutionMode of the handler
+
+        Raises:
+            ValueError: the default handler is already set
+
+        Returns:
+            Callable[[Handler], Handler]: the handler decorator
+        """
+        if self.__default_receiver:
+            raise ValueError('The default handler is already set')
+
+        def decorator(handler: Handler) -> Handler:
+            self.__default_receiver = self.__create_receiver(
+                handler,
+                execution_mode
+            )
+            return handler
+        return decorator
+
+    def command(
+        self,
+        uri_template: str,
+        method: str = None,
+        execution_mode: str = ExecutionMode.INLINE
+    ) -> Callable[[Handler], Handler]:
+        """Route the commands to an uri template, like '/contexts/{0}'.
+
+        Args:
+            uri_template (str): the uri template
+            method (str): the CommandMethod, None to route all the methods
+            execution_mode (str): the ExecutionMode of the handler
+
+        Returns:
+            Callable[[Handler], Handler]: the handler decorator
+        """
+        def decorator(handler: Handler) -> Handler:
+            self.__command_routes.setdefault(uri_template, []).append(
+                (method, self.__create_receiver(handler, execution_mode))
+            )
+            self.__uri_matcher = None
+            return handler
+        return decorator
+
+    def route(self, envelope: Envelope) -> Optional[Receiver]:
+        """Get the receiver of the handler routed to an envelope.
+
+        The last routed envelope is remembered, so the predicates of all the
+        route receivers share a single scan.
+
+        Args:
+            envelope (Envelope): the received Message or Command
+
+        Returns:
+            Optional[Receiver]: the receiver or None if no route matches
+        """
+        if envelope is not self.__last_envelope:
+            self.__last_receiver = self.__route_command(envelope) \
+                if isinstance(envelope, Command) \
+                else self.__route_message(envelope)
+            self.__last_envelope = envelope
+        return self.__last_receiver
+
+    def attach(self, client: Client) -> Callable[[], None]:
+        """Add the route receivers to a client.
+
+        Routes declared after attaching are not added to the client.
+
+        Args:
+            client (Client): the Client
+
+        Returns:
+            Callable[[], None]: a method to remove the receivers
+        """
+        self.__last_envelope = None
+        removers = [
+            client.add_message_receiver(receiver)
+            for receiver in self.message_receivers
+        ]
+        removers.extend(
+            client.add_command_receiver(receiver)
+            for receiver in self.command_receivers
+        )
+
+        def detach() -> None:
+            for remove in removers:
+                remove()
+        return detach
+
+    def __route_message(self, message: Envelope) -> Optional[Receiver]:
+        type_n = getattr(message, 'type_n', None)
+        if type_n == TEXT_PLAIN and self.__text_receivers:
+            content = message.content
+            index = self.__search_text(content) \
+                if isinstance(content, str) else None
+            if index is not None:
+                return self.__text_receivers[index]
+        return self.__type_receivers.get(type_n, self.__default_receiver)
+
+    def __search_text(self, content: str) -> Optional[int]:
+        for index, regex in enumerate(self.__text_regexes):
+            if regex.search(content):
+                return index
+        return None
+
+    def __route_command(self, command: Command) -> Optional[Receiver]:
+        if self.__uri_matcher is None:
+            self.__uri_matcher = UriTemplateMatcher(self.__command_routes)
+        template = self.__uri_matcher.match(command.uri)
+        if template is None:
+            return None
+        receiver = self.__route_template(template, command.method)
+        if receiver is not None:
+            return receiver
+
+        for fallback in self.__uri_matcher.match_all(command.uri)[1:]:
+            receiver = self.__route_template(fallback, command.method)
+            if receiver is not None:
+                return receiver
+        return None
+
+    def __route_template(
+        self,
+        template: Optional[str],
+        method: str
+    ) -> Optional[Receiver]:
+        for route_method, receiver in self.__command_routes.get(template, ()):
+            if route_method is None or route_method == method:
+                return receiver
+        return None
+
+    def __create_receiver(
+        self,
+        handler: Handler,
+        execution_mode: str,
+        type_n: str = None
+    ) -> Receiver:
+        receiver = Receiver(
+            True,
+            handler,
+            type_n=type_n,
+            execution_mode=execution_mode
+        )
+        receiver.predicate = partial(self.__is_routed, receiver)
+        self.__last_envelope = None
+        return receiver
+
+    def __is_routed(self, receiver: Receiver, envelope: Envelope) -> bool:
+        return self.route(envelope) is receiver
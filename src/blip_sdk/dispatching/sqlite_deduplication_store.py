@@ -0,0 +1,80 @@
+from asyncio import get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+from sqlite3 import connect
+from threading import Lock
+from time import time
+
+from .deduplication_store import DeduplicationStore
+
+CLEANUP_INTERVAL = 1000  # in added ids
+
+
+class SqliteDeduplicationStore(DeduplicationStore):
+    """Store shared by the clients using the same SQLite database file.
+
+    Several processes can share the file, so a message redelivered to
+    another instance after a reconnect is also detected. Expired ids are
+    deleted every `CLEANUP_INTERVAL` additions. The client checks the ids
+    on a single worker thread, so a locked database never blocks the event
+    loop and the messages keep their order.
+    """
+
+    def __init__(self, path: str, ttl: float = 600) -> None:
+        super().__init__(ttl)
+        self.path = path
+        self.__lock = Lock()
+        self.__additions = 0
+        self.__executor = ThreadPoolExecutor(1)
+        self.__connection = connect(
+            path,
+            timeout=5,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS message_ids ' +
+            '(id TEXT PRIMARY KEY, expires_at REAL NOT NULL)'
+        )
+
+    def add(self, message_id: str) -> bool:  # noqa: D102
+        now = time()
+        with self.__lock:
+            self.__additions += 1
+            if self.__additions % CLEANUP_INTERVAL == 0:
+                self.__connection.execute(
+                    'DELETE FROM message_ids WHERE expires_at <= ?',
+                    (now,)
+                )
+            cursor = self.__connection.execute(
+                'INSERT INTO message_ids (id, expires_at) VALUES (?, ?) ' +
+                'ON CONFLICT (id) DO UPDATE SET expires_at = ' +
+                'excluded.expires_at WHERE message_ids.expires_at <= ?',
+                (message_id, now + self.ttl, now)
+            )
+            return cursor.rowcount == 1
+
+    def remove(self, message_id: str) -> None:  # noqa: D102
+        with self.__lock:
+            self.__connection.execute(
+                'DELETE FROM message_ids WHERE id = ?',
+                (message_id,)
+            )
+
+    async def is_duplicate_async(self, message_id: str) -> bool:  # noqa: D102, E501
+        return await get_event_loop().run_in_executor(
+            self.__executor,
+            self.is_duplicate,
+            message_id
+        )
+
+    async def remove_async(self, message_id: str) -> None:  # noqa: D102
+        await get_event_loop().run_in_executor(
+            self.__executor,
+            self.remove,
+            message_id
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.__executor.shutdown()
+        self.__connection.close()
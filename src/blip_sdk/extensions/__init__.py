@@ -1,6 +1,11 @@
+from typing import Any
+
 from .extension_base import ExtensionBase
-from .media import MediaExtension
-from .chat import ChatExtension
-from .artificial_intelligence import AIExtension
-from .analytics import AnalyticsExtension
-from .contexts import ContextsExtension
+from .extension_loader import EXTENSION_MODULES, load_extension
+from .uri_templates import get_uri_templates
+
+
+def __getattr__(name: str) -> Any:
+    if name in EXTENSION_MODULES:
+        return load_extension(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,10 +1,12 @@
 from __future__ import annotations
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict
 from urllib.parse import urlencode
 from uuid import uuid4
 from humps import camelize
 from lime_python import Command, CommandMethod
 
+from ..commands import ResponseCache, SingleFlight
 from ..utilities import RequestUtilities
 
 if TYPE_CHECKING:
@@ -12,11 +14,20 @@ if TYPE_CHECKING:
 
 
 class ExtensionBase:
-    """Class base to all sdk extensions."""
+    """Class base to all sdk extensions.
+
+    When `coalesce_gets` is enabled, concurrent GET commands with the same
+    `to` and `uri` share one in-flight command and its response. When a
+    `response_cache` is set, GET responses are served from it and write
+    commands invalidate it.
+    """
 
     def __init__(self, client: Client, to: str = None) -> None:
         self.client = client
         self.to = to
+        self.coalesce_gets = False
+        self.single_flight = SingleFlight()
+        self.response_cache: ResponseCache = None
 
     def create_get_command(
         self,
@@ -134,7 +145,23 @@ class ExtensionBase:
             Command: the response
         """
         command.id = command.id if command.id else str(uuid4())
-        return await self.client.process_command_async(command)
+        if command.method != CommandMethod.GET:
+            try:
+                return await self.client.process_command_async(command)
+            finally:
+                if self.response_cache is not None:
+                    self.response_cache.invalidate(command)
+
+        if self.response_cache is None:
+            return await self.__process_get_command_async(command)
+
+        cached_response = self.response_cache.get(command)
+        if cached_response is not None:
+            return cached_response
+        version = self.response_cache.version
+        response = await self.__process_get_command_async(command)
+        self.response_cache.set(command, response, version)
+        return response
 
     def build_resource_query(
         self,
@@ -193,3 +220,11 @@ class ExtensionBase:
         for index, value in enumerate(args):
             uri = uri.replace(f'{{{index}}}', RequestUtilities.quote(value))
         return uri
+
+    async def __process_get_command_async(self, command: Command) -> Command:
+        if not self.coalesce_gets:
+            return await self.client.process_command_async(command)
+        return await self.single_flight.execute_async(
+            (command.to, command.uri),
+            partial(self.client.process_command_async, command)
+        )
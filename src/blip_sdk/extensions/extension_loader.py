@@ -0,0 +1,35 @@
+from importlib import import_module
+from typing import Type
+
+from .extension_base import ExtensionBase
+
+EXTENSION_MODULES = {
+    'AIExtension': 'artificial_intelligence',
+    'AnalyticsExtension': 'analytics',
+    'ChatExtension': 'chat',
+    'ContextsExtension': 'contexts',
+    'MediaExtension': 'media'
+}
+
+
+def load_extension(name: str) -> Type[ExtensionBase]:
+    """Import an extension package on first use and get its class.
+
+    The extension packages, specially `artificial_intelligence`, are only
+    imported when the extension is first requested, keeping the sdk import
+    fast for short-lived processes.
+
+    Args:
+        name (str): the extension class name, like 'ChatExtension'
+
+    Raises:
+        ValueError: the extension is unknown
+
+    Returns:
+        Type[ExtensionBase]: the extension class
+    """
+    module_name = EXTENSION_MODULES.get(name)
+    if module_name is None:
+        raise ValueError(f'Unknown extension {name}')
+    module = import_module(f'.{module_name}', __package__)
+    return getattr(module, name)
@@ -0,0 +1,35 @@
+from typing import List
+
+
+def get_uri_templates() -> List[str]:
+    """Get the uri templates of all the sdk extensions.
+
+    Returns:
+        List[str]: the uri templates, without duplicates
+    """
+    from .analytics.uri_templates import UriTemplates as Analytics
+    from .artificial_intelligence import (ai_analytics, ai_model,
+                                          content_assistant, entities,
+                                          intents, word_set)
+    from .chat.uri_templates import UriTemplates as Chat
+    from .contexts.uri_templates import UriTemplates as Contexts
+    from .media.uri_templates import UriTemplates as Media
+
+    templates_classes = [
+        Analytics,
+        Chat,
+        Contexts,
+        Media,
+        ai_analytics.UriTemplates,
+        ai_model.UriTemplates,
+        content_assistant.UriTemplates,
+        entities.UriTemplates,
+        intents.UriTemplates,
+        word_set.UriTemplates
+    ]
+    templates: List[str] = []
+    for templates_class in templates_classes:
+        for name, template in vars(templates_class).items():
+            if name.isupper() and template not in templates:
+                templates.append(template)
+    return templates
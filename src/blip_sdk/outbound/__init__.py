@@ -0,0 +1,3 @@
+from .flow_control import OutboundFlowControl
+from .priority_scheduler import OutboundPriority, PriorityScheduler
+from .rate_limiter import RateLimiter, RateLimiterStatistics, TokenBucket
@@ -0,0 +1,173 @@
+from asyncio import (Future, Task, ensure_future, get_event_loop, sleep,
+                     wait)
+from collections import deque
+from typing import Callable, Deque, Dict, Tuple
+
+from lime_python import Envelope
+
+from ..utilities import EnvelopeUtilities
+from .priority_scheduler import OutboundPriority, PriorityScheduler
+
+BUFFER_POLLING_INTERVAL = 0.01  # in seconds
+
+OutboundItem = Tuple[Envelope, Callable[[Envelope], None], Future, int]
+
+
+class OutboundFlowControl:
+    """Queue outbound envelopes and apply backpressure to the senders.
+
+    Envelopes are written to the transport by a single writer task, which
+    yields to the event loop between writes. The queue is a
+    PriorityScheduler, so commands and receipts are written ahead of bulk
+    messages while each priority class keeps its order. Senders wait while
+    the queue is above `high_water_envelopes` or `high_water_bytes`, and
+    the writer waits while the transport write buffer, reported by
+    `get_buffer_size`, is above `write_buffer_high_water`, so the envelopes
+    wait in the scheduler, where the priorities apply, instead of in the
+    socket. A high water mark of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        high_water_envelopes: int = None,
+        high_water_bytes: int = None,
+        get_buffer_size: Callable[[], int] = None,
+        priority_weights: Dict[str, int] = None,
+        write_buffer_high_water: int = None
+    ) -> None:
+        self.high_water_envelopes = high_water_envelopes
+        self.high_water_bytes = high_water_bytes
+        self.write_buffer_high_water = write_buffer_high_water
+        self.__get_buffer_size = get_buffer_size or (lambda: 0)
+        self.__queue = PriorityScheduler(priority_weights)
+        self.__queued_bytes = 0
+        self.__waiters: Deque[Future] = deque()
+        self.__writer: Task = None
+
+    @property
+    def queued_envelopes(self) -> int:  # noqa: D102
+        return len(self.__queue)
+
+    @property
+    def queued_bytes(self) -> int:  # noqa: D102
+        return self.__queued_bytes
+
+    def get_queue_depth(self, priority: str) -> int:
+        """Get the number of envelopes queued in a priority class.
+
+        Args:
+            priority (str): the OutboundPriority class
+
+        Returns:
+            int: the queued envelopes
+        """
+        return self.__queue.get_queue_depth(priority)
+
+    @property
+    def is_full(self) -> bool:  # noqa: D102
+        if self.high_water_envelopes and \
+                len(self.__queue) >= self.high_water_envelopes:
+            return True
+        return bool(self.high_water_bytes) and \
+            self.__queued_bytes >= self.high_water_bytes
+
+    async def send_async(
+        self,
+        envelope: Envelope,
+        send: Callable[[Envelope], None],
+        priority: str = None
+    ) -> None:
+        """Queue an envelope and wait until it's written to the transport.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+            send (Callable[[Envelope], None]): writes the envelope
+            priority (str): the OutboundPriority class, None to use the
+                envelope type default
+        """
+        while self.is_full:
+            waiter = get_event_loop().create_future()
+            self.__waiters.append(waiter)
+            await waiter
+
+        await self.send_nowait(envelope, send, priority)
+
+    def send_nowait(
+        self,
+        envelope: Envelope,
+        send: Callable[[Envelope], None],
+        priority: str = None
+    ) -> Future:
+        """Queue an envelope without waiting for the queue to have room.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+            send (Callable[[Envelope], None]): writes the envelope
+            priority (str): the OutboundPriority class, None to use the
+                envelope type default
+
+        Returns:
+            Future: resolved when the envelope is written to the transport
+        """
+        priority = priority or OutboundPriority.get_default(envelope)
+        size = len(EnvelopeUtilities.serialize(envelope)) \
+            if self.high_water_bytes else 0
+        future = get_event_loop().create_future()
+        self.__queue.push(priority, (envelope, send, future, size))
+        self.__queued_bytes += size
+
+        if self.__writer is None or self.__writer.done():
+            self.__writer = ensure_future(self.__write_async())
+        return future
+
+    async def wait_turn_async(
+        self,
+        envelope: Envelope,
+        priority: str = None
+    ) -> None:
+        """Wait until an envelope written by the caller is the next to go.
+
+        The caller is resumed before the writer writes the next envelope,
+        so it must write the envelope before awaiting anything else.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+            priority (str): the OutboundPriority class, None to use the
+                envelope type default
+        """
+        await self.send_async(envelope, lambda _: None, priority)
+
+    async def join_async(self, timeout: float = None) -> None:
+        """Wait until the queued envelopes are written.
+
+        Args:
+            timeout (float): max time to wait, in seconds
+        """
+        if self.__writer is not None and not self.__writer.done():
+            await wait({self.__writer}, timeout=timeout)
+
+    async def __write_async(self) -> None:
+        while self.__queue:
+            while self.write_buffer_high_water and \
+                    self.__get_buffer_size() >= self.write_buffer_high_water:
+                await sleep(BUFFER_POLLING_INTERVAL)
+
+            envelope, send, future, size = self.__queue.pop()
+            self.__queued_bytes -= size
+            try:
+                send(envelope)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+            self.__wake_waiters()
+            await sleep(0)
+
+    def __wake_waiters(self) -> None:
+        while self.__waiters and not self.is_full:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
@@ -0,0 +1,116 @@
+from collections import deque
+from typing import Any, Deque, Dict
+
+from lime_python import Command, Envelope, Notification
+
+
+class OutboundPriority:
+    """Priority classes of the outbound envelopes, from highest to lowest."""
+
+    COMMAND = 'command'
+    RECEIPT = 'receipt'
+    NOTIFICATION = 'notification'
+    INTERACTIVE = 'interactive'
+    BULK = 'bulk'
+
+    @staticmethod
+    def get_default(envelope: Envelope) -> str:
+        """Get the priority class of an envelope by its type.
+
+        Args:
+            envelope (Envelope): the Envelope
+
+        Returns:
+            str: the priority class, INTERACTIVE for messages
+        """
+        if isinstance(envelope, Command):
+            return OutboundPriority.COMMAND
+        if isinstance(envelope, Notification):
+            return OutboundPriority.NOTIFICATION
+        return OutboundPriority.INTERACTIVE
+
+
+DEFAULT_WEIGHTS = {
+    OutboundPriority.COMMAND: 16,
+    OutboundPriority.RECEIPT: 8,
+    OutboundPriority.NOTIFICATION: 4,
+    OutboundPriority.INTERACTIVE: 2,
+    OutboundPriority.BULK: 1
+}
+
+
+class PriorityScheduler:
+    """Queue items by priority class and dequeue them by weighted fairness.
+
+    Each class has its own fifo queue. Items are dequeued with smooth
+    weighted round robin over the non empty classes, so a class with weight
+    8 is served 8 times as often as a class with weight 1 and no backlogged
+    class starves.
+    """
+
+    def __init__(self, weights: Dict[str, int] = None) -> None:
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.__queues: Dict[str, Deque[Any]] = {
+            priority: deque() for priority in self.weights
+        }
+        self.__credits: Dict[str, int] = {
+            priority: 0 for priority in self.weights
+        }
+        self.__length = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def get_queue_depth(self, priority: str) -> int:
+        """Get the number of items queued in a priority class.
+
+        Args:
+            priority (str): the priority class
+
+        Returns:
+            int: the queued items
+        """
+        return len(self.__queues[priority])
+
+    def push(self, priority: str, item: Any) -> None:
+        """Queue an item.
+
+        Args:
+            priority (str): the OutboundPriority class of the item
+            item (Any): the item
+
+        Raises:
+            ValueError: if the priority class is unknown
+        """
+        if priority not in self.__queues:
+            raise ValueError(f'Unknown priority {priority}')
+        self.__queues[priority].append(item)
+        self.__length += 1
+
+    def pop(self) -> Any:
+        """Dequeue the next item.
+
+        Returns:
+            Any: the item
+
+        Raises:
+            IndexError: if there are no queued items
+        """
+        backlogged = [
+            priority for priority, queue in self.__queues.items() if queue
+        ]
+        if not backlogged:
+            raise IndexError('pop from an empty scheduler')
+
+        total_weight = 0
+        for priority in backlogged:
+            self.__credits[priority] += self.weights[priority]
+            total_weight += self.weights[priority]
+        selected = max(backlogged, key=lambda key: self.__credits[key])
+        self.__credits[selected] -= total_weight
+
+        self.__length -= 1
+        item = self.__queues[selected].popleft()
+        if not self.__queues[selected]:
+            self.__credits[selected] = 0
+        return item
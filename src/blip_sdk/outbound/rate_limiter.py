@@ -0,0 +1,180 @@
+from asyncio import get_event_loop, sleep
+from dataclasses import dataclass
+from typing import Dict, List
+
+from lime_python import Envelope
+
+from ..utilities import EnvelopeUtilities
+
+POSTMASTER_PREFIX = 'postmaster@'
+MAX_BUCKETS = 10000
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `capacity`.
+
+    Tokens are reserved in advance, so the balance can go negative and each
+    reservation waits its turn instead of being rejected.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.__tokens = capacity
+        self.__updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Reserve a token.
+
+        Args:
+            now (float): the current time, in seconds
+
+        Returns:
+            float: the delay, in seconds, until the token is available
+        """
+        self.__refill(now)
+        self.__tokens -= 1
+        if self.__tokens >= 0:
+            return 0
+        return -self.__tokens / self.rate
+
+    def is_idle(self, now: float) -> bool:
+        """Check if the bucket is full, so dropping it loses no state.
+
+        Args:
+            now (float): the current time, in seconds
+
+        Returns:
+            bool: if the bucket is full
+        """
+        self.__refill(now)
+        return self.__tokens >= self.capacity
+
+    def __refill(self, now: float) -> None:
+        elapsed = max(now - self.__updated_at, 0)
+        self.__tokens = min(
+            self.capacity,
+            self.__tokens + elapsed * self.rate
+        )
+        self.__updated_at = now
+
+
+@dataclass
+class RateLimiterStatistics:
+    """Wait counters collected by the rate limiter."""
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0  # in seconds
+    max_wait: float = 0  # in seconds
+
+    @property
+    def average_wait(self) -> float:  # noqa: D102
+        return self.total_wait / self.acquired if self.acquired else 0
+
+
+class RateLimiter:
+    """Shape outbound traffic with global, destination and target buckets.
+
+    Every envelope takes a token from the global bucket. Envelopes sent to a
+    `postmaster@` node also take a token from the bucket of that target
+    (e.g. `postmaster@ai.msging.net`) and the others from the bucket of
+    their destination node. A rate of None disables its buckets, and each
+    bucket holds up to `burst` tokens, its rate by default.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = None,
+        destination_rate: float = None,
+        postmaster_rate: float = None,
+        burst: int = None
+    ) -> None:
+        self.global_rate = global_rate
+        self.destination_rate = destination_rate
+        self.postmaster_rate = postmaster_rate
+        self.burst = burst
+        self.statistics = RateLimiterStatistics()
+        self.__global_bucket: TokenBucket = None
+        self.__buckets: Dict[str, TokenBucket] = {}
+
+    @property
+    def enabled(self) -> bool:  # noqa: D102
+        return bool(
+            self.global_rate or self.destination_rate or self.postmaster_rate
+        )
+
+    def reserve(self, envelope: Envelope) -> float:
+        """Reserve the tokens needed to send an envelope.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+
+        Returns:
+            float: the delay, in seconds, before the envelope can be sent
+        """
+        now = get_event_loop().time()
+        buckets = self.__get_buckets(envelope, now)
+        delay = max([bucket.reserve(now) for bucket in buckets], default=0)
+        self.statistics.acquired += 1
+        if delay > 0:
+            self.statistics.delayed += 1
+            self.statistics.total_wait += delay
+            self.statistics.max_wait = max(self.statistics.max_wait, delay)
+        return delay
+
+    async def acquire_async(self, envelope: Envelope) -> None:
+        """Wait until an envelope can be sent.
+
+        Args:
+            envelope (Envelope): the Envelope to be sent
+        """
+        if not self.enabled:
+            return
+        delay = self.reserve(envelope)
+        if delay > 0:
+            await sleep(delay)
+
+    def __get_buckets(
+        self,
+        envelope: Envelope,
+        now: float
+    ) -> List[TokenBucket]:
+        buckets = []
+        if self.global_rate:
+            if self.__global_bucket is None:
+                self.__global_bucket = self.__create_bucket(
+                    self.global_rate,
+                    now
+                )
+            buckets.append(self.__global_bucket)
+
+        destination = EnvelopeUtilities.get_identity(envelope.to)
+        if not destination:
+            return buckets
+
+        is_postmaster = destination.startswith(POSTMASTER_PREFIX)
+        rate = self.postmaster_rate if is_postmaster \
+            else self.destination_rate
+        if rate:
+            buckets.append(self.__get_bucket(destination, rate, now))
+        return buckets
+
+    def __get_bucket(self, key: str, rate: float, now: float) -> TokenBucket:
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            if len(self.__buckets) >= MAX_BUCKETS:
+                self.__evict_idle_buckets(now)
+            bucket = self.__create_bucket(rate, now)
+            self.__buckets[key] = bucket
+        return bucket
+
+    def __create_bucket(self, rate: float, now: float) -> TokenBucket:
+        return TokenBucket(rate, self.burst or max(rate, 1), now)
+
+    def __evict_idle_buckets(self, now: float) -> None:
+        self.__buckets = {
+            key: bucket
+            for key, bucket in self.__buckets.items()
+            if not bucket.is_idle(now)
+        }
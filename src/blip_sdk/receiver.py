@@ -3,6 +3,16 @@ from uuid import uuid4
 
 from lime_python import Envelope
 
+from .utilities import EnvelopeUtilities
+
+
+class ExecutionMode:
+    """Where a synchronous receiver callback runs."""
+
+    INLINE = 'inline'
+    THREAD_POOL = 'thread_pool'
+    PROCESS_POOL = 'process_pool'
+
 
 class Receiver:
     """Receiver base class."""
@@ -10,10 +20,18 @@ class Receiver:
     def __init__(
         self,
         predicate: Callable[[Envelope], bool],
-        callback: Callable[[Envelope], None]
+        callback: Callable[[Envelope], None],
+        type_n: str = None,
+        from_domain: str = None,
+        to_node: str = None,
+        execution_mode: str = ExecutionMode.INLINE
     ) -> None:
         self.predicate: Callable[[Envelope], bool] = predicate
         self.callback: Callable[[Envelope], None] = callback
+        self.type_n: str = type_n
+        self.from_domain: str = from_domain.lower() if from_domain else None
+        self.to_node: str = EnvelopeUtilities.get_identity(to_node)
+        self.execution_mode: str = execution_mode
         self.id = str(uuid4())
 
     def __eq__(self, other: object) -> bool:  # noqa: D105
@@ -34,3 +52,26 @@ class Receiver:
             self.__predicate = lambda _: value in [True, None]  # noqa: WPS510
             return
         self.__predicate = value
+
+    @property
+    def is_declarative(self) -> bool:  # noqa: D102
+        return bool(self.type_n or self.from_domain or self.to_node)
+
+    def matches(self, envelope: Envelope) -> bool:
+        """Check the declarative filters and then the predicate.
+
+        Args:
+            envelope (Envelope): the received Envelope
+
+        Returns:
+            bool: True if the receiver should handle the Envelope
+        """
+        if self.type_n and getattr(envelope, 'type_n', None) != self.type_n:
+            return False
+        if self.from_domain and \
+                EnvelopeUtilities.get_domain(envelope.from_n) != self.from_domain:  # noqa: E501
+            return False
+        if self.to_node and \
+                EnvelopeUtilities.get_identity(envelope.to) != self.to_node:
+            return False
+        return self.predicate(envelope)
@@ -0,0 +1,4 @@
+from .codec_websocket_transport import CodecWebSocketTransport
+from .json_codec import (JSON_CODECS, JsonCodec, OrjsonCodec, UjsonCodec,
+                         get_json_codec)
+from .lazy_message import LazyMessage
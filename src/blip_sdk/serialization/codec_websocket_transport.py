@@ -0,0 +1,123 @@
+import logging
+from asyncio import ensure_future
+from typing import Any, List
+
+from lime_python import SessionCompression, SessionEncryption, Transport
+
+from .json_codec import JsonCodec, RawEnvelope
+
+LIME_SUBPROTOCOL = 'lime'
+
+
+class CodecWebSocketTransport(Transport):
+    """WebSocket transport encoding and decoding envelopes with a JsonCodec.
+
+    It behaves like `lime_transport_websocket.WebSocketTransport`, but reads
+    and writes the frames itself through the public `websockets` api, which
+    is only imported when the transport opens. Install it with the
+    `websocket` extra, `pip install blip-sdk[websocket]`. The client sets
+    the codec configured with `ClientBuilder.with_json_codec` through
+    `set_json_codec`, on every transport created by the transport factory.
+    """
+
+    def __init__(
+        self,
+        is_trace_enabled: bool = False,
+        json_codec: JsonCodec = None
+    ) -> None:
+        super().__init__(SessionCompression.NONE, SessionEncryption.NONE)
+        self.is_trace_enabled = is_trace_enabled
+        self.json_codec = json_codec or JsonCodec()
+        self.logger = print
+        if logging.root.level <= logging.DEBUG:
+            self.logger = logging.getLogger().debug
+        self.websocket: Any = None
+
+    def set_json_codec(self, json_codec: JsonCodec) -> None:
+        """Set the codec of the envelopes.
+
+        Args:
+            json_codec (JsonCodec): the codec
+        """
+        self.json_codec = json_codec
+
+    async def open_async(self, uri: str = None) -> None:  # noqa: D102
+        from websockets.client import connect  # noqa: WPS433
+
+        if self.websocket and self.websocket.open:
+            error = ValueError('Cannot open an already open connection')
+            self.on_error(error)
+            raise error
+
+        self.encryption = SessionEncryption.TLS \
+            if uri.startswith('wss://') else SessionEncryption.NONE
+        self.compression = SessionCompression.NONE
+
+        self.websocket = await connect(uri, subprotocols=[LIME_SUBPROTOCOL])
+        self.on_open()
+
+        ensure_future(self.__receive_async())
+
+    async def close_async(self) -> None:  # noqa: D102
+        await self.websocket.close()
+        self.on_close()
+
+    def send(self, envelope: dict) -> None:  # noqa: D102
+        if not self.websocket or not self.websocket.open:
+            error = ValueError('The connection is not open')
+            self.on_error(error)
+            raise error
+
+        raw_envelope = self.json_codec.encode(envelope)
+        if self.is_trace_enabled:
+            self.logger(f'WebSocket SEND: {raw_envelope}')
+
+        ensure_future(self.websocket.send(raw_envelope))
+
+    def get_supported_compression(self) -> List[str]:  # noqa: D102
+        return [SessionCompression.NONE]
+
+    def set_compression(self, compression: str) -> None:  # noqa: D102
+        pass
+
+    def get_supported_encryption(self) -> List[str]:  # noqa: D102
+        return [SessionEncryption.TLS, SessionEncryption.NONE]
+
+    def set_encryption(self, encryption: str) -> None:  # noqa: D102
+        pass
+
+    def on_envelope(self, envelope: dict) -> None:  # noqa: D102
+        pass
+
+    def on_open(self) -> None:
+        """Handle on websocket open callback."""
+        pass
+
+    def on_close(self) -> None:  # noqa: WPS123
+        """Handle on websocket close callback."""
+        pass
+
+    def on_error(self, err: Any) -> None:
+        """Handle on websocket error callback.
+
+        Args:
+            err (Any): the exception
+        """
+        pass
+
+    async def __receive_async(self) -> None:
+        from websockets.exceptions import ConnectionClosed  # noqa: WPS433
+
+        try:
+            while True:  # noqa: WPS457
+                self.__on_raw_envelope(await self.websocket.recv())
+        except ConnectionClosed:
+            if self.is_trace_enabled:
+                self.logger(
+                    'Stopped receiving messages due to closed connection'
+                )
+
+    def __on_raw_envelope(self, raw_envelope: RawEnvelope) -> None:
+        if self.is_trace_enabled:
+            self.logger(f'WebSocket RECEIVE: {raw_envelope}')
+        self.on_envelope(self.json_codec.decode(raw_envelope))
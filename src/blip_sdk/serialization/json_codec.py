@@ -0,0 +1,109 @@
+from json import dumps, loads
+from typing import Any, Dict, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+COMPACT_SEPARATORS = (',', ':')
+FASTEST = 'fastest'
+
+RawEnvelope = Union[str, bytes]
+
+
+class JsonCodec:
+    """Encode and decode the envelopes exchanged with the transport."""
+
+    name = 'json'
+
+    def encode(self, envelope: Dict[str, Any]) -> str:
+        """Encode an envelope json to a compact json str.
+
+        Args:
+            envelope (Dict[str, Any]): the envelope json
+
+        Returns:
+            str: the compact json
+        """
+        return dumps(envelope, separators=COMPACT_SEPARATORS)
+
+    def decode(self, raw_envelope: RawEnvelope) -> Dict[str, Any]:
+        """Decode a json str or bytes to an envelope json.
+
+        Args:
+            raw_envelope (RawEnvelope): the json
+
+        Returns:
+            Dict[str, Any]: the envelope json
+        """
+        return loads(raw_envelope)
+
+
+class OrjsonCodec(JsonCodec):
+    """Json codec backed by the optional `orjson` package."""
+
+    name = 'orjson'
+
+    def encode(self, envelope: Dict[str, Any]) -> str:  # noqa: D102
+        return orjson.dumps(envelope).decode()
+
+    def decode(self, raw_envelope: RawEnvelope) -> Dict[str, Any]:  # noqa: D102, E501
+        return orjson.loads(raw_envelope)
+
+
+class UjsonCodec(JsonCodec):
+    """Json codec backed by the optional `ujson` package."""
+
+    name = 'ujson'
+
+    def encode(self, envelope: Dict[str, Any]) -> str:  # noqa: D102
+        return ujson.dumps(
+            envelope,
+            ensure_ascii=False,
+            escape_forward_slashes=False
+        )
+
+    def decode(self, raw_envelope: RawEnvelope) -> Dict[str, Any]:  # noqa: D102, E501
+        return ujson.loads(raw_envelope)
+
+
+JSON_CODECS: Dict[str, Type[JsonCodec]] = {JsonCodec.name: JsonCodec}
+if ujson is not None:
+    JSON_CODECS[UjsonCodec.name] = UjsonCodec
+if orjson is not None:
+    JSON_CODECS[OrjsonCodec.name] = OrjsonCodec
+
+
+def get_json_codec(name: str = FASTEST) -> JsonCodec:
+    """Get a json codec by its name.
+
+    The codecs of the optional packages are only available when the package
+    is installed. 'fastest' picks `orjson`, then `ujson`, then the stdlib.
+
+    Args:
+        name (str): 'json', 'orjson', 'ujson' or 'fastest'
+
+    Raises:
+        ValueError: the codec is unknown or its package is not installed
+
+    Returns:
+        JsonCodec: the codec
+    """
+    if name == FASTEST:
+        name = next(
+            (
+                codec for codec in (OrjsonCodec.name, UjsonCodec.name)
+                if codec in JSON_CODECS
+            ),
+            JsonCodec.name
+        )
+    codec_type = JSON_CODECS.get(name)
+    if codec_type is None:
+        raise ValueError(f'The json codec {name} is not available')
+    return codec_type()
@@ -0,0 +1,83 @@
+from typing import Any, Dict
+
+from lime_python import Message
+
+CONTENT_KEY = 'content'
+METADATA_KEY = 'metadata'
+HEADER_KEYS = (
+    ('id', 'id'),
+    ('from', 'from_n'),
+    ('to', 'to'),
+    ('pp', 'pp'),
+    ('type', 'type_n')
+)
+
+
+class LazyMessage(Message):
+    """Message built from a raw envelope, materializing its body on access.
+
+    Only the header fields (`id`, `from_n`, `to`, `pp` and `type_n`) are
+    read eagerly, without the key conversion of `Message.from_json`. The
+    `content`, `metadata` and any other field are taken from the raw
+    envelope on first access, so messages dropped by the receiver
+    predicates cost almost nothing.
+    """
+
+    def __init__(self, raw_envelope: Dict[str, Any]) -> None:  # noqa: WPS231
+        self.__raw_envelope = raw_envelope
+        self.__materialized = False
+        for key, attribute in HEADER_KEYS:
+            setattr(self, attribute, raw_envelope.get(key))
+
+    @property
+    def content(self) -> Any:  # noqa: D102
+        self.__materialize()
+        return self.__dict__[CONTENT_KEY]
+
+    @content.setter
+    def content(self, content: Any) -> None:  # noqa: WPS440
+        self.__materialize()
+        self.__dict__[CONTENT_KEY] = content
+
+    @property
+    def metadata(self) -> Dict[str, str]:  # noqa: D102
+        self.__materialize()
+        return self.__dict__[METADATA_KEY]
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, str]) -> None:  # noqa: WPS440
+        self.__materialize()
+        self.__dict__[METADATA_KEY] = metadata
+
+    @property
+    def is_materialized(self) -> bool:  # noqa: D102
+        return self.__materialized
+
+    def to_json(self) -> dict:
+        """Transform the message to json, materializing its body.
+
+        Returns:
+            dict: the message json representation
+        """
+        self.__materialize()
+        return super().to_json()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_') or self.__materialized:
+            raise AttributeError(name)
+        self.__materialize()
+        return getattr(self, name)
+
+    def __materialize(self) -> None:
+        if self.__materialized:
+            return
+        self.__materialized = True
+        headers = {key for key, _ in HEADER_KEYS}
+        body = Message.from_json({
+            key: field_value
+            for key, field_value in self.__raw_envelope.items()
+            if key not in headers
+        })
+        for attribute, attribute_value in vars(body).items():  # noqa: WPS421
+            if attribute not in self.__dict__:
+                self.__dict__[attribute] = attribute_value
@@ -0,0 +1,3 @@
+from .frames import Frames
+from .worker_client import WorkerClient
+from .sharded_process_runner import ShardedProcessRunner
@@ -0,0 +1,59 @@
+from importlib import import_module
+from typing import Optional, Tuple
+
+ErrorFrame = Tuple[str, str, str]
+
+
+class Frames:
+    """Kinds of the frames exchanged between the runner and its workers."""
+
+    # parent to worker
+    MESSAGE = 'm'
+    COMMAND_RESULT = 'r'
+    STOP = 's'
+
+    # worker to parent
+    SEND = 'e'
+    PROCESS_COMMAND = 'c'
+    PROCESSED = 'p'
+
+
+def dump_error(error: Exception) -> Optional[ErrorFrame]:
+    """Describe an error with plain strings, as exceptions may not pickle.
+
+    Args:
+        error (Exception): the error or None
+
+    Returns:
+        Optional[ErrorFrame]: the error module, type name and message
+    """
+    if error is None:
+        return None
+    error_type = type(error)
+    return (error_type.__module__, error_type.__qualname__, str(error))
+
+
+def load_error(frame: Optional[ErrorFrame]) -> Optional[Exception]:
+    """Rebuild an error described by `dump_error`.
+
+    The error is created with its message as the only argument, without
+    calling its constructor. Errors whose type cannot be imported are
+    rebuilt as a RuntimeError naming the original type.
+
+    Args:
+        frame (Optional[ErrorFrame]): the error module, type and message
+
+    Returns:
+        Optional[Exception]: the error or None
+    """
+    if frame is None:
+        return None
+    module_name, type_name, message = frame
+    try:
+        error_type = getattr(import_module(module_name), type_name)
+        if isinstance(error_type, type) and \
+                issubclass(error_type, Exception):
+            return error_type.__new__(error_type, message)
+    except Exception:  # noqa: S110
+        pass
+    return RuntimeError(f'{type_name}: {message}')
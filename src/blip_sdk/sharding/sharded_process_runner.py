@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from asyncio import (AbstractEventLoop, Future, ensure_future, gather,
+                     get_event_loop, wait)
+from itertools import count
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from threading import Thread
+from typing import TYPE_CHECKING, Callable, Dict, List
+from zlib import crc32
+
+from lime_python import Command, Envelope, Message, Notification
+
+from ..receiver import Receiver
+from ..utilities import EnvelopeUtilities
+from .frames import Frames, dump_error
+from .worker_client import WorkerClient, run_worker
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+LIVENESS_INTERVAL = 1  # in seconds
+STOP_TIMEOUT = 5  # in seconds
+
+
+class ShardedProcessRunner:
+    """Run the message receivers on a pool of worker processes.
+
+    The Client and its session stay in the parent process. Each inbound
+    Message is sent, as compact json, to the worker chosen by the hash of
+    its sender, so a conversation is always handled by the same process.
+    Workers register their receivers through `setup`, a picklable function
+    receiving a WorkerClient, and their outbound envelopes and commands are
+    sent back through the parent Client. The message receipts are sent by
+    the parent when the worker finishes handling the message.
+
+    A message fails if its worker dies or if it is not handled within
+    `dispatch_timeout` seconds, when set. A dead worker is replaced by a new
+    process with a new inbound queue, so its shard keeps being handled.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        setup: Callable[[WorkerClient], None],
+        processes: int = 2,
+        start_method: str = 'spawn',
+        dispatch_timeout: float = None
+    ) -> None:
+        if processes < 1:
+            raise ValueError('processes must be greater than 0')
+
+        self.client = client
+        self.setup = setup
+        self.processes = processes
+        self.dispatch_timeout = dispatch_timeout
+        self.__context = get_context(start_method)
+        self.__outbound = self.__context.Queue()
+        self.__inbounds: List = []
+        self.__workers: List = []
+        self.__reader: Thread = None
+        self.__loop: AbstractEventLoop = None
+        self.__pending: Dict[int, Future] = {}
+        self.__dispatch_ids = count()
+        self.__remove_receiver: Callable[[], None] = None
+
+    @property
+    def pending(self) -> int:  # noqa: D102
+        return len(self.__pending)
+
+    def start(self) -> None:
+        """Start the worker processes and forward the client messages."""
+        self.__loop = get_event_loop()
+        self.__inbounds = [None] * self.processes
+        self.__workers = [None] * self.processes
+        for index in range(self.processes):
+            self.__start_worker(index)
+
+        self.__reader = Thread(target=self.__read_outbound, daemon=True)
+        self.__reader.start()
+        self.__remove_receiver = self.client.add_message_receiver(
+            Receiver(True, self.__dispatch_async)
+        )
+
+    async def stop_async(self) -> None:
+        """Stop forwarding messages and wait for the workers to finish.
+
+        The processes are joined in the default executor, so the event loop
+        keeps running, and the ones still alive after `STOP_TIMEOUT` seconds
+        are terminated.
+        """
+        if self.__remove_receiver:
+            self.__remove_receiver()
+            self.__remove_receiver = None
+        workers = self.__workers
+        self.__workers = []
+        for inbound in self.__inbounds:
+            inbound.put((Frames.STOP,))
+        self.__inbounds = []
+        await gather(*[self.__join_worker_async(worker) for worker in workers])
+        self.__outbound.put(None)
+        await self.__loop.run_in_executor(
+            None,
+            self.__reader.join,
+            STOP_TIMEOUT
+        )
+        for future in self.__pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError('The runner was stopped')
+                )
+
+    def get_shard(self, message: Message) -> int:
+        """Get the index of the worker handling the message sender.
+
+        Args:
+            message (Message): the Message
+
+        Returns:
+            int: the worker index
+        """
+        sender = EnvelopeUtilities.get_identity(
+            message.pp if message.pp else message.from_n
+        )
+        return crc32((sender or '').encode()) % self.processes
+
+    async def __dispatch_async(self, message: Message) -> None:
+        dispatch_id = next(self.__dispatch_ids)
+        future = self.__loop.create_future()
+        self.__pending[dispatch_id] = future
+        shard = self.get_shard(message)
+        worker = self.__workers[shard]
+        if not worker.is_alive():
+            self.__respawn_worker(shard, worker)
+            worker = self.__workers[shard]
+        self.__inbounds[shard].put((
+            Frames.MESSAGE,
+            dispatch_id,
+            EnvelopeUtilities.serialize(message)
+        ))
+        try:
+            error = await self.__wait_processed_async(future, shard, worker)
+        finally:
+            self.__pending.pop(dispatch_id, None)
+        if error is not None:
+            raise ValueError(error)
+
+    async def __wait_processed_async(
+        self,
+        future: Future,
+        shard: int,
+        worker: BaseProcess
+    ) -> str:
+        deadline = None if self.dispatch_timeout is None \
+            else self.__loop.time() + self.dispatch_timeout
+        while not future.done():
+            timeout = LIVENESS_INTERVAL if deadline is None \
+                else min(LIVENESS_INTERVAL, deadline - self.__loop.time())
+            await wait({future}, timeout=max(timeout, 0))
+            if future.done():
+                break
+            if not worker.is_alive():
+                self.__respawn_worker(shard, worker)
+                raise ConnectionError(f'The worker {worker.name} died')
+            if deadline is not None and self.__loop.time() >= deadline:
+                raise TimeoutError('The worker did not handle the message')
+        return future.result()
+
+    def __start_worker(self, index: int) -> None:
+        inbound = self.__context.Queue()
+        worker = self.__context.Process(
+            target=run_worker,
+            args=(
+                index,
+                inbound,
+                self.__outbound,
+                self.client.application.command_timeout,
+                self.setup
+            ),
+            daemon=True
+        )
+        worker.start()
+        self.__inbounds[index] = inbound
+        self.__workers[index] = worker
+
+    def __respawn_worker(self, index: int, worker: BaseProcess) -> None:
+        if self.__workers and self.__workers[index] is worker:
+            # the frames left for the dead worker are never read
+            self.__inbounds[index].cancel_join_thread()
+            self.__start_worker(index)
+
+    async def __join_worker_async(self, worker: BaseProcess) -> None:
+        await self.__loop.run_in_executor(None, worker.join, STOP_TIMEOUT)
+        if worker.is_alive():
+            worker.terminate()
+            await self.__loop.run_in_executor(
+                None,
+                worker.join,
+                STOP_TIMEOUT
+            )
+
+    def __read_outbound(self) -> None:
+        while True:  # noqa: WPS457
+            frame = self.__outbound.get()
+            if frame is None:
+                return
+            self.__loop.call_soon_threadsafe(self.__handle_frame, frame)
+
+    def __handle_frame(self, frame: tuple) -> None:
+        if frame[0] == Frames.PROCESSED:
+            future = self.__pending.get(frame[1])
+            if future and not future.done():
+                future.set_result(frame[2])
+        elif frame[0] == Frames.SEND:
+            self.__send(EnvelopeUtilities.deserialize(frame[1]))
+        elif frame[0] == Frames.PROCESS_COMMAND:
+            ensure_future(self.__process_command_async(*frame[1:]))
+
+    def __send(self, envelope: Envelope) -> None:
+        if isinstance(envelope, Message):
+            self.client.send_message(envelope)
+        elif isinstance(envelope, Notification):
+            self.client.send_notification(envelope)
+        elif isinstance(envelope, Command):
+            self.client.send_command(envelope)
+
+    async def __process_command_async(
+        self,
+        index: int,
+        request_id: int,
+        raw_command: str,
+        timeout: float
+    ) -> None:
+        # a respawned worker gets a new queue, the results of its
+        # predecessor go to the old one
+        inbound = self.__inbounds[index]
+        raw_result, error = None, None
+        try:
+            result = await self.client.process_command_async(
+                EnvelopeUtilities.deserialize(raw_command, Command),
+                timeout
+            )
+            raw_result = EnvelopeUtilities.serialize(result)
+        except Exception as exception:
+            error = exception
+        inbound.put(
+            (Frames.COMMAND_RESULT, request_id, raw_result, dump_error(error))
+        )
@@ -0,0 +1,188 @@
+from asyncio import (Future, gather, get_event_loop, iscoroutinefunction,
+                     new_event_loop, set_event_loop, wait_for)
+from itertools import count
+from multiprocessing import Queue
+from typing import Any, Callable, Dict, List
+
+from lime_python import Command, Envelope, Message, Notification
+
+from ..dispatching import DispatchTable
+from ..receiver import Receiver
+from ..utilities import EnvelopeUtilities
+from .frames import ErrorFrame, Frames, load_error
+
+
+class WorkerClient:
+    """Client used by receivers running in a sharded worker process.
+
+    It exposes the sending and receiver registration methods of Client and
+    forwards outbound envelopes and commands to the parent process, which
+    owns the session.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        inbound: Queue,
+        outbound: Queue,
+        command_timeout: float
+    ) -> None:
+        self.index = index
+        self.command_timeout = command_timeout
+        self.__inbound = inbound
+        self.__outbound = outbound
+        self.__message_receivers = DispatchTable()
+        self.__command_futures: Dict[int, Future] = {}
+        self.__request_ids = count()
+
+    def add_message_receiver(self, receiver: Receiver) -> Callable[[], None]:
+        """Add a message receiver.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        self.__message_receivers.add(receiver)
+        return lambda: self.__message_receivers.remove(receiver)
+
+    def send_message(self, message: Message) -> None:
+        """Send a Message through the parent process.
+
+        Args:
+            message (Message): Message to be sent
+        """
+        self.__send(message)
+
+    def send_notification(self, notification: Notification) -> None:
+        """Send a Notification through the parent process.
+
+        Args:
+            notification (Notification): Notification to be sent
+        """
+        self.__send(notification)
+
+    def send_command(self, command: Command) -> None:
+        """Send a Command through the parent process.
+
+        Args:
+            command (Command): Command to be sent
+        """
+        self.__send(command)
+
+    async def process_command_async(
+        self,
+        command: Command,
+        timeout: float = None
+    ) -> Command:
+        """Process a Command through the parent process.
+
+        Args:
+            command (Command): The Command to be processed
+            timeout (float): Timeout to process the Command
+
+        Returns:
+            Command: The result Command
+        """
+        timeout = timeout if timeout else self.command_timeout
+        request_id = next(self.__request_ids)
+        future = get_event_loop().create_future()
+        self.__command_futures[request_id] = future
+        self.__outbound.put((
+            Frames.PROCESS_COMMAND,
+            self.index,
+            request_id,
+            EnvelopeUtilities.serialize(command),
+            timeout
+        ))
+        try:
+            return await wait_for(future, timeout)
+        finally:
+            self.__command_futures.pop(request_id, None)
+
+    async def run_async(self) -> None:
+        """Handle the frames sent by the parent until it asks to stop."""
+        loop = get_event_loop()
+        while True:  # noqa: WPS457
+            frame = await loop.run_in_executor(None, self.__inbound.get)
+            if frame[0] == Frames.STOP:
+                return
+            if frame[0] == Frames.COMMAND_RESULT:
+                self.__resolve_command(*frame[1:])
+            elif frame[0] == Frames.MESSAGE:
+                self.__dispatch(frame[1], frame[2])
+
+    def __send(self, envelope: Envelope) -> None:
+        self.__outbound.put(
+            (Frames.SEND, EnvelopeUtilities.serialize(envelope))
+        )
+
+    def __resolve_command(
+        self,
+        request_id: int,
+        raw_command: str,
+        error_frame: ErrorFrame
+    ) -> None:
+        future = self.__command_futures.get(request_id)
+        if future is None or future.done():
+            return
+        if error_frame is not None:
+            future.set_exception(load_error(error_frame))
+            return
+        future.set_result(
+            EnvelopeUtilities.deserialize(raw_command, Command)
+        )
+
+    def __dispatch(self, dispatch_id: int, raw_message: str) -> None:
+        message = EnvelopeUtilities.deserialize(raw_message, Message)
+        results: List[Any] = []
+        try:
+            for receiver in self.__message_receivers.get_receivers(message):
+                if iscoroutinefunction(receiver.callback):
+                    results.append(receiver.callback(message))
+                elif receiver.callback(message) is False:
+                    raise ValueError('The receiver failed')
+        except Exception as error:
+            self.__processed(dispatch_id, error)
+            return
+
+        if not results:
+            self.__processed(dispatch_id)
+            return
+        gather(*results).add_done_callback(
+            lambda future: self.__processed(
+                dispatch_id,
+                None if future.cancelled() else future.exception()
+            )
+        )
+
+    def __processed(self, dispatch_id: int, error: Exception = None) -> None:
+        self.__outbound.put((
+            Frames.PROCESSED,
+            dispatch_id,
+            None if error is None else str(error)
+        ))
+
+
+def run_worker(
+    index: int,
+    inbound: Queue,
+    outbound: Queue,
+    command_timeout: float,
+    setup: Callable[[WorkerClient], None]
+) -> None:
+    """Run a worker process, the target of the runner processes.
+
+    Args:
+        index (int): the worker index
+        inbound (Queue): the frames from the parent
+        outbound (Queue): the frames to the parent
+        command_timeout (float): the default commands timeout
+        setup (Callable[[WorkerClient], None]): registers the receivers
+    """
+    loop = new_event_loop()
+    set_event_loop(loop)
+    client = WorkerClient(index, inbound, outbound, command_timeout)
+    setup(client)
+    loop.run_until_complete(client.run_async())
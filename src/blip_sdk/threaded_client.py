@@ -0,0 +1,172 @@
+from asyncio import (AbstractEventLoop, new_event_loop,
+                     run_coroutine_threadsafe, set_event_loop)
+from concurrent.futures import Future
+from threading import Thread, current_thread
+from typing import Any, Awaitable, Callable
+
+from lime_python import Command, Message, Notification, Session
+
+from .client import Client
+from .receiver import Receiver
+
+
+class ThreadedClient:
+    """Synchronous facade running a Client on a private event loop thread.
+
+    Every call is forwarded to the loop thread, so any number of threads
+    (WSGI or Celery workers, for instance) can share the same session and
+    process commands concurrently. Receivers callbacks run on the loop
+    thread.
+    """
+
+    def __init__(self, client_factory: Callable[[], Client]) -> None:
+        self.__loop: AbstractEventLoop = new_event_loop()
+        self.__thread = Thread(
+            target=self.__run_loop,
+            name='blip-sdk-loop',
+            daemon=True
+        )
+        self.__thread.start()
+        self.client: Client = self.__call(client_factory)
+
+    @property
+    def loop(self) -> AbstractEventLoop:  # noqa: D102
+        return self.__loop
+
+    def connect(self) -> Session:
+        """Open a connection on transport and start application.
+
+        Returns:
+            Session: The connected Session
+        """
+        return self.__run(self.client.connect_async)
+
+    def close(self) -> Session:
+        """Close the open connection.
+
+        Returns:
+            Session: the closed session
+        """
+        return self.__run(self.client.close_async)
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for its thread to finish."""
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    def send_message(self, message: Message) -> None:
+        """Send a Message.
+
+        Args:
+            message (Message): Message to be sent
+        """
+        self.__call(self.client.send_message, message)
+
+    def send_notification(self, notification: Notification) -> None:
+        """Send a Notification.
+
+        Args:
+            notification (Notification): Notification to be sent
+        """
+        self.__call(self.client.send_notification, notification)
+
+    def send_command(self, command: Command) -> None:
+        """Send a command.
+
+        Args:
+            command (Command): Command to be sent
+        """
+        self.__call(self.client.send_command, command)
+
+    def process_command(
+        self,
+        command: Command,
+        timeout: float = None
+    ) -> Command:
+        """Process a Command and return the result.
+
+        Args:
+            command (Command): The Command to be processed
+            timeout (float): Timeout to process the Command
+
+        Returns:
+            Command: The result Command
+        """
+        return self.__run(self.client.process_command_async, command, timeout)
+
+    def add_message_receiver(self, receiver: Receiver) -> Callable[[], None]:
+        """Add a message receiver.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver(self.client.add_message_receiver, receiver)
+
+    def add_notification_receiver(
+        self,
+        receiver: Receiver
+    ) -> Callable[[], None]:
+        """Add a notification receiver.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver(
+            self.client.add_notification_receiver,
+            receiver
+        )
+
+    def add_command_receiver(self, receiver: Receiver) -> Callable[[], None]:
+        """Add a command receiver.
+
+        Args:
+            receiver (Receiver): the Receiver
+
+        Returns:
+            Callable[[], None]: a method to remove the receiver
+        """
+        return self.__add_receiver(self.client.add_command_receiver, receiver)
+
+    def __run_loop(self) -> None:
+        set_event_loop(self.__loop)
+        self.__loop.run_forever()
+
+    def __add_receiver(
+        self,
+        add_receiver: Callable[[Receiver], Callable[[], None]],
+        receiver: Receiver
+    ) -> Callable[[], None]:
+        remove = self.__call(add_receiver, receiver)
+        return lambda: self.__call(remove)
+
+    def __call(self, action: Callable, *args) -> Any:
+        self.__ensure_other_thread()
+        future = Future()
+
+        def run() -> None:  # noqa: WPS430
+            try:
+                future.set_result(action(*args))
+            except Exception as error:
+                future.set_exception(error)
+
+        self.__loop.call_soon_threadsafe(run)
+        return future.result()
+
+    def __run(self, action_async: Callable[..., Awaitable], *args) -> Any:
+        self.__ensure_other_thread()
+        return run_coroutine_threadsafe(
+            action_async(*args),
+            self.__loop
+        ).result()
+
+    def __ensure_other_thread(self) -> None:
+        if current_thread() is self.__thread:
+            raise ValueError(
+                'Cannot use sync method in the client loop thread, use the client async methods'  # noqa: E501
+            )
@@ -1,2 +1,3 @@
 from .request_utilities import RequestUtilities
 from .class_utilities import ClassUtilities
+from .envelope_utilities import EnvelopeUtilities
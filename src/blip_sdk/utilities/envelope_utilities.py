@@ -0,0 +1,115 @@
+from copy import deepcopy
+from json import dumps, loads
+from typing import Any, Type
+
+from lime_python import Command, Envelope, Message, Notification, Session
+
+DOMAIN_SEPARATOR = '@'
+INSTANCE_SEPARATOR = '/'
+COMPACT_SEPARATORS = (',', ':')
+
+
+class EnvelopeUtilities:
+    """Envelopes utilities."""
+
+    @staticmethod
+    def get_identity(node: Any) -> str:
+        """Get the lower case identity (name@domain) of a node.
+
+        Args:
+            node (Any): the node or its str representation
+
+        Returns:
+            str: the identity or None if node is empty
+        """
+        if not node:
+            return None
+        return str(node).split(INSTANCE_SEPARATOR, 1)[0].lower()
+
+    @staticmethod
+    def get_domain(node: Any) -> str:
+        """Get the lower case domain of a node.
+
+        Args:
+            node (Any): the node or its str representation
+
+        Returns:
+            str: the domain or None if node has no domain
+        """
+        identity = EnvelopeUtilities.get_identity(node)
+        if not identity or DOMAIN_SEPARATOR not in identity:
+            return None
+        return identity.split(DOMAIN_SEPARATOR, 1)[1]
+
+    @staticmethod
+    def get_reason_code(envelope: Any) -> int:
+        """Get the reason code of a failed command or notification.
+
+        Args:
+            envelope (Any): the Command or Notification
+
+        Returns:
+            int: the reason code or None if there is no reason
+        """
+        reason = getattr(envelope, 'reason', None)
+        if isinstance(reason, dict):
+            return reason.get('code')
+        return getattr(reason, 'code', None)
+
+    @staticmethod
+    def copy(envelope: Envelope, envelope_id: str = None) -> Envelope:
+        """Deep copy an envelope, so the copy shares no mutable state.
+
+        Args:
+            envelope (Envelope): the Envelope
+            envelope_id (str): the id of the copy, None to keep the same id
+
+        Returns:
+            Envelope: the copy
+        """
+        copied = deepcopy(envelope)
+        if envelope_id is not None:
+            copied.id = envelope_id
+        return copied
+
+    @staticmethod
+    def serialize(envelope: Envelope) -> str:
+        """Serialize an envelope to a compact json str.
+
+        Args:
+            envelope (Envelope): the Envelope
+
+        Returns:
+            str: the compact json
+        """
+        return dumps(envelope.to_json(), separators=COMPACT_SEPARATORS)
+
+    @staticmethod
+    def deserialize(
+        raw_envelope: str,
+        envelope_type: Type[Envelope] = None
+    ) -> Envelope:
+        """Deserialize a json str to the given or the matching envelope type.
+
+        Args:
+            raw_envelope (str): the json
+            envelope_type (Type[Envelope]): the expected envelope type
+
+        Raises:
+            ValueError: the json is not an envelope
+
+        Returns:
+            Envelope: a Message, Notification, Command or Session
+        """
+        envelope = loads(raw_envelope)
+        if envelope_type:
+            return envelope_type.from_json(envelope)
+        if Envelope.is_message(envelope):
+            return Message.from_json(envelope)
+        if Envelope.is_notification(envelope):
+            return Notification.from_json(envelope)
+        if Envelope.is_command(envelope):
+            return Command.from_json(envelope)
+        if Envelope.is_session(envelope):
+            return Session.from_json(envelope)
+        raise ValueError(f'Unknown envelope: {raw_envelope}')
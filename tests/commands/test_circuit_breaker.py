@@ -0,0 +1,114 @@
+from asyncio import TimeoutError
+
+from lime_python import Command, CommandMethod, ReasonCode
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import CircuitBreaker, CircuitOpenError, CircuitState
+
+from ..async_mock import async_return
+
+AI = 'postmaster@ai.msging.net'
+SUCCESS = Command(status='success')
+NOT_FOUND = Command(
+    status='failure',
+    reason={'code': ReasonCode.COMMAND_RESOURCE_NOT_FOUND}
+)
+
+
+class TestCircuitBreaker:
+
+    @mark.asyncio
+    async def test_open_after_failures_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = CircuitBreaker(failure_threshold=2)
+        on_state_changed_mock = mocker.MagicMock()
+        target.on_state_changed = on_state_changed_mock
+        process_mock = mocker.MagicMock(side_effect=TimeoutError())
+        command = Command(CommandMethod.GET, '/intentions', to=AI)
+
+        # Act
+        for _ in range(2):
+            with raises(TimeoutError):
+                await target.execute_async(AI, command, process_mock)
+
+        # Assert
+        with raises(CircuitOpenError):
+            await target.execute_async(AI, command, process_mock)
+        assert process_mock.call_count == 2
+        assert target.get_state(AI) == CircuitState.OPEN
+        assert target.get_state('postmaster@media.msging.net') == \
+            CircuitState.CLOSED
+        on_state_changed_mock.assert_called_once_with(
+            AI,
+            CircuitState.CLOSED,
+            CircuitState.OPEN
+        )
+
+    @mark.asyncio
+    async def test_close_after_probe_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        command = Command(CommandMethod.GET, '/intentions', to=AI)
+        with raises(TimeoutError):
+            await target.execute_async(
+                AI,
+                command,
+                mocker.MagicMock(side_effect=TimeoutError())
+            )
+
+        # Act
+        result = await target.execute_async(
+            AI,
+            command,
+            mocker.MagicMock(return_value=async_return(SUCCESS))
+        )
+
+        # Assert
+        assert result == SUCCESS
+        assert target.get_state(AI) == CircuitState.CLOSED
+
+    @mark.asyncio
+    async def test_reopen_after_failed_probe_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        process_mock = mocker.MagicMock(side_effect=TimeoutError())
+        command = Command(CommandMethod.GET, '/intentions', to=AI)
+        with raises(TimeoutError):
+            await target.execute_async(AI, command, process_mock)
+
+        # Act
+        with raises(TimeoutError):
+            await target.execute_async(AI, command, process_mock)
+
+        # Assert
+        assert target.get_state(AI) == CircuitState.OPEN
+
+    @mark.asyncio
+    async def test_ignore_non_transient_failures_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = CircuitBreaker(failure_threshold=1)
+        process_mock = mocker.MagicMock(
+            side_effect=lambda command: async_return(NOT_FOUND)
+        )
+        command = Command(CommandMethod.GET, '/intentions/1', to=AI)
+
+        # Act
+        await target.execute_async(AI, command, process_mock)
+        result = await target.execute_async(AI, command, process_mock)
+
+        # Assert
+        assert result == NOT_FOUND
+        assert target.get_state(AI) == CircuitState.CLOSED
@@ -0,0 +1,137 @@
+from asyncio import sleep
+
+from lime_python import Command, CommandMethod
+from pytest import mark
+
+from src import HedgingPolicy
+
+TEMPLATES = ['/contexts/{0}/{1}']
+URI = '/contexts/a@0mn.io/name'
+
+
+class TestHedgingPolicy:
+
+    @mark.asyncio
+    async def test_hedge_slow_command_async(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, initial_delay=0.01)
+        sent = []
+
+        async def process_async(command: Command) -> Command:
+            sent.append(command.id)
+            if len(sent) == 1:
+                await sleep(1)
+            return Command(id=command.id, status='success')
+
+        # Act
+        result = await target.execute_async(
+            Command(CommandMethod.GET, URI, id='1'),
+            process_async
+        )
+
+        # Assert
+        assert len(sent) == 2
+        assert sent[1] != '1'
+        assert result.id == sent[1]
+        assert target.statistics.hedged == 1
+        assert target.statistics.hedge_wins == 1
+
+    @mark.asyncio
+    async def test_abandon_loser_async(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, initial_delay=0.01)
+        abandoned = []
+
+        async def process_async(command: Command) -> Command:
+            if command.id == '1':
+                await sleep(1)
+            return Command(id=command.id, status='success')
+
+        # Act
+        result = await target.execute_async(
+            Command(CommandMethod.GET, URI, id='1'),
+            process_async,
+            lambda command: abandoned.append(command.id)
+        )
+
+        # Assert
+        assert result.id != '1'
+        assert abandoned == ['1']
+
+    @mark.asyncio
+    async def test_not_hedge_fast_command_async(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, initial_delay=0.5)
+        sent = []
+
+        async def process_async(command: Command) -> Command:
+            sent.append(command.id)
+            return Command(id=command.id, status='success')
+
+        # Act
+        result = await target.execute_async(
+            Command(CommandMethod.GET, URI, id='1'),
+            process_async
+        )
+
+        # Assert
+        assert sent == ['1']
+        assert result.id == '1'
+        assert target.statistics.hedged == 0
+
+    @mark.asyncio
+    async def test_hedge_budget_async(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, initial_delay=0, budget_ratio=0)
+        target.budget.tokens = 0
+        sent = []
+
+        async def process_async(command: Command) -> Command:
+            sent.append(command.id)
+            await sleep(0.01)
+            return Command(id=command.id, status='success')
+
+        # Act
+        result = await target.execute_async(
+            Command(CommandMethod.GET, URI, id='1'),
+            process_async
+        )
+
+        # Assert
+        assert sent == ['1']
+        assert result.id == '1'
+        assert target.statistics.budget_denied == 1
+
+    @mark.asyncio
+    async def test_not_hedge_set_command_async(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, initial_delay=0)
+        sent = []
+
+        async def process_async(command: Command) -> Command:
+            sent.append(command.id)
+            await sleep(0.01)
+            return command
+
+        # Act
+        await target.execute_async(
+            Command(CommandMethod.SET, URI, id='1'),
+            process_async
+        )
+
+        # Assert
+        assert sent == ['1']
+
+    def test_get_delay_percentile(self) -> None:
+        # Arrange
+        target = HedgingPolicy(TEMPLATES, min_samples=0, percentile=0.9)
+
+        # Act
+        initial_delay = target.get_delay(TEMPLATES[0])
+        for latency in range(1, 11):
+            target.record_latency(TEMPLATES[0], latency)
+        result = target.get_delay(TEMPLATES[0])
+
+        # Assert
+        assert initial_delay == target.initial_delay
+        assert result == 9
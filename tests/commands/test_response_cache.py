@@ -0,0 +1,114 @@
+from lime_python import Command, CommandMethod
+
+from src import ResponseCache
+
+AI = 'postmaster@ai.msging.net'
+SUCCESS = Command(status='success', resource={'id': '1'})
+TEMPLATE_TTLS = {'/intentions': 60, '/intentions/{0}': 60}
+
+
+class TestResponseCache:
+
+    def test_get_cached(self) -> None:
+        # Arrange
+        target = ResponseCache(TEMPLATE_TTLS)
+        command = Command(CommandMethod.GET, '/intentions/1', to=AI)
+        target.set(command, SUCCESS)
+
+        # Act
+        result = target.get(command)
+        other_target = target.get(
+            Command(CommandMethod.GET, '/intentions/1')
+        )
+
+        # Assert
+        assert result == SUCCESS
+        assert result is not SUCCESS
+        assert target.get(command).resource is not result.resource
+        assert other_target is None
+        assert target.hits == 2
+        assert target.misses == 1
+
+    def test_set_not_cacheable(self) -> None:
+        # Arrange
+        target = ResponseCache(TEMPLATE_TTLS)
+
+        # Act
+        target.set(Command(CommandMethod.GET, '/entities', to=AI), SUCCESS)
+        target.set(
+            Command(CommandMethod.GET, '/intentions', to=AI),
+            Command(status='failure')
+        )
+
+        # Assert
+        assert len(target) == 0
+
+    def test_get_expired(self) -> None:
+        # Arrange
+        target = ResponseCache({'/intentions': 0})
+        command = Command(CommandMethod.GET, '/intentions', to=AI)
+        target.set(command, SUCCESS)
+
+        # Act
+        result = target.get(command)
+
+        # Assert
+        assert result is None
+        assert len(target) == 0
+
+    def test_evict_least_recent(self) -> None:
+        # Arrange
+        target = ResponseCache(TEMPLATE_TTLS, max_entries=2)
+        commands = [
+            Command(CommandMethod.GET, f'/intentions/{index}', to=AI)
+            for index in range(3)
+        ]
+        target.set(commands[0], SUCCESS)
+        target.set(commands[1], SUCCESS)
+        target.get(commands[0])
+
+        # Act
+        target.set(commands[2], SUCCESS)
+
+        # Assert
+        assert target.get(commands[0]) == SUCCESS
+        assert target.get(commands[1]) is None
+
+    def test_invalidate_by_path_prefix(self) -> None:
+        # Arrange
+        target = ResponseCache(TEMPLATE_TTLS)
+        intentions = Command(
+            CommandMethod.GET,
+            '/intentions?$take=10',
+            to=AI
+        )
+        intention = Command(CommandMethod.GET, '/intentions/1', to=AI)
+        other_intention = Command(CommandMethod.GET, '/intentions/10', to=AI)
+        for command in (intentions, intention, other_intention):
+            target.set(command, SUCCESS)
+
+        # Act
+        target.invalidate(
+            Command(CommandMethod.DELETE, '/intentions/1', to=AI)
+        )
+
+        # Assert
+        assert target.get(intentions) is None
+        assert target.get(intention) is None
+        assert target.get(other_intention) == SUCCESS
+        assert target.invalidations == 2
+
+    def test_set_stale_version(self) -> None:
+        # Arrange
+        target = ResponseCache(TEMPLATE_TTLS)
+        command = Command(CommandMethod.GET, '/intentions/1', to=AI)
+        version = target.version
+        target.invalidate(
+            Command(CommandMethod.SET, '/intentions/1', to=AI)
+        )
+
+        # Act
+        target.set(command, SUCCESS, version)
+
+        # Assert
+        assert len(target) == 0
@@ -0,0 +1,122 @@
+from asyncio import TimeoutError
+
+from lime_python import Command, CommandMethod, ReasonCode
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import RetryBudget, RetryPolicy
+
+from ..async_mock import async_return
+
+TEMPLATES = ['/contexts/{0}/{1}', '/threads']
+SUCCESS = Command(status='success')
+TRANSIENT_FAILURE = Command(
+    status='failure',
+    reason={'code': ReasonCode.GENERAL_ERROR, 'description': 'error'}
+)
+
+
+class TestRetryPolicy:
+
+    @mark.asyncio
+    async def test_retry_transient_failure_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = RetryPolicy(TEMPLATES, base_delay=0)
+        process_mock = mocker.MagicMock(
+            side_effect=[
+                async_return(TRANSIENT_FAILURE),
+                async_return(SUCCESS)
+            ]
+        )
+
+        command = Command(CommandMethod.GET, '/contexts/a@0mn.io/name')
+        command.id = '1'
+
+        # Act
+        result = await target.execute_async(command, process_mock)
+
+        # Assert
+        retried = process_mock.call_args[0][0]
+        assert result == SUCCESS
+        assert process_mock.call_count == 2
+        assert process_mock.call_args_list[0][0][0] is command
+        assert retried is not command
+        assert retried.id != '1'
+        assert retried.uri == command.uri
+        assert target.statistics.retries == {'/contexts/{0}/{1}': 1}
+
+    @mark.asyncio
+    async def test_retry_timeout_exhausted_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = RetryPolicy(TEMPLATES, max_attempts=2, base_delay=0)
+        process_mock = mocker.MagicMock(side_effect=TimeoutError())
+
+        # Act/Assert
+        with raises(TimeoutError):
+            await target.execute_async(
+                Command(CommandMethod.GET, '/threads'),
+                process_mock
+            )
+        assert process_mock.call_count == 2
+        assert target.statistics.exhausted == 1
+
+    @mark.asyncio
+    async def test_not_retry_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = RetryPolicy(TEMPLATES, base_delay=0)
+        process_mock = mocker.MagicMock(
+            side_effect=lambda command: async_return(TRANSIENT_FAILURE)
+        )
+
+        # Act
+        merge_result = await target.execute_async(
+            Command(CommandMethod.MERGE, '/threads'),
+            process_mock
+        )
+        unknown_result = await target.execute_async(
+            Command(CommandMethod.GET, '/unknown'),
+            process_mock
+        )
+
+        # Assert
+        assert merge_result == TRANSIENT_FAILURE
+        assert unknown_result == TRANSIENT_FAILURE
+        assert process_mock.call_count == 2
+
+    @mark.asyncio
+    async def test_retry_budget_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = RetryPolicy(
+            TEMPLATES,
+            base_delay=0,
+            budget=RetryBudget(0.1, 1)
+        )
+        process_mock = mocker.MagicMock(
+            side_effect=lambda command: async_return(TRANSIENT_FAILURE)
+        )
+
+        # Act
+        result = await target.execute_async(
+            Command(CommandMethod.GET, '/threads'),
+            process_mock
+        )
+
+        # Assert
+        assert result == TRANSIENT_FAILURE
+        assert process_mock.call_count == 2
+        assert target.statistics.budget_denied == 1
+
+    def test_get_delay(self) -> None:
+        # Arrange
+        target = RetryPolicy(TEMPLATES, base_delay=1, max_delay=3, jitter=0)
+
+        # Act/Assert
+        assert [target.get_delay(attempt) for attempt in range(3)] == [
+            1, 2, 3
+        ]
@@ -0,0 +1,87 @@
+from asyncio import ensure_future, sleep
+
+from lime_python import Command
+from pytest import mark, raises
+
+from src import SingleFlight
+
+
+class TestSingleFlight:
+
+    @mark.asyncio
+    async def test_execute_async_coalesced(self) -> None:
+        # Arrange
+        target = SingleFlight()
+        calls = []
+
+        async def action_async() -> str:
+            calls.append(1)
+            await sleep(0.01)
+            return 'result'
+
+        # Act
+        first = ensure_future(target.execute_async('key', action_async))
+        second = ensure_future(target.execute_async('key', action_async))
+        await sleep(0)
+        in_flight = target.in_flight
+        results = [await first, await second]
+
+        # Assert
+        assert results == ['result', 'result']
+        assert len(calls) == 1
+        assert in_flight == 1
+        assert target.in_flight == 0
+        assert target.coalesced == 1
+
+    @mark.asyncio
+    async def test_execute_async_copies_result(self) -> None:
+        # Arrange
+        target = SingleFlight()
+
+        async def action_async() -> Command:
+            await sleep(0.01)
+            return Command(status='success', resource={'name': 'bot'})
+
+        # Act
+        first = ensure_future(target.execute_async('key', action_async))
+        second = ensure_future(target.execute_async('key', action_async))
+        first_result = await first
+        first_result.resource['name'] = 'changed'
+        second_result = await second
+
+        # Assert
+        assert second_result is not first_result
+        assert second_result.resource == {'name': 'bot'}
+
+    @mark.asyncio
+    async def test_execute_async_caller_cancelled(self) -> None:
+        # Arrange
+        target = SingleFlight()
+
+        async def action_async() -> str:
+            await sleep(0.01)
+            return 'result'
+
+        first = ensure_future(target.execute_async('key', action_async))
+        second = ensure_future(target.execute_async('key', action_async))
+        await sleep(0)
+
+        # Act
+        first.cancel()
+        result = await second
+
+        # Assert
+        assert result == 'result'
+
+    @mark.asyncio
+    async def test_execute_async_error(self) -> None:
+        # Arrange
+        target = SingleFlight()
+
+        async def action_async() -> str:
+            raise ValueError('failed')
+
+        # Act/Assert
+        with raises(ValueError):
+            await target.execute_async('key', action_async)
+        assert target.in_flight == 0
@@ -0,0 +1,40 @@
+from src import UriTemplateMatcher
+from src.blip_sdk.extensions import get_uri_templates
+
+
+class TestUriTemplateMatcher:
+
+    def test_match(self) -> None:
+        # Arrange
+        target = UriTemplateMatcher(get_uri_templates())
+
+        # Act/Assert
+        assert target.match('/contexts/a%40b.io/name?$take=1') == \
+            '/contexts/{0}/{1}'
+        assert target.match('/models/summary') == '/models/summary'
+        assert target.match('/models') == '/models'
+        assert target.match('/model/1') == '/model/{0}'
+        assert target.match('lime://bot@msging.net/threads/a') == \
+            '/threads/{0}'
+
+    def test_match_unknown(self) -> None:
+        # Arrange
+        target = UriTemplateMatcher(['/threads/{0}'])
+
+        # Act/Assert
+        assert target.match('/threads/a/b') is None
+        assert target.match('/unknown') is None
+        assert target.match(None) is None
+
+    def test_match_all(self) -> None:
+        # Arrange
+        target = UriTemplateMatcher(['/threads/{0}', '/threads/summary'])
+
+        # Act/Assert
+        assert target.match_all('lime://bot@msging.net/threads/summary') == [
+            '/threads/summary',
+            '/threads/{0}'
+        ]
+        assert target.match_all('/threads/a?$take=1') == ['/threads/{0}']
+        assert target.match_all('/unknown') == []
+        assert target.match_all(None) == []
@@ -0,0 +1,154 @@
+from asyncio import ensure_future, sleep
+
+from lime_python import Message
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import OfflineOutbox, OverflowPolicy
+
+
+class TestOfflineOutbox:
+
+    def test_flush_in_order(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = OfflineOutbox()
+        target.go_offline()
+        send_mock = mocker.MagicMock()
+        messages = [Message('text/plain', str(index)) for index in range(3)]
+        for message in messages:
+            target.add(message)
+
+        # Act
+        target.flush(send_mock)
+
+        # Assert
+        assert [call[0][0] for call in send_mock.call_args_list] == messages
+        assert target.flushed == 3
+        assert not target.offline
+        assert len(target) == 0
+
+    def test_flush_send_error(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = OfflineOutbox()
+        target.go_offline()
+        send_mock = mocker.MagicMock(side_effect=[None, ConnectionError()])
+        messages = [Message('text/plain', str(index)) for index in range(3)]
+        for message in messages:
+            target.add(message)
+
+        # Act
+        with raises(ConnectionError):
+            target.flush(send_mock)
+        send_mock.side_effect = None
+        target.flush(send_mock)
+
+        # Assert
+        assert [call[0][0] for call in send_mock.call_args_list] == [
+            messages[0], messages[1], messages[1], messages[2]
+        ]
+        assert target.flushed == 3
+        assert not target.offline
+
+    def test_flush_send_error_stays_offline(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = OfflineOutbox()
+        target.go_offline()
+        target.add(Message('text/plain', 'foo'))
+
+        # Act
+        with raises(ConnectionError):
+            target.flush(mocker.MagicMock(side_effect=ConnectionError()))
+
+        # Assert
+        assert target.offline
+        assert len(target) == 1
+
+    def test_drop_oldest(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = OfflineOutbox(max_size=2)
+        send_mock = mocker.MagicMock()
+
+        # Act
+        for index in range(3):
+            target.add(Message('text/plain', str(index)))
+        target.flush(send_mock)
+
+        # Assert
+        assert [call[0][0].content for call in send_mock.call_args_list] == [
+            '1', '2'
+        ]
+        assert target.dropped == 1
+
+    def test_fail_when_full(self) -> None:
+        # Arrange
+        target = OfflineOutbox(1, overflow_policy=OverflowPolicy.FAIL)
+        target.add(Message('text/plain', 'first'))
+
+        # Act/Assert
+        with raises(ConnectionError):
+            target.add(Message('text/plain', 'second'))
+
+    def test_skip_expired(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = OfflineOutbox(ttl=-1)
+        send_mock = mocker.MagicMock()
+        target.add(Message('text/plain', 'expired'))
+
+        # Act
+        target.flush(send_mock)
+
+        # Assert
+        send_mock.assert_not_called()
+        assert target.expired == 1
+
+    @mark.asyncio
+    async def test_wait_online_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = OfflineOutbox()
+        target.go_offline()
+        task = ensure_future(target.wait_online_async())
+        await sleep(0)
+
+        # Act
+        target.flush(mocker.MagicMock())
+        await task
+
+        # Assert
+        assert task.done()
+
+    @mark.asyncio
+    async def test_fail_async(self) -> None:
+        # Arrange
+        target = OfflineOutbox()
+        target.go_offline()
+        target.add(Message('text/plain', 'foo'))
+        task = ensure_future(target.wait_online_async())
+        await sleep(0)
+
+        # Act
+        target.fail(ConnectionError('gave up'))
+
+        # Assert
+        with raises(ConnectionError, match='gave up'):
+            await task
+        assert not target.offline
+        assert len(target) == 0
+        assert target.dropped == 1
+
+    @mark.asyncio
+    async def test_wait_online_timeout_async(self) -> None:
+        # Arrange
+        target = OfflineOutbox(ttl=0.01)
+        target.go_offline()
+
+        # Act/Assert
+        with raises(ConnectionError):
+            await target.wait_online_async()
+
+    def test_block_not_supported(self) -> None:
+        # Act/Assert
+        with raises(ValueError):
+            OfflineOutbox(overflow_policy=OverflowPolicy.BLOCK)
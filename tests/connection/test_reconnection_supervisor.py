@@ -0,0 +1,74 @@
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import ReconnectionSupervisor
+
+from ..async_mock import async_return
+
+
+class TestReconnectionSupervisor:
+
+    def test_get_delay(self) -> None:
+        # Arrange
+        target = ReconnectionSupervisor(None, 0.1, 1, 0.5)
+
+        # Act
+        first_delay = target.get_delay(0)
+        capped_delay = target.get_delay(10)
+
+        # Assert
+        assert 0.1 <= first_delay <= 0.15
+        assert 1 <= capped_delay <= 1.5
+
+    @mark.asyncio
+    async def test_schedule_reconnects(self, mocker: MockerFixture) -> None:
+        # Arrange
+        reconnect_mock = mocker.MagicMock(
+            side_effect=[ConnectionError('down'), async_return('session')]
+        )
+        target = ReconnectionSupervisor(reconnect_mock, 0, 0, 0)
+
+        # Act
+        task = target.schedule()
+        same_task = target.schedule()
+        result = await task
+
+        # Assert
+        assert task is same_task
+        assert result == 'session'
+        assert not target.reconnecting
+        assert target.metrics.attempts == 2
+        assert target.metrics.failures == 1
+        assert target.metrics.reconnections == 1
+        assert isinstance(target.metrics.last_error, ConnectionError)
+
+    @mark.asyncio
+    async def test_schedule_max_attempts(self, mocker: MockerFixture) -> None:
+        # Arrange
+        reconnect_mock = mocker.MagicMock(side_effect=ConnectionError)
+        target = ReconnectionSupervisor(reconnect_mock, 0, 0, 0, 3)
+        target.on_failed = mocker.MagicMock()
+
+        # Act
+        result = await target.schedule()
+
+        # Assert
+        assert result is None
+        assert target.metrics.attempts == 3
+        assert target.metrics.failures == 3
+        target.on_failed.assert_called_once()
+        assert isinstance(target.on_failed.call_args[0][0], ConnectionError)
+
+    @mark.asyncio
+    async def test_cancel(self, mocker: MockerFixture) -> None:
+        # Arrange
+        target = ReconnectionSupervisor(mocker.MagicMock(), 10, 10, 0)
+
+        # Act
+        task = target.schedule()
+        target.cancel()
+
+        # Assert
+        with raises(BaseException):
+            await task
+        assert task.cancelled()
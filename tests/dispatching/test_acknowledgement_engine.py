@@ -0,0 +1,82 @@
+from asyncio import sleep
+
+from lime_python import Message, NotificationEvent
+from pytest import mark
+from pytest_mock import MockerFixture
+
+from src import AcknowledgementEngine
+
+from ..async_mock import async_return
+
+
+class TestAcknowledgementEngine:
+
+    @mark.asyncio
+    async def test_batch_receipts(self, mocker: MockerFixture) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock()
+        target = AcknowledgementEngine(send_mock)
+        message = Message(
+            'text/plain',
+            'foo',
+            id='1',
+            from_n='user@0mn.io',
+            pp='user@wa.gw.msging.net',
+            to='bot@msging.net'
+        )
+
+        # Act
+        target.received(message)
+        target.processed(message, [None])
+        pending = target.pending
+        await sleep(0)
+
+        # Assert
+        assert pending == 2
+        send_mock.assert_called_once()
+        received, consumed = send_mock.call_args[0][0]
+        assert received.event == NotificationEvent.RECEIVED
+        assert consumed.event == NotificationEvent.CONSUMED
+        assert consumed.to == 'user@wa.gw.msging.net'
+        assert consumed.metadata == {'#message.to': 'bot@msging.net'}
+
+    @mark.asyncio
+    async def test_processed_waits_futures(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock()
+        target = AcknowledgementEngine(send_mock, False)
+        message = Message('text/plain', 'foo', id='1', from_n='user@0mn.io')
+        future = async_return(None)
+        failed_future = future.get_loop().create_future()
+        failed_future.set_exception(ValueError('failed'))
+
+        # Act
+        target.received(message)
+        target.processed(message, [future, failed_future])
+        await sleep(0.01)
+
+        # Assert
+        send_mock.assert_called_once()
+        notification, = send_mock.call_args[0][0]
+        assert notification.event == NotificationEvent.FAILED
+        assert notification.reason.description == 'failed'
+
+    @mark.asyncio
+    async def test_finished_without_consumed(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock()
+        target = AcknowledgementEngine(send_mock, notify_consumed=False)
+        message = Message('text/plain', 'foo', id='1', from_n='user@0mn.io')
+
+        # Act
+        target.finished(message)
+        await sleep(0)
+
+        # Assert
+        send_mock.assert_not_called()
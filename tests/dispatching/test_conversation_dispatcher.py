@@ -0,0 +1,145 @@
+from asyncio import Event, QueueFull, gather, sleep
+
+from pytest import mark, raises
+
+from src import ConversationDispatcher, OverflowPolicy, ReceiverWorkerPool
+
+
+class TestConversationDispatcher:
+
+    @mark.asyncio
+    async def test_submit_orders_per_conversation(self) -> None:
+        # Arrange
+        target = ConversationDispatcher(ReceiverWorkerPool())
+        events = []
+
+        async def action_async(key: str, value: int) -> None:
+            events.append(f'start {key}{value}')
+            await sleep(0)
+            events.append(f'end {key}{value}')
+
+        # Act
+        futures = [
+            target.submit('a', action_async, 'a', 1),
+            target.submit('b', action_async, 'b', 1),
+            target.submit('a', action_async, 'a', 2)
+        ]
+        active_conversations = target.active_conversations
+        queue_depth = target.queue_depth
+        await gather(*futures)
+
+        # Assert
+        assert active_conversations == 2
+        assert queue_depth == 1
+        assert events.index('end a1') < events.index('start a2')
+        assert events.index('start b1') < events.index('end a1')
+        assert target.active_conversations == 0
+        assert target.queue_depth == 0
+
+    @mark.asyncio
+    async def test_submit_continues_after_errors(self) -> None:
+        # Arrange
+        target = ConversationDispatcher(ReceiverWorkerPool())
+
+        async def failing_action_async() -> None:
+            raise ValueError('failed')
+
+        async def action_async() -> str:
+            return 'done'
+
+        # Act
+        failed = target.submit('a', failing_action_async)
+        succeeded = target.submit('a', action_async)
+
+        # Assert
+        with raises(ValueError):
+            await failed
+        assert await succeeded == 'done'
+
+    @mark.asyncio
+    async def test_submit_queue_full(self) -> None:
+        # Arrange
+        pool = ReceiverWorkerPool(1, 1, OverflowPolicy.FAIL)
+        target = ConversationDispatcher(pool)
+        release = Event()
+
+        async def action_async() -> None:
+            await release.wait()
+
+        target.submit('a', action_async)
+        target.submit('b', action_async)
+
+        # Act/Assert
+        with raises(QueueFull):
+            target.submit('c', action_async)
+        assert target.active_conversations == 2
+        release.set()
+
+    @mark.asyncio
+    async def test_submit_conversation_backlog_full(self) -> None:
+        # Arrange
+        pool = ReceiverWorkerPool(1, 1, OverflowPolicy.FAIL)
+        target = ConversationDispatcher(pool)
+        release = Event()
+
+        async def action_async() -> None:
+            await release.wait()
+
+        target.submit('a', action_async)
+        target.submit('a', action_async)
+
+        # Act/Assert
+        with raises(QueueFull):
+            target.submit('a', action_async)
+        assert target.queue_depth == 1
+        assert pool.rejected == 1
+        release.set()
+
+    @mark.asyncio
+    async def test_submit_conversation_backlog_drop_oldest(self) -> None:
+        # Arrange
+        pool = ReceiverWorkerPool(1, 2, OverflowPolicy.DROP_OLDEST)
+        target = ConversationDispatcher(pool)
+        release = Event()
+
+        async def action_async(value: int) -> int:
+            await release.wait()
+            return value
+
+        first = target.submit('a', action_async, 1)
+        oldest = target.submit('a', action_async, 2)
+        newer = target.submit('a', action_async, 3)
+
+        # Act
+        newest = target.submit('a', action_async, 4)
+        release.set()
+
+        # Assert
+        with raises(QueueFull, match='overflow policy'):
+            await oldest
+        assert await gather(first, newer, newest) == [1, 3, 4]
+        assert pool.dropped == 1
+        assert pool.reserved == 0
+        assert target.queue_depth == 0
+
+    @mark.asyncio
+    async def test_submit_conversation_backlog_block(self) -> None:
+        # Arrange
+        pool = ReceiverWorkerPool(1, 1, OverflowPolicy.BLOCK)
+        target = ConversationDispatcher(pool)
+        release = Event()
+
+        async def action_async() -> None:
+            await release.wait()
+
+        futures = [target.submit('a', action_async) for _ in range(2)]
+
+        # Act
+        saturated = pool.saturated
+        release.set()
+        await gather(*futures)
+
+        # Assert
+        assert saturated
+        assert not pool.saturated
+        assert pool.reserved == 0
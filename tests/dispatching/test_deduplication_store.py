@@ -0,0 +1,67 @@
+from pytest import raises
+
+from src import DeduplicationStore, LruDeduplicationStore
+
+
+class TestLruDeduplicationStore:
+
+    def test_is_duplicate(self) -> None:
+        # Arrange
+        target = LruDeduplicationStore()
+
+        # Act
+        first = target.is_duplicate('1')
+        second = target.is_duplicate('1')
+        other = target.is_duplicate('2')
+
+        # Assert
+        assert not first
+        assert second
+        assert not other
+        assert target.duplicates == 1
+
+    def test_evict_least_recent(self) -> None:
+        # Arrange
+        target = LruDeduplicationStore(max_size=2)
+
+        # Act
+        for message_id in ('1', '2', '3'):
+            target.add(message_id)
+
+        # Assert
+        assert len(target) == 2
+        assert target.add('1')
+        assert not target.add('3')
+
+    def test_evict_expired(self) -> None:
+        # Arrange
+        target = LruDeduplicationStore(ttl=0)
+        target.add('1')
+
+        # Act
+        result = target.add('1')
+
+        # Assert
+        assert result
+        assert len(target) == 1
+
+    def test_remove(self) -> None:
+        # Arrange
+        target = LruDeduplicationStore()
+        target.add('1')
+
+        # Act
+        target.remove('1')
+        target.remove('2')
+
+        # Assert
+        assert len(target) == 0
+        assert not target.is_duplicate('1')
+
+
+class TestDeduplicationStore:
+
+    def test_add_is_abstract(self) -> None:
+        # Act/Assert
+        with raises(TypeError):
+            DeduplicationStore()
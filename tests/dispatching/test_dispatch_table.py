@@ -0,0 +1,85 @@
+from lime_python import Message
+from pytest import raises
+
+from src import DispatchTable, Receiver
+
+
+class TestDispatchTable:
+
+    def test_get_receivers_by_type(self) -> None:
+        # Arrange
+        target = DispatchTable()
+        text_receiver = Receiver(True, print, type_n='text/plain')
+        chatstate_receiver = Receiver(
+            True,
+            print,
+            type_n='application/vnd.lime.chatstate+json'
+        )
+        target.add(text_receiver)
+        target.add(chatstate_receiver)
+
+        # Act
+        result = target.get_receivers(Message('text/plain', 'foo'))
+
+        # Assert
+        assert result == [text_receiver]
+
+    def test_get_receivers_keeps_registration_order(self) -> None:
+        # Arrange
+        target = DispatchTable()
+        message = Message(
+            'text/plain',
+            'foo',
+            from_n='user@WA.gw.msging.net/instance',
+            to='bot@msging.net/default'
+        )
+        receivers = [
+            Receiver(True, print, to_node='bot@msging.net'),
+            Receiver(lambda env: env.content == 'foo', print),
+            Receiver(True, print, from_domain='wa.gw.msging.net'),
+            Receiver(True, print, type_n='text/plain'),
+            Receiver(lambda env: False, print, type_n='text/plain'),
+            Receiver(True, print, from_domain='0mn.io')
+        ]
+        for receiver in receivers:
+            target.add(receiver)
+
+        # Act
+        result = target.get_receivers(message)
+
+        # Assert
+        assert result == receivers[:4]
+
+    def test_get_receivers_checks_all_filters(self) -> None:
+        # Arrange
+        target = DispatchTable()
+        receiver = Receiver(
+            True,
+            print,
+            type_n='text/plain',
+            from_domain='0mn.io'
+        )
+        target.add(receiver)
+
+        # Act
+        result = target.get_receivers(
+            Message('text/plain', 'foo', from_n='user@wa.gw.msging.net')
+        )
+
+        # Assert
+        assert result == []
+
+    def test_remove(self) -> None:
+        # Arrange
+        target = DispatchTable()
+        receiver = Receiver(True, print, type_n='text/plain')
+        target.add(receiver)
+
+        # Act
+        target.remove(receiver)
+
+        # Assert
+        assert len(target) == 0
+        assert target.get_receivers(Message('text/plain', 'foo')) == []
+        with raises(ValueError):
+            target.remove(receiver)
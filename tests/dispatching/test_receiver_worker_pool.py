@@ -0,0 +1,111 @@
+from asyncio import Event, QueueFull, gather
+
+from pytest import mark, raises
+
+from src import OverflowPolicy, ReceiverWorkerPool
+
+
+class TestReceiverWorkerPool:
+
+    @mark.asyncio
+    async def test_submit_limits_concurrency(self) -> None:
+        # Arrange
+        target = ReceiverWorkerPool(2)
+        release = Event()
+        results = []
+
+        async def action_async(value: int) -> int:
+            await release.wait()
+            results.append(value)
+            return value
+
+        # Act
+        futures = [target.submit(action_async, value) for value in range(5)]
+        in_flight, queue_depth = target.in_flight, target.queue_depth
+        release.set()
+        values = await gather(*futures)
+
+        # Assert
+        assert in_flight == 2
+        assert queue_depth == 3
+        assert values == [0, 1, 2, 3, 4]
+        assert results == [0, 1, 2, 3, 4]
+        assert target.in_flight == 0
+        assert target.queue_depth == 0
+
+    @mark.asyncio
+    async def test_submit_drop_oldest(self) -> None:
+        # Arrange
+        target = ReceiverWorkerPool(1, 1, OverflowPolicy.DROP_OLDEST)
+        release = Event()
+
+        async def action_async(value: int) -> int:
+            await release.wait()
+            return value
+
+        # Act
+        running = target.submit(action_async, 0)
+        dropped = target.submit(action_async, 1)
+        queued = target.submit(action_async, 2)
+        release.set()
+
+        # Assert
+        assert await running == 0
+        assert await queued == 2
+        assert target.dropped == 1
+        with raises(QueueFull, match='overflow policy'):
+            await dropped
+
+    @mark.asyncio
+    async def test_submit_fail(self) -> None:
+        # Arrange
+        target = ReceiverWorkerPool(1, 1, OverflowPolicy.FAIL)
+        release = Event()
+
+        async def action_async() -> None:
+            await release.wait()
+
+        target.submit(action_async)
+        queued = target.submit(action_async)
+
+        # Act/Assert
+        with raises(QueueFull):
+            target.submit(action_async)
+        release.set()
+        await queued
+        assert target.rejected == 1
+
+    @mark.asyncio
+    async def test_submit_block_saturates(self) -> None:
+        # Arrange
+        target = ReceiverWorkerPool(1, 2, OverflowPolicy.BLOCK)
+        release = Event()
+        changes = []
+        target.on_saturation_changed = changes.append
+
+        async def action_async() -> None:
+            await release.wait()
+
+        # Act
+        futures = [target.submit(action_async) for _ in range(3)]
+        saturated = target.saturated
+        release.set()
+        await gather(*futures)
+
+        # Assert
+        assert saturated
+        assert changes == [True, False]
+        assert not target.saturated
+        assert target.dropped == 0
+
+    @mark.asyncio
+    async def test_submit_propagates_errors(self) -> None:
+        # Arrange
+        target = ReceiverWorkerPool()
+
+        async def action_async() -> None:
+            raise ValueError('failed')
+
+        # Act/Assert
+        with raises(ValueError):
+            await target.submit(action_async)
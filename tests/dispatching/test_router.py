@@ -0,0 +1,157 @@
+import re
+
+from lime_python import Command, CommandMethod, Message
+from pytest import fixture, raises
+from pytest_mock import MockerFixture
+
+from src import Application, Client, Router
+
+CHATSTATE = 'application/vnd.lime.chatstate+json'
+
+
+class TestRouter:
+
+    @fixture
+    def target(self) -> Router:
+        router = Router()
+
+        @router.text('^[0-9]+ *[-+*/] *[0-9]+$')
+        def calculate(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        @router.text('help|menu', flags=re.IGNORECASE)
+        def menu(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        @router.text('menu')
+        def shadowed(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        @router.type('text/plain')
+        def unknown_text(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        @router.type(CHATSTATE)
+        def chatstate(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        @router.command('/contexts/{0}', CommandMethod.SET)
+        def set_context(command: Command) -> None:
+            pass  # noqa: WPS420
+
+        @router.command('/contexts/{0}')
+        def context(command: Command) -> None:
+            pass  # noqa: WPS420
+
+        yield router
+
+    def test_route_text_first_pattern(self, target: Router) -> None:
+        # Act
+        result = target.route(Message('text/plain', 'Show the MENU'))
+
+        # Assert
+        assert result.callback.__name__ == 'menu'
+
+    def test_route_text_anchored_pattern(self, target: Router) -> None:
+        # Act
+        result = target.route(Message('text/plain', '5 * 2'))
+        result2 = target.route(Message('text/plain', 'not 5 * 2'))
+
+        # Assert
+        assert result.callback.__name__ == 'calculate'
+        assert result2.callback.__name__ == 'unknown_text'
+
+    def test_route_text_registration_order(self) -> None:
+        # Arrange
+        target = Router()
+        target.text('BYE', flags=re.IGNORECASE)(print)
+        target.text('hi')(repr)
+
+        # Act
+        result = target.route(Message('text/plain', 'hi, bye'))
+        result2 = target.route(Message('text/plain', 'hi, by'))
+
+        # Assert
+        assert result.callback is print
+        assert result2.callback is repr
+
+    def test_route_type(self, target: Router) -> None:
+        # Act
+        result = target.route(Message(CHATSTATE, {'state': 'composing'}))
+        result2 = target.route(Message('image/png', 'foo'))
+
+        # Assert
+        assert result.callback.__name__ == 'chatstate'
+        assert result2 is None
+
+    def test_route_default(self) -> None:
+        # Arrange
+        target = Router()
+        target.default()(print)
+
+        # Act
+        result = target.route(Message('image/png', 'foo'))
+
+        # Assert
+        assert result.callback is print
+        with raises(ValueError):
+            target.default()(print)
+
+    def test_route_command(self, target: Router) -> None:
+        # Act
+        result = target.route(Command(CommandMethod.SET, '/contexts/a@b.c'))
+        result2 = target.route(Command(CommandMethod.GET, '/contexts/a@b.c'))
+        result3 = target.route(Command(CommandMethod.GET, '/account'))
+
+        # Assert
+        assert result.callback.__name__ == 'set_context'
+        assert result2.callback.__name__ == 'context'
+        assert result3 is None
+
+    def test_route_command_fall_through(self) -> None:
+        # Arrange
+        target = Router()
+        target.command('/threads/summary', CommandMethod.GET)(print)
+        target.command('/threads/{0}', CommandMethod.DELETE)(repr)
+
+        # Act
+        result = target.route(Command(CommandMethod.GET, '/threads/summary'))
+        result2 = target.route(
+            Command(CommandMethod.DELETE, '/threads/summary')
+        )
+        result3 = target.route(Command(CommandMethod.SET, '/threads/summary'))
+
+        # Assert
+        assert result.callback is print
+        assert result2.callback is repr
+        assert result3 is None
+
+    def test_invalid_route(self, target: Router) -> None:
+        # Act & Assert
+        with raises(ValueError):
+            target.type(CHATSTATE)
+        with raises(re.error):
+            target.text('(foo')
+
+    def test_attach(self, mocker: MockerFixture) -> None:
+        # Arrange
+        client = Client('127.0.0.1:8124', mocker.MagicMock(), Application())
+        client.send_notification = mocker.MagicMock()
+        calculate = mocker.MagicMock()
+        fallback = mocker.MagicMock()
+        target = Router()
+        target.text('^[0-9]+ *[-+*/] *[0-9]+$')(calculate)
+        target.default()(fallback)
+        message = Message('text/plain', '5 * 2')
+        message2 = Message('text/plain', 'foo')
+
+        # Act
+        detach = target.attach(client)
+        client.client_channel.on_message(message)
+        client.client_channel.on_message(message2)
+        detach()
+        client.client_channel.on_message(Message('text/plain', '1 + 1'))
+
+        # Assert
+        calculate.assert_called_once_with(message)
+        fallback.assert_called_once_with(message2)
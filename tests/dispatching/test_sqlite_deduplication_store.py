@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from pytest import mark
+
+from src import SqliteDeduplicationStore
+
+
+class TestSqliteDeduplicationStore:
+
+    def test_shared_between_stores(self, tmp_path: Path) -> None:
+        # Arrange
+        path = str(tmp_path / 'message_ids.db')
+        first_store = SqliteDeduplicationStore(path)
+        second_store = SqliteDeduplicationStore(path)
+
+        # Act
+        first = first_store.is_duplicate('1')
+        redelivered = second_store.is_duplicate('1')
+        other = second_store.is_duplicate('2')
+
+        # Assert
+        assert not first
+        assert redelivered
+        assert not other
+        first_store.close()
+        second_store.close()
+
+    def test_add_expired(self, tmp_path: Path) -> None:
+        # Arrange
+        target = SqliteDeduplicationStore(str(tmp_path / 'ids.db'), ttl=0)
+        target.add('1')
+
+        # Act
+        result = target.add('1')
+
+        # Assert
+        assert result
+        target.close()
+
+    @mark.asyncio
+    async def test_is_duplicate_async(self, tmp_path: Path) -> None:
+        # Arrange
+        target = SqliteDeduplicationStore(str(tmp_path / 'ids.db'))
+
+        # Act
+        first = await target.is_duplicate_async('1')
+        second = await target.is_duplicate_async('1')
+
+        # Assert
+        assert not first
+        assert second
+        assert target.duplicates == 1
+        target.close()
+
+    @mark.asyncio
+    async def test_remove_async(self, tmp_path: Path) -> None:
+        # Arrange
+        target = SqliteDeduplicationStore(str(tmp_path / 'ids.db'))
+        other = SqliteDeduplicationStore(str(tmp_path / 'ids.db'))
+        await target.is_duplicate_async('1')
+
+        # Act
+        await target.remove_async('1')
+
+        # Assert
+        assert not await other.is_duplicate_async('1')
+        target.close()
+        other.close()
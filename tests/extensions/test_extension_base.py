@@ -1,9 +1,9 @@
-from asyncio import Future
+from asyncio import Future, ensure_future, gather, sleep
 from typing import Any
 from lime_python import Command
 from pytest import mark
 from pytest_mock import MockerFixture
-from src import ExtensionBase
+from src import ExtensionBase, ResponseCache
 
 
 class TestExtensionBase:
@@ -142,6 +142,65 @@ class TestExtensionBase:
             expected_result.id = result.id
         assert result == expected_result
 
+    @mark.asyncio
+    async def test_process_command_coalesced_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = self.get_target(mocker.Mock())
+        target.coalesce_gets = True
+        response = Future()
+        process_mock = mocker.MagicMock(return_value=response)
+        target.client.process_command_async = process_mock
+
+        # Act
+        first = ensure_future(
+            target.process_command_async(Command('get', '/ping'))
+        )
+        second = ensure_future(
+            target.process_command_async(Command('get', '/ping'))
+        )
+        other = ensure_future(
+            target.process_command_async(Command('get', '/other'))
+        )
+        await sleep(0)
+        response.set_result(Command(status='success'))
+        results = await gather(first, second, other)
+
+        # Assert
+        assert process_mock.call_count == 2
+        assert results[0] is not results[1]
+        assert results[0].to_json() == results[1].to_json()
+        assert target.single_flight.coalesced == 1
+
+    @mark.asyncio
+    async def test_process_command_cached_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = self.get_target(mocker.Mock())
+        target.response_cache = ResponseCache({'/ping': 60})
+        process_mock = mocker.MagicMock(
+            side_effect=lambda command: self.__async_return(
+                Command(status='success')
+            )
+        )
+        target.client.process_command_async = process_mock
+
+        # Act
+        first = await target.process_command_async(Command('get', '/ping'))
+        second = await target.process_command_async(Command('get', '/ping'))
+        await target.process_command_async(Command('delete', '/ping'))
+        third = await target.process_command_async(Command('get', '/ping'))
+
+        # Assert
+        assert second is not first
+        assert second == first
+        assert third is not first
+        assert process_mock.call_count == 3
+
     def get_target(self, client=None) -> ExtensionBase:
         return ExtensionBase(client)
 
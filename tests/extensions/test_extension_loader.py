@@ -0,0 +1,48 @@
+from os import path
+from subprocess import check_output  # noqa: S404
+from sys import executable
+
+from pytest import raises
+
+from src import ChatExtension
+from src.blip_sdk.extensions import load_extension
+
+SRC_PATH = path.join(path.dirname(__file__), '..', '..', 'src')
+
+
+class TestExtensionLoader:
+
+    def test_load_extension(self) -> None:
+        # Act
+        result = load_extension('ChatExtension')
+
+        # Assert
+        assert result is ChatExtension
+
+    def test_load_unknown_extension(self) -> None:
+        # Act & Assert
+        with raises(ValueError):
+            load_extension('UnknownExtension')
+
+    def test_import_sdk_without_extensions(self) -> None:
+        # Arrange
+        script = ';'.join((
+            'import sys',
+            'from unittest.mock import MagicMock',
+            'from blip_sdk import Application, Client',
+            "client = Client('127.0.0.1', MagicMock, Application())",
+            "print('blip_sdk.extensions.chat' in sys.modules)",
+            'client.chat_extension',
+            "print('blip_sdk.extensions.chat' in sys.modules)",
+            "print('blip_sdk.extensions.artificial_intelligence' in sys.modules)"  # noqa: E501
+        ))
+
+        # Act
+        result = check_output(  # noqa: S603
+            [executable, '-c', script],
+            cwd=SRC_PATH,
+            text=True
+        )
+
+        # Assert
+        assert result.split() == ['False', 'True', 'False']
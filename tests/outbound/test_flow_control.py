@@ -0,0 +1,151 @@
+from asyncio import ensure_future, sleep
+
+from lime_python import Command, CommandMethod, Message, Notification
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import OutboundFlowControl, OutboundPriority
+
+
+class TestOutboundFlowControl:
+
+    @mark.asyncio
+    async def test_send_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock()
+        target = OutboundFlowControl(10)
+        message = Message('text/plain', 'foo')
+
+        # Act
+        await target.send_async(message, send_mock)
+
+        # Assert
+        send_mock.assert_called_once_with(message)
+        assert target.queued_envelopes == 0
+
+    @mark.asyncio
+    async def test_send_in_order_async(self) -> None:
+        # Arrange
+        sent = []
+        target = OutboundFlowControl(2)
+
+        # Act
+        tasks = [
+            ensure_future(
+                target.send_async(
+                    Message('text/plain', str(index)),
+                    sent.append
+                )
+            )
+            for index in range(5)
+        ]
+        await sleep(0)
+        is_full = target.is_full
+        for task in tasks:
+            await task
+
+        # Assert
+        assert is_full
+        assert [message.content for message in sent] == [
+            '0', '1', '2', '3', '4'
+        ]
+        assert not target.is_full
+
+    @mark.asyncio
+    async def test_wait_transport_buffer_async(self) -> None:
+        # Arrange
+        sent = []
+        buffer_sizes = [100, 100, 0]
+        target = OutboundFlowControl(
+            write_buffer_high_water=50,
+            get_buffer_size=lambda: buffer_sizes.pop(0) if buffer_sizes else 0
+        )
+
+        # Act
+        task = ensure_future(
+            target.send_async(Message('text/plain', 'foo'), sent.append)
+        )
+        await sleep(0.005)
+        sent_before_drain = len(sent)
+        await task
+
+        # Assert
+        assert sent_before_drain == 0
+        assert len(sent) == 1
+
+    @mark.asyncio
+    async def test_send_error_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock(side_effect=ConnectionError())
+        target = OutboundFlowControl(10)
+
+        # Act/Assert
+        with raises(ConnectionError):
+            await target.send_async(Message('text/plain', 'foo'), send_mock)
+        assert target.queued_envelopes == 0
+
+    @mark.asyncio
+    async def test_send_by_priority_async(self) -> None:
+        # Arrange
+        sent = []
+        target = OutboundFlowControl()
+
+        # Act
+        tasks = [
+            ensure_future(
+                target.send_async(
+                    Message('text/plain', str(index)),
+                    sent.append,
+                    OutboundPriority.BULK
+                )
+            )
+            for index in range(20)
+        ]
+        await sleep(0)
+        notification = Notification('received')
+        tasks.append(
+            ensure_future(target.send_async(notification, sent.append))
+        )
+        for task in tasks:
+            await task
+
+        # Assert
+        assert sent.index(notification) < 5
+        sent.remove(notification)
+        assert [message.content for message in sent] == [
+            str(index) for index in range(20)
+        ]
+
+    @mark.asyncio
+    async def test_wait_turn_async(self) -> None:
+        # Arrange
+        sent = []
+        target = OutboundFlowControl()
+        command = Command(CommandMethod.GET, '/ping')
+
+        async def write_command_async() -> None:
+            await target.wait_turn_async(command)
+            sent.append(command)
+
+        tasks = [
+            ensure_future(
+                target.send_async(
+                    Message('text/plain', str(index)),
+                    sent.append,
+                    OutboundPriority.BULK
+                )
+            )
+            for index in range(3)
+        ]
+        await sleep(0)
+
+        # Act
+        tasks.append(ensure_future(write_command_async()))
+        for task in tasks:
+            await task
+
+        # Assert
+        assert [type(envelope) for envelope in sent] == [
+            Message, Command, Message, Message
+        ]
+        assert target.queued_envelopes == 0
@@ -0,0 +1,58 @@
+from lime_python import Command, CommandMethod, Message, Notification
+from pytest import raises
+
+from src import OutboundPriority, PriorityScheduler
+
+
+class TestPriorityScheduler:
+
+    def test_pop_weighted(self) -> None:
+        # Arrange
+        target = PriorityScheduler(
+            {OutboundPriority.COMMAND: 3, OutboundPriority.BULK: 1}
+        )
+        for index in range(8):
+            target.push(OutboundPriority.BULK, f'b{index}')
+            target.push(OutboundPriority.COMMAND, f'c{index}')
+
+        # Act
+        result = [target.pop() for _ in range(8)]
+
+        # Assert
+        assert result.count('b0') + result.count('b1') == 2
+        assert [item for item in result if item[0] == 'c'] == [
+            'c0', 'c1', 'c2', 'c3', 'c4', 'c5'
+        ]
+        assert len(target) == 8
+        assert target.get_queue_depth(OutboundPriority.BULK) == 6
+
+    def test_pop_single_class(self) -> None:
+        # Arrange
+        target = PriorityScheduler()
+        target.push(OutboundPriority.BULK, 1)
+        target.push(OutboundPriority.BULK, 2)
+
+        # Act
+        result = [target.pop(), target.pop()]
+
+        # Assert
+        assert result == [1, 2]
+        with raises(IndexError):
+            target.pop()
+
+    def test_push_unknown_priority(self) -> None:
+        # Act/Assert
+        with raises(ValueError):
+            PriorityScheduler().push('unknown', 1)
+
+    def test_get_default(self) -> None:
+        # Act/Assert
+        assert OutboundPriority.get_default(
+            Command(CommandMethod.GET, '/ping')
+        ) == OutboundPriority.COMMAND
+        assert OutboundPriority.get_default(
+            Notification('received')
+        ) == OutboundPriority.NOTIFICATION
+        assert OutboundPriority.get_default(
+            Message('text/plain', 'foo')
+        ) == OutboundPriority.INTERACTIVE
@@ -0,0 +1,106 @@
+from asyncio import get_event_loop
+
+from lime_python import Command, CommandMethod, Message
+from pytest import approx, mark
+
+from src import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+
+    def test_reserve(self) -> None:
+        # Arrange
+        target = TokenBucket(10, 2, 0)
+
+        # Act
+        delays = [target.reserve(0) for _ in range(4)]
+
+        # Assert
+        assert delays == approx([0, 0, 0.1, 0.2])
+
+    def test_refill(self) -> None:
+        # Arrange
+        target = TokenBucket(10, 2, 0)
+        target.reserve(0)
+        target.reserve(0)
+
+        # Act
+        result = target.reserve(0.1)
+
+        # Assert
+        assert result == 0
+        assert not target.is_idle(0.1)
+        assert target.is_idle(10)
+
+
+class TestRateLimiter:
+
+    @mark.asyncio
+    async def test_reserve_per_destination(self) -> None:
+        # Arrange
+        target = RateLimiter(destination_rate=1)
+
+        # Act
+        first = target.reserve(Message('text/plain', 'a', to='a@0mn.io/x'))
+        same = target.reserve(Message('text/plain', 'b', to='A@0mn.io/y'))
+        other = target.reserve(Message('text/plain', 'c', to='b@0mn.io'))
+
+        # Assert
+        assert first == 0
+        assert same > 0
+        assert other == 0
+        assert target.statistics.acquired == 3
+        assert target.statistics.delayed == 1
+
+    @mark.asyncio
+    async def test_reserve_per_postmaster(self) -> None:
+        # Arrange
+        target = RateLimiter(destination_rate=100, postmaster_rate=1)
+        ai_command = Command(
+            CommandMethod.GET,
+            '/intentions',
+            to='postmaster@ai.msging.net'
+        )
+
+        # Act
+        first = target.reserve(ai_command)
+        second = target.reserve(ai_command)
+        media = target.reserve(
+            Command(CommandMethod.GET, '/', to='postmaster@media.msging.net')
+        )
+
+        # Assert
+        assert first == 0
+        assert second == approx(1, abs=0.01)
+        assert media == 0
+        assert target.statistics.max_wait == second
+
+    @mark.asyncio
+    async def test_acquire_async_global(self) -> None:
+        # Arrange
+        target = RateLimiter(global_rate=50, burst=1)
+        loop = get_event_loop()
+        started_at = loop.time()
+
+        # Act
+        for index in range(3):
+            await target.acquire_async(
+                Message('text/plain', 'foo', to=f'{index}@0mn.io')
+            )
+
+        # Assert
+        assert loop.time() - started_at >= 0.035
+        assert target.statistics.delayed == 2
+        assert target.statistics.average_wait > 0
+
+    @mark.asyncio
+    async def test_acquire_async_disabled(self) -> None:
+        # Arrange
+        target = RateLimiter()
+
+        # Act
+        await target.acquire_async(Message('text/plain', 'foo'))
+
+        # Assert
+        assert not target.enabled
+        assert target.statistics.acquired == 0
@@ -0,0 +1,101 @@
+from asyncio import Queue, sleep
+from types import ModuleType
+from typing import Any, Dict
+
+from pytest import mark, raises
+from pytest_mock import MockerFixture
+
+from src import CodecWebSocketTransport, JsonCodec
+from src.blip_sdk.serialization.json_codec import RawEnvelope
+
+from ..async_mock import async_return
+
+PREFIX = 'lime:'
+ENVELOPE = {
+    'id': '1',
+    'to': 'user@0mn.io',
+    'type': 'text/plain',
+    'content': 'Olá'
+}
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+class LoopbackWebSocket:
+
+    def __init__(self) -> None:
+        self.open = True
+        self.frames = Queue()
+
+    async def send(self, frame: str) -> None:
+        await self.frames.put(frame)
+
+    async def recv(self) -> str:
+        frame = await self.frames.get()
+        if frame is None:
+            raise ConnectionClosed()
+        return frame
+
+    async def close(self) -> None:
+        self.open = False
+        await self.frames.put(None)
+
+
+class PrefixCodec(JsonCodec):
+
+    name = 'prefix'
+
+    def encode(self, envelope: Dict[str, Any]) -> str:
+        return PREFIX + super().encode(envelope)
+
+    def decode(self, raw_envelope: RawEnvelope) -> Dict[str, Any]:
+        assert raw_envelope.startswith(PREFIX)
+        return super().decode(raw_envelope[len(PREFIX):])
+
+
+class TestCodecWebSocketTransport:
+
+    @mark.asyncio
+    async def test_round_trip_async(self, mocker: MockerFixture) -> None:
+        # Arrange
+        websocket = LoopbackWebSocket()
+        client_module = ModuleType('websockets.client')
+        client_module.connect = mocker.MagicMock(
+            return_value=async_return(websocket)
+        )
+        exceptions_module = ModuleType('websockets.exceptions')
+        exceptions_module.ConnectionClosed = ConnectionClosed
+        mocker.patch.dict('sys.modules', {
+            'websockets': ModuleType('websockets'),
+            'websockets.client': client_module,
+            'websockets.exceptions': exceptions_module
+        })
+        target = CodecWebSocketTransport()
+        target.set_json_codec(PrefixCodec())
+        target.on_envelope = mocker.MagicMock()
+
+        # Act
+        await target.open_async('wss://hmg-ws.msging.net:443')
+        target.send(ENVELOPE)
+        await sleep(0)
+        await sleep(0)
+        await target.close_async()
+        await sleep(0)
+
+        # Assert
+        client_module.connect.assert_called_once_with(
+            'wss://hmg-ws.msging.net:443',
+            subprotocols=['lime']
+        )
+        target.on_envelope.assert_called_once_with(ENVELOPE)
+        assert target.encryption == 'tls'
+
+    def test_send_closed(self) -> None:
+        # Arrange
+        target = CodecWebSocketTransport()
+
+        # Act/Assert
+        with raises(ValueError):
+            target.send(ENVELOPE)
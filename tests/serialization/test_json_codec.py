@@ -0,0 +1,65 @@
+from pytest import mark, raises
+
+from src import JsonCodec, get_json_codec
+from src.blip_sdk.serialization import JSON_CODECS
+
+ENVELOPE = {
+    'id': '1',
+    'to': 'user@0mn.io',
+    'type': 'application/vnd.lime.document-select+json',
+    'content': {
+        'header': {'type': 'text/plain', 'value': 'Olá, escolha'},
+        'options': [{'label': {'type': 'text/plain', 'value': 'Sim'}}]
+    },
+    'metadata': {'#uri': 'https://example.com/a/b'}
+}
+
+
+class TestJsonCodec:
+
+    @mark.parametrize('name', JSON_CODECS.keys())
+    def test_round_trip(self, name: str) -> None:
+        # Arrange
+        target = get_json_codec(name)
+
+        # Act
+        raw_envelope = target.encode(ENVELOPE)
+        result = target.decode(raw_envelope)
+
+        # Assert
+        assert isinstance(raw_envelope, str)
+        assert result == ENVELOPE
+
+    @mark.parametrize('name', JSON_CODECS.keys())
+    def test_decode_bytes(self, name: str) -> None:
+        # Arrange
+        target = get_json_codec(name)
+        raw_envelope = JsonCodec().encode(ENVELOPE).encode()
+
+        # Act
+        result = target.decode(raw_envelope)
+
+        # Assert
+        assert result == ENVELOPE
+
+    def test_encode_compact(self) -> None:
+        # Act
+        result = JsonCodec().encode({'id': '1', 'to': 'user@0mn.io'})
+
+        # Assert
+        assert result == '{"id":"1","to":"user@0mn.io"}'
+
+    def test_get_fastest(self) -> None:
+        # Act
+        result = get_json_codec()
+
+        # Assert
+        assert result.name == next(
+            name for name in ('orjson', 'ujson', 'json')
+            if name in JSON_CODECS
+        )
+
+    def test_get_unknown(self) -> None:
+        # Act & Assert
+        with raises(ValueError):
+            get_json_codec('simdjson')
@@ -0,0 +1,70 @@
+from copy import deepcopy
+from pickle import dumps, loads
+
+from lime_python import Message
+
+from src import LazyMessage
+
+RAW_MESSAGE = {
+    'id': '1',
+    'from': 'user@0mn.io/a',
+    'to': 'bot@msging.net/default',
+    'pp': 'user@wa.gw.msging.net',
+    'type': 'application/vnd.lime.chatstate+json',
+    'content': {'state': 'composing'},
+    'metadata': {'#wa.timestamp': '1600000000'}
+}
+
+
+class TestLazyMessage:
+
+    def test_read_headers(self) -> None:
+        # Act
+        result = LazyMessage(RAW_MESSAGE)
+
+        # Assert
+        assert result.id == '1'
+        assert result.from_n == 'user@0mn.io/a'
+        assert result.to == 'bot@msging.net/default'
+        assert result.pp == 'user@wa.gw.msging.net'
+        assert result.type_n == 'application/vnd.lime.chatstate+json'
+        assert not result.is_materialized
+
+    def test_materialize_on_access(self) -> None:
+        # Arrange
+        target = LazyMessage(RAW_MESSAGE)
+
+        # Act
+        content = target.content
+
+        # Assert
+        assert content == {'state': 'composing'}
+        assert target.metadata == {'#wa.timestamp': '1600000000'}
+        assert target.is_materialized
+
+    def test_equals_message(self) -> None:
+        # Act
+        result = LazyMessage(deepcopy(RAW_MESSAGE))
+
+        # Assert
+        assert result == Message.from_json(deepcopy(RAW_MESSAGE))
+        assert isinstance(result, Message)
+
+    def test_set_content(self) -> None:
+        # Arrange
+        target = LazyMessage(RAW_MESSAGE)
+
+        # Act
+        target.content = {'state': 'paused'}
+
+        # Assert
+        assert target.to_json()['content'] == {'state': 'paused'}
+        assert target.to_json()['metadata'] == RAW_MESSAGE['metadata']
+
+    def test_pickle(self) -> None:
+        # Act
+        result = loads(dumps(LazyMessage(RAW_MESSAGE)))
+
+        # Assert
+        assert result.id == '1'
+        assert result.content == {'state': 'composing'}
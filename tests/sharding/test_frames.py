@@ -0,0 +1,43 @@
+from asyncio import TimeoutError
+
+from src import CircuitOpenError
+from src.blip_sdk.sharding.frames import dump_error, load_error
+
+
+class UnpicklableError(Exception):
+
+    def __init__(self, code: int, description: str) -> None:
+        super().__init__(f'{code}: {description}')
+        self.callback = lambda: None
+
+
+class TestFrames:
+
+    def test_error_round_trip(self) -> None:
+        # Act
+        result = load_error(dump_error(ConnectionError('down')))
+        timeout = load_error(dump_error(TimeoutError()))
+
+        # Assert
+        assert isinstance(result, ConnectionError)
+        assert str(result) == 'down'
+        assert isinstance(timeout, TimeoutError)
+
+    def test_error_without_message_constructor(self) -> None:
+        # Act
+        result = load_error(dump_error(UnpicklableError(42, 'failed')))
+        circuit = load_error(dump_error(CircuitOpenError('ai')))
+
+        # Assert
+        assert isinstance(result, UnpicklableError)
+        assert str(result) == '42: failed'
+        assert str(circuit) == 'The circuit of ai is open'
+
+    def test_unknown_error(self) -> None:
+        # Act
+        result = load_error(('missing.module', 'MissingError', 'failed'))
+
+        # Assert
+        assert isinstance(result, RuntimeError)
+        assert str(result) == 'MissingError: failed'
+        assert load_error(dump_error(None)) is None
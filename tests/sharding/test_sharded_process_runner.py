@@ -0,0 +1,227 @@
+from asyncio import ensure_future, sleep
+from os import _exit
+from time import sleep as block
+
+from lime_python import Command, CommandMethod, Message, NotificationEvent
+from pytest import fixture, mark, raises
+from pytest_mock import MockerFixture
+
+from src import Application, Client, ShardedProcessRunner, WorkerClient
+from src.blip_sdk.receiver import Receiver
+
+from ..async_mock import async_return
+
+
+def setup_worker(client: WorkerClient) -> None:
+    async def echo_async(message: Message) -> None:
+        if message.content == 'fail':
+            raise ValueError('failed')
+        if message.content == 'exit':
+            _exit(1)
+        if message.content == 'hang':
+            await sleep(60)
+        if message.content == 'block':
+            block(60)
+        result = await client.process_command_async(
+            Command(CommandMethod.GET, f'/contexts/{message.from_n}')
+        )
+        client.send_message(
+            Message('text/plain', result.resource, to=message.from_n)
+        )
+
+    client.add_message_receiver(Receiver(True, echo_async))
+
+
+class TestShardedProcessRunner:
+
+    @fixture
+    def client(self, mocker: MockerFixture) -> Client:
+        client = Client('127.0.0.1:8124', mocker.MagicMock(), Application())
+        client.client_channel.local_node = 'bot@msging.net/default'
+        yield client
+
+    def test_get_shard(self, client: Client) -> None:
+        # Arrange
+        target = ShardedProcessRunner(client, setup_worker, 4)
+        message = Message('text/plain', 'foo', from_n='user@0mn.io/a')
+        same_sender = Message('text/plain', 'bar', from_n='USER@0mn.io/b')
+
+        # Act
+        shard = target.get_shard(message)
+
+        # Assert
+        assert 0 <= shard < 4
+        assert shard == target.get_shard(same_sender)
+
+    def test_invalid_processes(self, client: Client) -> None:
+        # Act/Assert
+        with raises(ValueError):
+            ShardedProcessRunner(client, setup_worker, 0)
+
+    @mark.asyncio
+    async def test_run_receivers_on_workers(
+        self,
+        client: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        send_message_mock = mocker.MagicMock()
+        client.send_message = send_message_mock
+        send_notification_mock = mocker.MagicMock()
+        client.send_notification = send_notification_mock
+        command_mock = mocker.MagicMock(
+            return_value=async_return(
+                Command(status='success', resource='state')
+            )
+        )
+        client.process_command_async = command_mock
+        target = ShardedProcessRunner(client, setup_worker, 1)
+
+        # Act
+        target.start()
+        try:
+            client.client_channel.on_message(
+                Message('text/plain', 'foo', id='1', from_n='user@0mn.io')
+            )
+            client.client_channel.on_message(
+                Message('text/plain', 'fail', id='2', from_n='user@0mn.io')
+            )
+            for _ in range(200):
+                if send_notification_mock.call_count >= 4:
+                    break
+                await sleep(0.05)
+        finally:
+            await target.stop_async()
+
+        # Assert
+        assert command_mock.call_args[0][0].uri == '/contexts/user@0mn.io'
+        reply = send_message_mock.call_args[0][0]
+        assert reply.content == 'state'
+        assert reply.to == 'user@0mn.io'
+        receipts = sorted(
+            (call[0][0].id, call[0][0].event)
+            for call in send_notification_mock.call_args_list
+        )
+        assert receipts == [
+            ('1', NotificationEvent.CONSUMED),
+            ('1', NotificationEvent.RECEIVED),
+            ('2', NotificationEvent.FAILED),
+            ('2', NotificationEvent.RECEIVED)
+        ]
+        assert target.pending == 0
+
+    @mark.asyncio
+    async def test_dead_worker_fails_message(
+        self,
+        client: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        mocker.patch(
+            'src.blip_sdk.sharding.sharded_process_runner.LIVENESS_INTERVAL',
+            0.05
+        )
+        send_notification_mock = mocker.MagicMock()
+        client.send_notification = send_notification_mock
+        target = ShardedProcessRunner(client, setup_worker, 1)
+
+        client.process_command_async = mocker.MagicMock(
+            return_value=async_return(
+                Command(status='success', resource='state')
+            )
+        )
+        client.send_message = mocker.MagicMock()
+        target = ShardedProcessRunner(client, setup_worker, 1)
+
+        # Act
+        target.start()
+        try:
+            client.client_channel.on_message(
+                Message('text/plain', 'exit', id='1', from_n='user@0mn.io')
+            )
+            for _ in range(200):
+                if send_notification_mock.call_count >= 2:
+                    break
+                await sleep(0.05)
+            client.client_channel.on_message(
+                Message('text/plain', 'foo', id='2', from_n='user@0mn.io')
+            )
+            for _ in range(200):
+                if send_notification_mock.call_count >= 4:
+                    break
+                await sleep(0.05)
+        finally:
+            await target.stop_async()
+
+        # Assert
+        receipts = [
+            (call[0][0].id, call[0][0].event)
+            for call in send_notification_mock.call_args_list
+        ]
+        assert ('1', NotificationEvent.FAILED) in receipts
+        assert ('2', NotificationEvent.CONSUMED) in receipts
+        failed = send_notification_mock.call_args_list[1][0][0]
+        assert 'died' in failed.reason.description
+        assert target.pending == 0
+
+    @mark.asyncio
+    async def test_stop_fails_pending(
+        self,
+        client: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        send_notification_mock = mocker.MagicMock()
+        client.send_notification = send_notification_mock
+        target = ShardedProcessRunner(client, setup_worker, 1)
+        target.start()
+        client.client_channel.on_message(
+            Message('text/plain', 'hang', id='1', from_n='user@0mn.io')
+        )
+        await sleep(0.1)
+
+        # Act
+        await target.stop_async()
+        await sleep(0.01)
+
+        # Assert
+        failed = send_notification_mock.call_args[0][0]
+        assert failed.event == NotificationEvent.FAILED
+        assert target.pending == 0
+
+    @mark.asyncio
+    async def test_stop_terminates_blocked_worker(
+        self,
+        client: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        mocker.patch(
+            'src.blip_sdk.sharding.sharded_process_runner.STOP_TIMEOUT',
+            0.2
+        )
+        client.send_notification = mocker.MagicMock()
+        target = ShardedProcessRunner(client, setup_worker, 1)
+        target.start()
+        client.client_channel.on_message(
+            Message('text/plain', 'block', id='1', from_n='user@0mn.io')
+        )
+        await sleep(0.5)
+        ticks = 0
+
+        async def tick_async() -> None:
+            nonlocal ticks
+            while True:  # noqa: WPS457
+                ticks += 1
+                await sleep(0.01)
+
+        ticker = ensure_future(tick_async())
+
+        # Act
+        await target.stop_async()
+        ticker.cancel()
+        await sleep(0.01)
+
+        # Assert
+        assert ticks > 5
+        assert target.pending == 0
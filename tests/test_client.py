@@ -1,3 +1,5 @@
+from asyncio import (Event, Future, TimeoutError, ensure_future,
+                     get_event_loop, sleep)
 from typing import Callable
 from lime_python import (Command, CommandMethod, CommandStatus,
                          GuestAuthentication, KeyAuthentication, Message,
@@ -6,7 +8,10 @@ from lime_python import (Command, CommandMethod, CommandStatus,
 from pytest import fixture, mark, raises
 from pytest_mock import MockerFixture
 
-from src import Application, ChatExtension, Client, MediaExtension
+from src import (Application, ChatExtension, CircuitBreaker,
+                 CircuitOpenError, Client, MediaExtension, ExecutionMode,
+                 HedgingPolicy, JsonCodec, LruDeduplicationStore,
+                 OutboundPriority, OverflowPolicy, RetryPolicy)
 from src.blip_sdk.receiver import Receiver
 
 from .async_mock import async_return
@@ -402,3 +407,944 @@ class TestClient:
 
         # Assert
         assert isinstance(remove_handler, Callable)
+
+    @mark.asyncio
+    async def test_transport_on_close_reconnects(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        connect_mock = mocker.MagicMock(
+            return_value=async_return(ESTABLISHED_SESSION)
+        )
+        target._Client__open_session_async = connect_mock
+        old_channel = target.client_channel
+
+        # Act
+        target.transport.on_close()
+        target.transport.on_close()
+        await target._Client__reconnection_supervisor.schedule()
+
+        # Assert
+        connect_mock.assert_called_once()
+        assert target.client_channel is not old_channel
+        assert target.reconnection_metrics.reconnections == 1
+
+    @mark.asyncio
+    async def test_reconnection_failed(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target._Client__open_session_async = mocker.MagicMock(
+            side_effect=ConnectionError
+        )
+        target.on_reconnection_failed = mocker.MagicMock()
+        supervisor = target._Client__reconnection_supervisor
+        supervisor.base_delay = 0
+        supervisor.max_attempts = 3
+
+        # Act
+        target.transport.on_close()
+        result = await supervisor.schedule()
+
+        # Assert
+        assert result is None
+        assert target.reconnection_metrics.attempts == 3
+        target.on_reconnection_failed.assert_called_once()
+
+    def test_notify_message_receivers(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        text_callback = mocker.MagicMock()
+        other_callback = mocker.MagicMock()
+        target.add_message_receiver(
+            Receiver(True, text_callback, type_n='text/plain')
+        )
+        remove_rec = target.add_message_receiver(
+            Receiver(True, other_callback, type_n='image/png')
+        )
+        target.send_notification = mocker.MagicMock()
+        message = Message('text/plain', 'foo')
+
+        # Act
+        remove_rec()
+        target.client_channel.on_message(message)
+
+        # Assert
+        text_callback.assert_called_once_with(message)
+        other_callback.assert_not_called()
+
+    @mark.asyncio
+    async def test_message_receivers_queue_full(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.receiver_pool.max_concurrency = 0
+        target.receiver_pool.max_queue_size = 1
+        target.receiver_pool.overflow_policy = OverflowPolicy.FAIL
+
+        async def callback_async(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        target.client_channel.local_node = 'bot@msging.net/default'
+        send_mock = mocker.MagicMock()
+        target.send_notification = send_mock
+
+        # Act
+        for id in ('1', '2'):
+            target.client_channel.on_message(
+                Message('text/plain', 'foo', id=id, from_n='user@0mn.io')
+            )
+        await sleep(0)
+        await target.outbound_flow_control.join_async()
+
+        # Assert
+        receipts = [
+            (call[0][0].id, call[0][0].event)
+            for call in send_mock.call_args_list
+        ]
+        assert receipts == [
+            ('1', NotificationEvent.RECEIVED),
+            ('2', NotificationEvent.RECEIVED),
+            ('2', NotificationEvent.FAILED)
+        ]
+        assert target.receiver_pool.queue_depth == 1
+
+    @mark.asyncio
+    async def test_message_receivers_queue_drop_oldest(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.receiver_pool.max_concurrency = 0
+        target.receiver_pool.max_queue_size = 1
+        target.receiver_pool.overflow_policy = OverflowPolicy.DROP_OLDEST
+
+        async def callback_async(message: Message) -> None:
+            pass  # noqa: WPS420
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        target.client_channel.local_node = 'bot@msging.net/default'
+        send_mock = mocker.MagicMock()
+        target.send_notification = send_mock
+
+        # Act
+        for id in ('1', '2'):
+            target.client_channel.on_message(
+                Message('text/plain', 'foo', id=id, from_n='user@0mn.io')
+            )
+        for _ in range(3):
+            await sleep(0)
+        await target.outbound_flow_control.join_async()
+
+        # Assert
+        failed = send_mock.call_args_list[-1][0][0]
+        assert (failed.id, failed.event) == ('1', NotificationEvent.FAILED)
+        assert failed.reason.description == 'Dropped by the overflow policy'
+
+    @mark.asyncio
+    async def test_ordered_conversations(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.application.ordered_conversations = True
+        events = []
+
+        async def callback_async(message: Message) -> None:
+            events.append(f'start {message.content}')
+            await sleep(0)
+            events.append(f'end {message.content}')
+
+        target.add_message_receiver(Receiver(True, callback_async))
+
+        # Act
+        target.client_channel.on_message(
+            Message('text/plain', '1', from_n='user@0mn.io/a')
+        )
+        target.client_channel.on_message(
+            Message('text/plain', '2', from_n='user@0mn.io/b')
+        )
+        await sleep(0.01)
+
+        # Assert
+        assert events == ['start 1', 'end 1', 'start 2', 'end 2']
+        assert target.conversation_dispatcher.active_conversations == 0
+
+    @mark.asyncio
+    async def test_acknowledge_async_receivers(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        async def callback_async(message: Message) -> None:
+            await sleep(0)
+            if message.content == 'fail':
+                raise ValueError('failed')
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        target.client_channel.local_node = 'bot@msging.net/default'
+        send_mock = mocker.MagicMock()
+        target.send_notification = send_mock
+
+        # Act
+        for id, content in (('1', 'foo'), ('2', 'fail')):
+            target.client_channel.on_message(
+                Message('text/plain', content, id=id, from_n='user@0mn.io')
+            )
+        await sleep(0.01)
+
+        # Assert
+        receipts = [
+            (call[0][0].id, call[0][0].event)
+            for call in send_mock.call_args_list
+        ]
+        assert receipts == [
+            ('1', NotificationEvent.RECEIVED),
+            ('2', NotificationEvent.RECEIVED),
+            ('1', NotificationEvent.CONSUMED),
+            ('2', NotificationEvent.FAILED)
+        ]
+        assert send_mock.call_args_list[3][0][0].reason.description == 'failed'
+
+    @mark.asyncio
+    async def test_connect_skip_unchanged_bootstrap_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.transport.open_async = mocker.MagicMock(
+            side_effect=lambda uri: async_return(None)
+        )
+        target.client_channel.establish_session_async = mocker.MagicMock(
+            side_effect=lambda *args: async_return(ESTABLISHED_SESSION)
+        )
+        command_mock = mocker.MagicMock(
+            side_effect=lambda command: async_return(None)
+        )
+        target.process_command_async = command_mock
+        target.application.authentication = KeyAuthentication('key')
+        target.application.skip_unchanged_bootstrap = True
+
+        # Act
+        await target.connect_async()
+        await target.connect_async()
+        target.application.presence['status'] = 'unavailable'
+        await target.connect_async()
+        await target.connect_async()
+
+        # Assert
+        assert command_mock.call_count == 4
+        assert target.connection_latency.total >= 0
+        assert target.connection_latency.total == (
+            target.connection_latency.transport_open +
+            target.connection_latency.session_establish +
+            target.connection_latency.bootstrap
+        )
+
+    @mark.asyncio
+    async def test_connect_retries_failed_bootstrap_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.transport.open_async = mocker.MagicMock(
+            side_effect=lambda uri: async_return(None)
+        )
+        target.client_channel.establish_session_async = mocker.MagicMock(
+            side_effect=lambda *args: async_return(ESTABLISHED_SESSION)
+        )
+        command_mock = mocker.MagicMock(
+            side_effect=lambda command: async_return(
+                Command(status=CommandStatus.FAILURE)
+            )
+        )
+        target.process_command_async = command_mock
+        target.application.authentication = KeyAuthentication('key')
+        target.application.skip_unchanged_bootstrap = True
+
+        # Act
+        await target.connect_async()
+        await target.connect_async()
+
+        # Assert
+        assert command_mock.call_count == 4
+
+    @mark.asyncio
+    @mark.parametrize(
+        ['execution_mode', 'callback', 'expected_event'],
+        [
+            (ExecutionMode.THREAD_POOL, lambda message: False, 'failed'),
+            (ExecutionMode.THREAD_POOL, lambda message: None, 'consumed'),
+            (ExecutionMode.PROCESS_POOL, repr, 'consumed')
+        ]
+    )
+    async def test_run_receiver_in_executor(
+        self,
+        target: Client,
+        mocker: MockerFixture,
+        execution_mode: str,
+        callback: Callable,
+        expected_event: str
+    ) -> None:
+        # Arrange
+        target.add_message_receiver(
+            Receiver(True, callback, execution_mode=execution_mode)
+        )
+        target.client_channel.local_node = 'bot@msging.net/default'
+        send_mock = mocker.MagicMock()
+        target.send_notification = send_mock
+
+        # Act
+        target.client_channel.on_message(
+            Message('text/plain', 'foo', id='1', from_n='user@0mn.io')
+        )
+        await sleep(0)
+        await target.outbound_flow_control.join_async()
+        events = [call[0][0].event for call in send_mock.call_args_list]
+        for _ in range(100):
+            if len(send_mock.call_args_list) > 1:
+                break
+            await sleep(0.05)
+
+        # Assert
+        assert events == [NotificationEvent.RECEIVED]
+        assert send_mock.call_args_list[-1][0][0].event == expected_event
+
+    @mark.asyncio
+    async def test_close_with_drain_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        progress_reports = []
+        target.on_drain_progress = progress_reports.append
+        events = []
+
+        async def callback_async(message: Message) -> None:
+            await sleep(0.15)
+            events.append(message.content)
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        target.client_channel.state = SessionState.ESTABLISHED
+
+        async def finish_async():
+            events.append('finished')
+            return FINISHED_SESSION
+
+        target.client_channel.send_finishing_session_async = finish_async
+
+        # Act
+        target.client_channel.on_message(Message('text/plain', 'first'))
+        result = await target.close_async(1)
+        target.client_channel.on_message(Message('text/plain', 'ignored'))
+        await sleep(0.2)
+
+        # Assert
+        assert result == FINISHED_SESSION
+        assert events == ['first', 'finished']
+        assert progress_reports[0].running_receivers == 1
+        assert progress_reports[-1].remaining == 0
+
+    @mark.asyncio
+    async def test_close_shuts_down_executors_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        executor = target._Client__get_executor(ExecutionMode.THREAD_POOL)
+        shutdown_mock = mocker.patch.object(executor, 'shutdown')
+        target.client_channel.state = SessionState.ESTABLISHED
+        target.client_channel.send_finishing_session_async = \
+            mocker.MagicMock(return_value=async_return(FINISHED_SESSION))
+
+        # Act
+        await target.close_async()
+        new_executor = target._Client__get_executor(ExecutionMode.THREAD_POOL)
+
+        # Assert
+        shutdown_mock.assert_called_once_with(wait=False)
+        assert new_executor is not executor
+        new_executor.shutdown()
+
+    @mark.asyncio
+    async def test_drain_timeout_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        async def process_command_async(command, timeout):
+            await sleep(1)
+
+        target.client_channel.process_command_async = process_command_async
+        task = ensure_future(
+            target.process_command_async(Command(CommandMethod.GET, '/ping'))
+        )
+        await sleep(0)
+
+        # Act
+        result = await target.drain_async(0.1)
+
+        # Assert
+        assert result.pending_commands == 1
+        assert result.elapsed >= 0.1
+        task.cancel()
+
+    @mark.asyncio
+    async def test_send_message_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        message = Message('text/plain', 'foo')
+        send_mock = mocker.MagicMock()
+        target.client_channel.send_message = send_mock
+
+        # Act
+        await target.send_message_async(message)
+
+        # Assert
+        send_mock.assert_called_once_with(message)
+        assert target.outbound_flow_control.queued_envelopes == 0
+
+    @mark.asyncio
+    async def test_process_command_overtakes_bulk_messages_async(
+        self,
+        target: Client,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        written = []
+        buffer_sizes = [65536]
+        target.transport.websocket.transport.get_write_buffer_size = \
+            lambda: buffer_sizes[0]
+        target.client_channel.send_message = \
+            lambda message: written.append(message.content)
+
+        async def process_command_async(command, timeout):
+            written.append(command.uri)
+            return Command(status=CommandStatus.SUCCESS)
+
+        target.client_channel.process_command_async = process_command_async
+        bulk = [
+            ensure_future(
+                target.send_message_async(
+                    Message('text/plain', str(index)),
+                    OutboundPriority.BULK
+                )
+            )
+            for index in range(3)
+        ]
+        await sleep(0)
+        command = ensure_future(
+            target.process_command_async(Command(CommandMethod.GET, '/ping'))
+        )
+        await sleep(0)
+        queued = target.outbound_flow_control.queued_envelopes
+
+        # Act
+        buffer_sizes[0] = 0
+        await command
+        for task in bulk:
+            await task
+
+        # Assert
+        assert queued == 4
+        assert written[0] == '/ping'
+        assert written[1:] == ['0', '1', '2']
+
+    @mark.asyncio
+    async def test_hedged_command_loser_not_timed_out_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = Client(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(
+                command_hedging_policy=HedgingPolicy(
+                    ['/contexts/{0}'],
+                    initial_delay=0.01
+                )
+            )
+        )
+        target.client_channel.state = SessionState.ESTABLISHED
+        exception_handler = mocker.MagicMock()
+        loop = get_event_loop()
+        loop.set_exception_handler(exception_handler)
+        command = Command(CommandMethod.GET, '/contexts/a@0mn.io', id='1')
+        resolves = target.client_channel.command_resolves
+        task = ensure_future(target.process_command_async(command, 5))
+        await sleep(0.05)
+        hedge_id = next(key for key in resolves if key != '1')
+
+        # Act
+        resolves[hedge_id](Command(id=hedge_id, status='success'))
+        result = await task
+        await sleep(0.01)
+        loop.set_exception_handler(None)
+
+        # Assert
+        assert result.id == hedge_id
+        assert '1' not in resolves
+        assert not getattr(command, 'timeout', False)
+        exception_handler.assert_not_called()
+
+    @mark.asyncio
+    async def test_process_command_rate_limited_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(rate_limit_per_postmaster=1)
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.client_channel.process_command_async = mocker.MagicMock(
+            side_effect=lambda command, timeout: async_return(command)
+        )
+        command = Command(
+            CommandMethod.GET,
+            '/',
+            to='postmaster@ai.msging.net'
+        )
+
+        # Act
+        await target.process_command_async(command)
+
+        # Assert
+        assert target.rate_limiter.statistics.acquired == 1
+        assert target.rate_limiter.statistics.delayed == 0
+
+    @mark.asyncio
+    async def test_skip_duplicated_messages_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            message_deduplication_store=LruDeduplicationStore()
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.client_channel.local_node = 'bot@msging.net/default'
+        target.send_notification = mocker.MagicMock()
+        callback = mocker.MagicMock(return_value=True)
+        target.add_message_receiver(Receiver(True, callback))
+        message = Message('text/plain', 'foo', id='1', from_n='a@0mn.io')
+
+        # Act
+        target.client_channel.on_message(message)
+        target.client_channel.on_message(message)
+        await sleep(0)
+        await sleep(0)
+        await target.outbound_flow_control.join_async()
+
+        # Assert
+        callback.assert_called_once_with(message)
+        assert application.message_deduplication_store.duplicates == 1
+        receipts = [
+            (notification.id, notification.event)
+            for call in target.send_notification.call_args_list
+            for notification in call[0]
+        ]
+        assert receipts == [
+            ('1', NotificationEvent.RECEIVED),
+            ('1', NotificationEvent.CONSUMED),
+            ('1', NotificationEvent.RECEIVED),
+            ('1', NotificationEvent.CONSUMED)
+        ]
+
+    @mark.asyncio
+    async def test_duplicate_waits_original_message_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            message_deduplication_store=LruDeduplicationStore()
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.client_channel.local_node = 'bot@msging.net/default'
+        target.send_notification = mocker.MagicMock()
+        release = Event()
+
+        async def callback_async(message: Message) -> None:
+            await release.wait()
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        message = Message('text/plain', 'foo', id='1', from_n='a@0mn.io')
+
+        # Act
+        target.client_channel.on_message(message)
+        target.client_channel.on_message(message)
+        for _ in range(3):
+            await sleep(0)
+        await target.outbound_flow_control.join_async()
+        events_in_flight = [
+            call[0][0].event
+            for call in target.send_notification.call_args_list
+        ]
+        release.set()
+        for _ in range(5):
+            await sleep(0)
+        await target.outbound_flow_control.join_async()
+
+        # Assert
+        assert events_in_flight == [NotificationEvent.RECEIVED]
+        assert [
+            call[0][0].event
+            for call in target.send_notification.call_args_list
+        ] == [
+            NotificationEvent.RECEIVED,
+            NotificationEvent.CONSUMED,
+            NotificationEvent.RECEIVED,
+            NotificationEvent.CONSUMED
+        ]
+        assert application.message_deduplication_store.duplicates == 1
+
+    @mark.asyncio
+    async def test_failed_message_not_deduplicated_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        store = LruDeduplicationStore()
+        target = Client(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(message_deduplication_store=store)
+        )
+        target.client_channel.local_node = 'bot@msging.net/default'
+        target.send_notification = mocker.MagicMock()
+        calls = []
+
+        async def callback_async(message: Message) -> None:
+            calls.append(message.id)
+            raise ValueError('failed')
+
+        target.add_message_receiver(Receiver(True, callback_async))
+        message = Message('text/plain', 'foo', id='1', from_n='a@0mn.io')
+
+        # Act
+        for _ in range(2):
+            target.client_channel.on_message(message)
+            for _ in range(10):  # noqa: WPS440
+                await sleep(0)
+        await target.outbound_flow_control.join_async()
+
+        # Assert
+        assert calls == ['1', '1']
+        assert len(store) == 0
+        assert store.duplicates == 0
+
+    @mark.asyncio
+    async def test_discarded_message_not_deduplicated_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        class SlowStore(LruDeduplicationStore):
+
+            async def is_duplicate_async(self, message_id: str) -> bool:
+                await sleep(0)
+                return self.is_duplicate(message_id)
+
+        store = SlowStore()
+        target = Client(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(message_deduplication_store=store)
+        )
+        target.client_channel.local_node = 'bot@msging.net/default'
+        callback = mocker.MagicMock(return_value=True)
+        target.add_message_receiver(Receiver(True, callback))
+
+        # Act
+        target.client_channel.on_message(
+            Message('text/plain', 'foo', id='1', from_n='a@0mn.io')
+        )
+        await sleep(0)
+        target._Client__draining = True
+        for _ in range(3):
+            await sleep(0)
+
+        # Assert
+        callback.assert_not_called()
+        assert len(store) == 0
+
+    @mark.asyncio
+    async def test_process_command_with_retries_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            command_retry_policy=RetryPolicy(['/threads'], base_delay=0)
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.client_channel.process_command_async = mocker.MagicMock(
+            side_effect=[
+                TimeoutError(),
+                async_return(Command(status='success'))
+            ]
+        )
+
+        # Act
+        result = await target.process_command_async(
+            Command(CommandMethod.GET, '/threads')
+        )
+
+        # Assert
+        assert result.status == 'success'
+        assert application.command_retry_policy.statistics.retries == {
+            '/threads': 1
+        }
+
+    @mark.asyncio
+    async def test_process_command_circuit_open_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            command_circuit_breaker=CircuitBreaker(failure_threshold=1)
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        process_mock = mocker.MagicMock(side_effect=TimeoutError())
+        target.client_channel.process_command_async = process_mock
+        command = Command(
+            CommandMethod.GET,
+            '/intentions',
+            to='postmaster@ai.msging.net/default'
+        )
+        with raises(TimeoutError):
+            await target.process_command_async(command)
+
+        # Act/Assert
+        with raises(CircuitOpenError):
+            await target.process_command_async(command)
+        assert process_mock.call_count == 1
+
+    @mark.asyncio
+    async def test_hold_sends_while_reconnecting_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(offline_outbox_size=10)
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target._Client__reconnection_supervisor.schedule = mocker.MagicMock()
+        target.transport.open_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        target.client_channel.establish_session_async = mocker.MagicMock(
+            return_value=async_return(ESTABLISHED_SESSION)
+        )
+        send_mock = mocker.MagicMock()
+        target.client_channel.send_message = send_mock
+        target.process_command_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        message = Message('text/plain', 'reply')
+
+        # Act
+        target.transport.on_close()
+        target.send_message(message)
+        held = len(target.offline_outbox)
+        await target.connect_async()
+
+        # Assert
+        assert held == 1
+        send_mock.assert_called_once_with(message)
+        assert target.offline_outbox.flushed == 1
+
+    @mark.asyncio
+    async def test_fail_held_sends_when_reconnection_fails_async(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(offline_outbox_size=10)
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target._Client__reconnection_supervisor.schedule = mocker.MagicMock()
+        target.on_reconnection_failed = mocker.MagicMock()
+        target.transport.on_close()
+        target.send_message(Message('text/plain', 'reply'))
+        pending = ensure_future(
+            target.process_command_async(Command(CommandMethod.GET, '/ping'))
+        )
+        await sleep(0)
+
+        # Act
+        target._Client__reconnection_supervisor.on_failed(
+            ConnectionError('gave up')
+        )
+
+        # Assert
+        with raises(ConnectionError, match='gave up'):
+            await pending
+        assert len(target.offline_outbox) == 0
+        assert not target.offline_outbox.offline
+        target.on_reconnection_failed.assert_called_once()
+
+    def test_get_coalesced_extension(self, mocker: MockerFixture) -> None:
+        # Arrange
+        application = Application(coalesced_extensions={ChatExtension})
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+
+        # Act/Assert
+        assert target.chat_extension.coalesce_gets
+        assert not target.media_extension.coalesce_gets
+
+    def test_transport_lazy_envelopes(self, mocker: MockerFixture) -> None:
+        # Arrange
+        application = Application(lazy_envelopes=True)
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.client_channel.local_node = 'bot@msging.net/default'
+        chatstate_callback = mocker.MagicMock()
+        target.add_message_receiver(
+            Receiver(
+                True,
+                chatstate_callback,
+                type_n='application/vnd.lime.chatstate+json'
+            )
+        )
+        notification_callback = mocker.MagicMock()
+        target.add_notification_receiver(
+            Receiver(True, notification_callback)
+        )
+
+        # Act
+        target.transport.on_envelope(
+            {'type': 'text/plain', 'content': {'text': 'ignored'}}
+        )
+        target.transport.on_envelope({'id': '1', 'event': 'received'})
+
+        # Assert
+        chatstate_callback.assert_not_called()
+        notification_callback.assert_called_once()
+
+    def test_transport_json_codec(self, mocker: MockerFixture) -> None:
+        # Arrange
+        json_codec = JsonCodec()
+        application = Application(json_codec=json_codec)
+        transports = [mocker.MagicMock(), mocker.MagicMock()]
+
+        # Act
+        target = Client('127.0.0.1:8124', transports.pop, application)
+
+        # Assert
+        target.transport.set_json_codec.assert_called_once_with(json_codec)
+        transports[0].set_json_codec.assert_not_called()
+
+    @mark.asyncio
+    async def test_saturated_receivers_read_command_responses(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            receiver_max_concurrency=1,
+            receiver_queue_size=1
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.send_notification = mocker.MagicMock()
+        socket_transport = target.transport.websocket.transport
+        response = Future()
+        target.client_channel.process_command_async = mocker.MagicMock(
+            return_value=response
+        )
+        handled = []
+
+        async def callback_async(message: Message) -> None:
+            await target.process_command_async(
+                Command(CommandMethod.GET, '/ping')
+            )
+            handled.append(message.content)
+
+        target.add_message_receiver(Receiver(True, callback_async))
+
+        # Act
+        for content in ('first', 'second', 'third'):
+            target.client_channel.on_message(Message('text/plain', content))
+        await sleep(0)
+        saturated = target.receiver_pool.saturated
+        last_call = socket_transport.method_calls[-1]
+        response.set_result(Command(status='success'))
+        for _ in range(10):
+            await sleep(0)
+
+        # Assert
+        assert saturated
+        assert last_call == mocker.call.resume_reading()
+        assert handled == ['first', 'second', 'third']
+        assert not target.receiver_pool.saturated
+
+    def test_transport_buffer_size(self, mocker: MockerFixture) -> None:
+        # Arrange
+        application = Application(
+            outbound_high_water_envelopes=0,
+            outbound_high_water_bytes=1024
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        socket_transport = target.transport.websocket.transport
+        socket_transport.get_write_buffer_size.return_value = 2048
+
+        # Act
+        result = target._Client__get_transport_buffer_size()
+
+        # Assert
+        assert result == 2048
+        assert target.application.outbound_high_water_envelopes == 0
+        assert target.outbound_flow_control.high_water_envelopes == 0
+        assert target.outbound_flow_control.high_water_bytes == 1024
+
+    @mark.asyncio
+    async def test_full_receivers_queue_pauses_reading(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        application = Application(
+            receiver_max_concurrency=1,
+            receiver_queue_size=1
+        )
+        target = Client('127.0.0.1:8124', mocker.MagicMock(), application)
+        target.send_notification = mocker.MagicMock()
+        socket_transport = target.transport.websocket.transport
+        release = Event()
+
+        async def callback_async(message: Message) -> None:
+            await release.wait()
+
+        target.add_message_receiver(Receiver(True, callback_async))
+
+        # Act
+        target.client_channel.on_message(Message('text/plain', 'first'))
+        target.client_channel.on_message(Message('text/plain', 'second'))
+        paused = socket_transport.pause_reading.called
+        release.set()
+        await sleep(0)
+        await sleep(0)
+
+        # Assert
+        assert paused
+        assert target.receiver_pool.queue_depth == 0
+        socket_transport.resume_reading.assert_called_once()
@@ -0,0 +1,254 @@
+from asyncio import Event, ensure_future, sleep
+
+from lime_python import Command, CommandMethod, Message
+from pytest import fixture, mark, raises
+from pytest_mock import MockerFixture
+
+from src import Application, Client, ClientPool
+from src.blip_sdk.receiver import Receiver
+
+from .async_mock import async_return
+
+
+class TestClientPool:
+
+    @fixture
+    def target(self, mocker: MockerFixture) -> ClientPool:
+        yield ClientPool(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(instance='bot'),
+            3
+        )
+
+    def test_members(self, target: ClientPool) -> None:
+        # Assert
+        assert len(target.members) == 3
+        assert all(isinstance(member, Client) for member in target.members)
+        assert [
+            member.application.instance for member in target.members
+        ] == ['bot-0', 'bot-1', 'bot-2']
+        assert target.in_flight == [0, 0, 0]
+
+    def test_invalid_size(self, mocker: MockerFixture) -> None:
+        # Act/Assert
+        with raises(ValueError):
+            ClientPool('127.0.0.1:8124', mocker.MagicMock(), Application(), 0)
+
+    def test_add_message_receiver(
+        self,
+        target: ClientPool,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        callback = mocker.MagicMock()
+        message = Message('text/plain', 'foo')
+
+        # Act
+        remove_rec = target.add_message_receiver(Receiver(True, callback))
+        for member in target.members:
+            member.client_channel.on_message(message)
+        remove_rec()
+        target.members[0].client_channel.on_message(message)
+
+        # Assert
+        assert callback.call_count == 3
+
+    @mark.asyncio
+    async def test_process_command_async_least_in_flight(
+        self,
+        target: ClientPool,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        release = Event()
+
+        async def process_command_async(command, timeout):
+            await release.wait()
+            return command
+
+        for member in target.members:
+            member.process_command_async = mocker.MagicMock(
+                side_effect=process_command_async
+            )
+        command = Command(CommandMethod.GET, '/ping')
+
+        # Act
+        tasks = [
+            ensure_future(target.process_command_async(command))
+            for _ in range(4)
+        ]
+        await sleep(0)
+        in_flight = target.in_flight
+        release.set()
+        for task in tasks:
+            await task
+
+        # Assert
+        assert sorted(in_flight) == [1, 1, 2]
+        assert target.in_flight == [0, 0, 0]
+
+    @mark.asyncio
+    async def test_replace_member_async(
+        self,
+        target: ClientPool,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        callback = mocker.MagicMock()
+        target.add_message_receiver(Receiver(True, callback))
+        old_member = target.members[1]
+        old_member.close_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        connect_mock = mocker.MagicMock(return_value=async_return(None))
+        mocker.patch.object(Client, 'connect_async', connect_mock)
+
+        # Act
+        new_member = await target.replace_member_async(old_member)
+        new_member.client_channel.on_message(Message('text/plain', 'foo'))
+
+        # Assert
+        assert target.members[1] is new_member
+        assert new_member is not old_member
+        assert new_member.application.instance == 'bot-1'
+        old_member.close_async.assert_called_once()
+        connect_mock.assert_called_once()
+        callback.assert_called_once()
+
+    @mark.asyncio
+    async def test_replace_member_drain_timeout(
+        self,
+        target: ClientPool,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target.drain_timeout = 0
+        release = Event()
+        old_member = target.members[0]
+        old_member.listening = True
+
+        async def process_command_async(*args) -> Command:
+            await release.wait()
+            return Command(CommandMethod.GET, '/ping')
+
+        old_member.process_command_async = process_command_async
+        old_member.close_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        mocker.patch.object(
+            Client,
+            'connect_async',
+            mocker.MagicMock(return_value=async_return(None))
+        )
+        pending = ensure_future(
+            target.process_command_async(Command(CommandMethod.GET, '/ping'))
+        )
+        await sleep(0)
+
+        # Act
+        await target.replace_member_async(old_member)
+        release.set()
+        result = await pending
+
+        # Assert
+        assert result.uri == '/ping'
+        assert target.in_flight == [0, 0, 0]
+
+    @mark.asyncio
+    async def test_replace_member_keeps_instance_name(
+        self,
+        target: ClientPool,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        for member in target.members:
+            member.close_async = mocker.MagicMock(
+                return_value=async_return(None)
+            )
+        target.members.remove(target.members[0])
+        mocker.patch.object(
+            Client,
+            'connect_async',
+            mocker.MagicMock(return_value=async_return(None))
+        )
+
+        # Act
+        new_member = await target.replace_member_async(target.members[1])
+
+        # Assert
+        assert new_member.application.instance == 'bot-2'
+        assert [
+            member.application.instance for member in target.members
+        ] == ['bot-1', 'bot-2']
+
+    @mark.asyncio
+    async def test_replace_member_connect_failed(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = ClientPool(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(instance='bot', reconnection_base_delay=0),
+            3
+        )
+        old_member = target.members[1]
+        old_member.close_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        mocker.patch.object(
+            Client,
+            'connect_async',
+            mocker.MagicMock(side_effect=ConnectionError('down'))
+        )
+        target.on_member_replace_failed = mocker.MagicMock()
+
+        # Act
+        target._ClientPool__on_member_failed(old_member)
+        await sleep(0.01)
+
+        # Assert
+        assert old_member not in target.members
+        assert len(target.members) == 2
+        assert target.in_flight == [0, 0]
+        target.on_member_replace_failed.assert_called_once()
+        assert target.on_member_replace_failed.call_args[0][0] is old_member
+
+    @mark.asyncio
+    async def test_replace_member_restored(
+        self,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        target = ClientPool(
+            '127.0.0.1:8124',
+            mocker.MagicMock(),
+            Application(instance='bot', reconnection_base_delay=0),
+            3
+        )
+        old_member = target.members[1]
+        old_member.close_async = mocker.MagicMock(
+            return_value=async_return(None)
+        )
+        mocker.patch.object(
+            Client,
+            'connect_async',
+            mocker.MagicMock(
+                side_effect=[ConnectionError('down'), async_return(None)]
+            )
+        )
+        target.on_member_replace_failed = mocker.MagicMock()
+
+        # Act
+        target._ClientPool__on_member_failed(old_member)
+        await sleep(0.01)
+
+        # Assert
+        assert old_member not in target.members
+        assert [
+            member.application.instance for member in target.members
+        ] == ['bot-0', 'bot-2', 'bot-1']
+        assert target.in_flight == [0, 0, 0]
+        target.on_member_replace_failed.assert_not_called()
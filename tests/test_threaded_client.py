@@ -0,0 +1,105 @@
+from asyncio import sleep
+from concurrent.futures import ThreadPoolExecutor
+
+from lime_python import Command, CommandMethod, Message
+from pytest import fixture
+from pytest_mock import MockerFixture
+
+from src import Application, Client, ThreadedClient
+from src.blip_sdk.receiver import Receiver
+
+
+class TestThreadedClient:
+
+    @fixture
+    def target(self, mocker: MockerFixture) -> ThreadedClient:
+        threaded_client = ThreadedClient(
+            lambda: Client('127.0.0.1:8124', mocker.MagicMock(), Application())
+        )
+        yield threaded_client
+        threaded_client.stop()
+
+    def test_process_command_from_threads(
+        self,
+        target: ThreadedClient
+    ) -> None:
+        # Arrange
+        async def process_command_async(command, timeout):
+            await sleep(0.01)
+            return command.uri
+
+        target.client.process_command_async = process_command_async
+        uris = [f'/ping/{index}' for index in range(10)]
+
+        # Act
+        with ThreadPoolExecutor(10) as executor:
+            results = list(executor.map(
+                lambda uri: target.process_command(
+                    Command(CommandMethod.GET, uri)
+                ),
+                uris
+            ))
+
+        # Assert
+        assert results == uris
+
+    def test_send_message(
+        self,
+        target: ThreadedClient,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        send_mock = mocker.MagicMock()
+        target.client.client_channel.send_message = send_mock
+        message = Message('text/plain', 'foo')
+
+        # Act
+        target.send_message(message)
+
+        # Assert
+        send_mock.assert_called_once_with(message)
+
+    def test_add_message_receiver(
+        self,
+        target: ThreadedClient,
+        mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        callback = mocker.MagicMock()
+        message = Message('text/plain', 'foo')
+        target.client.client_channel.send_command = mocker.MagicMock()
+
+        # Act
+        remove_rec = target.add_message_receiver(Receiver(True, callback))
+        target.loop.call_soon_threadsafe(
+            target.client.client_channel.on_message,
+            message
+        )
+        remove_rec()
+        target.loop.call_soon_threadsafe(
+            target.client.client_channel.on_message,
+            message
+        )
+        target.send_command(Command(CommandMethod.GET, '/ping'))
+
+        # Assert
+        callback.assert_called_once_with(message)
+
+    def test_call_from_loop_thread(self, target: ThreadedClient) -> None:
+        # Arrange
+        errors = []
+        target.client.send_message = lambda message: errors.append(
+            self.__capture(target.send_message, message)
+        )
+
+        # Act
+        target.send_message(Message('text/plain', 'foo'))
+
+        # Assert
+        assert isinstance(errors[0], ValueError)
+
+    def __capture(self, action, *args) -> Exception:
+        try:
+            action(*args)
+        except Exception as error:
+            return error
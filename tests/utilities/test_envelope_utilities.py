@@ -0,0 +1,60 @@
+from lime_python import Command, Envelope, Message, Notification
+from pytest import mark
+from src.blip_sdk.utilities import EnvelopeUtilities
+
+
+class TestEnvelopeUtilities:
+
+    @mark.parametrize(
+        ['node', 'expected_result'],
+        [
+            ('User@0mn.io/instance', 'user@0mn.io'),
+            ('bot@msging.net', 'bot@msging.net'),
+            (None, None)
+        ]
+    )
+    def test_get_identity(self, node: str, expected_result: str) -> None:
+        # Act
+        result = EnvelopeUtilities.get_identity(node)
+
+        # Assert
+        assert result == expected_result
+
+    @mark.parametrize(
+        ['node', 'expected_result'],
+        [
+            ('user@WA.gw.msging.net/instance', 'wa.gw.msging.net'),
+            ('postmaster', None),
+            ('', None)
+        ]
+    )
+    def test_get_domain(self, node: str, expected_result: str) -> None:
+        # Act
+        result = EnvelopeUtilities.get_domain(node)
+
+        # Assert
+        assert result == expected_result
+
+    @mark.parametrize(
+        'envelope',
+        [
+            Message('text/plain', 'foo', id='1', from_n='user@0mn.io'),
+            Notification('received', id='1'),
+            Command('get', '/ping', id='1')
+        ]
+    )
+    def test_serialize(self, envelope: Envelope) -> None:
+        # Act
+        result = EnvelopeUtilities.serialize(envelope)
+
+        # Assert
+        assert ' ' not in result
+        assert EnvelopeUtilities.deserialize(result) == envelope
+
+    def test_deserialize_type(self) -> None:
+        # Act
+        result = EnvelopeUtilities.deserialize('{"status":"success"}', Command)
+
+        # Assert
+        assert isinstance(result, Command)
+        assert result.status == 'success'